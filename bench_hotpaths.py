@@ -0,0 +1,88 @@
+# bench_hotpaths.py — v1.0
+# Micro-benchmark for the memoised normalisers, replayed on jobs_final_hard.csv.
+#
+# Each row is pushed through the calls one scrape + enrich run makes for it:
+# extract_location_from_text + clean_title three times (PATH B), then
+# detect_seniority, normalise_url and classify_company_group. "uncached"
+# calls the undecorated functions (fn.__wrapped__), "cached" the live ones
+# starting from an empty cache, and results are checked to be identical.
+# The default is one pass, which is what a nightly run does; --repeat N > 1
+# replays the same rows, so passes after the first are pure cache hits and
+# overstate the gain.
+#
+# Usage:
+#   python bench_hotpaths.py [--csv PATH] [--repeat 1] [--runs 5]
+
+import argparse
+import csv
+import os
+import time
+
+import jobs_smart_cplus as scraper
+import clean_jobs_cplus as cleaner
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+HOT_PATHS = (
+    scraper.clean_title,
+    scraper.extract_location_from_text,
+    scraper.detect_seniority,
+    scraper.normalise_url,
+    cleaner.classify_company_group,
+)
+
+
+def _replay(rows, clean_title, extract_location, detect_seniority, normalise_url, classify):
+    out = []
+    for r in rows:
+        raw = r["raw_title"]
+        title, loc = extract_location(raw)
+        title = clean_title(title or raw)
+        title, loc2 = extract_location(clean_title(title))
+        title = clean_title(title)
+        out.append((title, loc or loc2, detect_seniority(title),
+                    normalise_url(r["Job Link"]), classify(r["Company"])))
+    return out
+
+
+def bench(rows, repeat, runs):
+    uncached = [fn.__wrapped__ for fn in HOT_PATHS]
+    results = {}
+    for label, fns in (("uncached", uncached), ("cached", HOT_PATHS)):
+        best = float("inf")
+        for _ in range(runs):
+            for fn in HOT_PATHS:
+                fn.cache_clear()
+            start = time.perf_counter()
+            for _ in range(repeat):
+                out = _replay(rows, *fns)
+            best = min(best, time.perf_counter() - start)
+        results[label] = (best, out)
+    assert results["uncached"][1] == results["cached"][1], "memoised output differs"
+    return results
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Benchmark memoised title/location normalisers.")
+    ap.add_argument("--csv", default=os.path.join(REPO_ROOT, "jobs_final_hard.csv"))
+    ap.add_argument("--repeat", type=int, default=1,
+                    help="passes over the CSV per timing (>1 re-hits the cache; not a nightly run)")
+    ap.add_argument("--runs", type=int, default=5, help="best of N timings")
+    args = ap.parse_args()
+
+    with open(args.csv, encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    for r in rows:
+        # Listing-card text as PATH B sees it: title and location run together
+        r["raw_title"] = " - ".join(x for x in (r.get("Job Title"), r.get("Location")) if x)
+
+    results = bench(rows, args.repeat, args.runs)
+    calls = len(rows) * args.repeat * 8
+    base = results["uncached"][0]
+    print(f"  {len(rows)} rows × {args.repeat} passes, {calls} calls")
+    for label, (secs, _) in results.items():
+        print(f"  {label:<9} {secs * 1000:8.1f} ms   {calls / secs / 1e6:6.2f} M calls/s   "
+              f"x{base / secs:.1f}")
+    for fn in HOT_PATHS:
+        info = fn.cache_info()
+        print(f"  {fn.__name__:<28} hits={info.hits:<6} misses={info.misses:<5} size={info.currsize}")
@@ -5,11 +5,26 @@
 #   3. Scoring calibrated — removed double-multiplier bug
 #   4. first_seen / last_seen passed through
 #   5. Cleaner field ordering
+#   6. write_enriched() also saves the inverted facet index (facet_index.py)
+#   7. Relevancy split into relevancy_features() + score_features(); the
+#      features are persisted per run for re-scoring (feature_matrix.py)
+#   8. Scoring profiles (scoring_profiles.json) -> one Relevancy_<name> column
+#      each, evaluated in the same pass as Relevancy_to_Actian
+#   9. enrich_rows() reuses stored results for unchanged postings (enrich_cache.py)
+#  10. classify_company_group() memoised per company name
+#  11. Location resolved via the offline gazetteer (gazetteer.py): City /
+#      Country / Region / Work_Mode columns, geo relevancy by country code
 
 import re
 import json
 import csv
 import os
+from functools import lru_cache
+
+import enrich_cache
+import facet_index
+import feature_matrix
+import gazetteer
 
 # ─────────────────────────────────────────────────────────────────────────────
 # SKILL MAPPING
@@ -190,6 +205,7 @@ def extract_skills(title, description=""):
     return skills[:15]
 
 
+@lru_cache(maxsize=1024)
 def classify_company_group(company):
     low = company.lower()
     for group, words in _COMPANY_GROUPS.items():
@@ -211,44 +227,120 @@ def detect_product_focus(title, description=""):
     return (matches[0] if matches else "Other"), matches
 
 
-def compute_relevancy_to_actian(title, location, description, skills, pfocus, seniority):
-    """
-    Score 0-100 how relevant a job is to Actian's competitive space.
-    Uses title + description when available.
-    """
-    score = 0.0
-
-    # Skill matches
-    matched_skills = [s for s in skills if s in _ACTIAN_RELEVANT_SKILLS]
-    score += _WEIGHTS["skill_match"] * len(matched_skills)
+# Feature order of relevancy_features(); each name is also its _WEIGHTS key
+FEATURE_NAMES = (
+    "skill_match", "product_relevancy", "geo_relevancy",
+    "seniority", "ai_focus", "desc_bonus",
+)
 
-    # Product focus
-    if pfocus in HIGH_RELEVANCY_PRODUCTS:
-        score += _WEIGHTS["product_relevancy"]
+_DESC_SIGNAL_WORDS = (
+    "data integration", "etl", "pipeline", "connector",
+    "data quality", "governance", "observability", "actian",
+)
 
-    # Geography
-    loc_low = location.lower()
-    if any(g in loc_low for g in _ACTIAN_GEOS):
-        score += _WEIGHTS["geo_relevancy"]
 
-    # Seniority
-    score += _WEIGHTS["seniority"] * _SENIORITY_VALUE.get(seniority, 0.1)
+class ScoringProfile:
+    """
+    One product line's view of relevancy: its skills, geos, high-relevancy
+    product focuses, description signal words and weights. All profiles
+    score the same extracted skills / focus / location in one pass.
+    """
 
-    # AI/ML bonus
-    if any(x in skills for x in ("AI", "ML", "MLOPS")):
-        score += _WEIGHTS["ai_focus"]
+    __slots__ = ("name", "column", "skills", "geos", "countries", "regions", "products",
+                 "signal_words", "weights")
+
+    def __init__(self, name, column, skills, geos, products, signal_words, weights):
+        self.name         = name
+        self.column       = column
+        self.skills       = frozenset(skills)
+        self.geos         = tuple(geos)
+        self.countries    = gazetteer.country_codes(self.geos)
+        # Region geos also match region-only locations ("Remote - EMEA")
+        parsed            = [gazetteer.parse_location(g) for g in self.geos]
+        self.regions      = frozenset(p.region for p in parsed if p.region and not p.country_code)
+        self.products     = frozenset(products)
+        self.signal_words = tuple(signal_words)
+        self.weights      = dict(weights)
+
+    def features(self, skills, pfocus, geo, desc_low, seniority_value, ai_focus):
+        """Raw relevancy signals, in FEATURE_NAMES order (see feature_matrix.py)."""
+        bonus_hits = sum(1 for w in self.signal_words if w in desc_low) if desc_low else 0
+        return (
+            float(sum(1 for s in skills if s in self.skills)),
+            1.0 if pfocus in self.products else 0.0,
+            1.0 if geo.country_code in self.countries or geo.region in self.regions else 0.0,
+            seniority_value,
+            ai_focus,
+            float(min(bonus_hits, 3)),
+        )
+
+
+ACTIAN_PROFILE = ScoringProfile(
+    "actian", "Relevancy_to_Actian", _ACTIAN_RELEVANT_SKILLS, _ACTIAN_GEOS,
+    HIGH_RELEVANCY_PRODUCTS, _DESC_SIGNAL_WORDS, _WEIGHTS,
+)
+
+# Extra profiles; each adds a Relevancy_<name> column. Keys left out of a
+# profile inherit the Actian values. Off unless scoring_profiles.json exists
+# (copy scoring_profiles.example.json); enabling one changes the CSV schema.
+PROFILES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scoring_profiles.json")
+_PROFILE_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
+
+
+def load_profiles(path=PROFILES_FILE):
+    profiles = [ACTIAN_PROFILE]
+    if not os.path.exists(path):
+        return profiles
+    with open(path, encoding="utf-8") as f:
+        config = json.load(f)
+    for name, spec in config.items():
+        if not _PROFILE_NAME_RE.match(name) or name.lower() == "actian":
+            raise ValueError(f"{path}: invalid profile name {name!r}")
+        unknown = set(spec.get("weights", {})) - set(FEATURE_NAMES)
+        if unknown:
+            raise ValueError(f"{path}: profile {name!r} has unknown weights {sorted(unknown)}")
+        try:
+            profiles.append(ScoringProfile(
+                name, f"Relevancy_{name}",
+                [s.upper() for s in spec.get("skills", ACTIAN_PROFILE.skills)],
+                [g.lower() for g in spec.get("geos", ACTIAN_PROFILE.geos)],
+                spec.get("products", ACTIAN_PROFILE.products),
+                [w.lower() for w in spec.get("signal_words", ACTIAN_PROFILE.signal_words)],
+                dict(_WEIGHTS, **spec.get("weights", {})),
+            ))
+        except ValueError as e:
+            raise ValueError(f"{path}: profile {name!r}: {e}") from None
+    return profiles
+
+
+SCORING_PROFILES = load_profiles()
+
+
+def _ai_focus(skills):
+    return 1.0 if any(x in skills for x in ("AI", "ML", "MLOPS")) else 0.0
+
+
+def relevancy_features(location, description, skills, pfocus, seniority, profile=ACTIAN_PROFILE):
+    return profile.features(skills, pfocus, gazetteer.parse_location(location),
+                            description.lower() if description else "",
+                            _SENIORITY_VALUE.get(seniority, 0.1), _ai_focus(skills))
+
+
+def score_features(features, weights=None):
+    weights = weights or _WEIGHTS
+    score = 0.0
+    for name, value in zip(FEATURE_NAMES, features):
+        score += weights[name] * value
+    return min(100.0, round(max(0.0, score), 1))
 
-    # Description bonus — extra signal when description available
-    if description:
-        desc_low = description.lower()
-        desc_signal_words = [
-            "data integration", "etl", "pipeline", "connector",
-            "data quality", "governance", "observability", "actian",
-        ]
-        bonus_hits = sum(1 for w in desc_signal_words if w in desc_low)
-        score += _WEIGHTS["desc_bonus"] * min(bonus_hits, 3)
 
-    return min(100.0, round(max(0.0, score), 1))
+def compute_relevancy_to_actian(title, location, description, skills, pfocus, seniority):
+    """
+    Score 0-100 how relevant a job is to Actian's competitive space.
+    Uses title + description when available.
+    """
+    return score_features(
+        relevancy_features(location, description, skills, pfocus, seniority))
 
 
 def compute_trend_score(title, description, seniority):
@@ -307,32 +399,57 @@ def enrich_row(r):
     company_group = classify_company_group(r.get("Company", ""))
     pfocus, pf_tokens = detect_product_focus(title, description)
 
-    relevancy = compute_relevancy_to_actian(
-        title, location, description, skills, pfocus, seniority
-    )
+    # Inputs shared by every scoring profile are prepared once per row
+    geo      = gazetteer.parse_location(location)
+    desc_low = description.lower() if description else ""
+    sen_val  = _SENIORITY_VALUE.get(seniority, 0.1)
+    ai_focus = _ai_focus(skills)
+    scores = {}
+    for profile in SCORING_PROFILES:
+        f = profile.features(skills, pfocus, geo, desc_low, sen_val, ai_focus)
+        scores[profile.column] = score_features(f, profile.weights)
+        if profile is ACTIAN_PROFILE:
+            features = f
     trend = compute_trend_score(title, description, seniority)
 
+    r["City"]                 = geo.city
+    r["Country"]              = geo.country
+    r["Region"]               = geo.region
+    r["Work_Mode"]            = geo.work_mode
     r["Extracted_Skills"]     = skills
     r["Primary_Skill"]        = skills[0] if skills else ""
     r["Company_Group"]        = company_group
     r["Product_Focus"]        = pfocus
     r["Product_Focus_Tokens"] = pf_tokens
-    r["Relevancy_to_Actian"]  = relevancy
+    r.update(scores)          # Relevancy_to_Actian + Relevancy_<profile>
     r["Trend_Score"]          = trend
     r["Skills_in_Title"]      = ",".join(extract_skills(title))
     r["Function"]             = infer_function(title)
+    r["_features"]            = features
 
     return r
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# MAIN
+# STAGES  (shared with pipeline.py)
 # ─────────────────────────────────────────────────────────────────────────────
-def main():
-    repo    = os.path.dirname(os.path.abspath(__file__))
-    infile  = os.path.join(repo, "jobs_final_hard.csv")
-    outfile = os.path.join(repo, "jobs_cleaned_final_enriched.csv")
-
+ENRICHED_FIELDNAMES = [
+    "Company", "Job Title", "Job Link", "Location",
+    "City", "Country", "Region", "Work_Mode",
+    "Posting Date", "Days Since Posted",
+    "Function", "Seniority", "Skills_in_Title",
+    "Company_Group", "Product_Focus", "Product_Focus_Tokens",
+    "Primary_Skill", "Extracted_Skills",
+    "Relevancy_to_Actian",
+    *[p.column for p in SCORING_PROFILES if p is not ACTIAN_PROFILE],
+    "Trend_Score",
+    "First_Seen", "Last_Seen",
+    # Description intentionally excluded from enriched CSV
+    # (kept in jobs_final_hard.csv for scoring purposes only)
+]
+
+
+def read_hard_rows(infile):
     rows = []
     with open(infile, encoding="utf-8") as f:
         for r in csv.DictReader(f):
@@ -348,33 +465,39 @@ def main():
                 "First_Seen":     r.get("First_Seen", ""),
                 "Last_Seen":      r.get("Last_Seen", ""),
             })
+    return rows
 
-    enriched = [enrich_row(r) for r in rows]
-
-    # Serialise lists
-    for r in enriched:
-        r["Extracted_Skills"]     = json.dumps(r["Extracted_Skills"])
-        r["Product_Focus_Tokens"] = json.dumps(r["Product_Focus_Tokens"])
-
-    fieldnames = [
-        "Company", "Job Title", "Job Link", "Location",
-        "Posting Date", "Days Since Posted",
-        "Function", "Seniority", "Skills_in_Title",
-        "Company_Group", "Product_Focus", "Product_Focus_Tokens",
-        "Primary_Skill", "Extracted_Skills",
-        "Relevancy_to_Actian", "Trend_Score",
-        "First_Seen", "Last_Seen",
-        # Description intentionally excluded from enriched CSV
-        # (kept in jobs_final_hard.csv for scoring purposes only)
-    ]
 
+def enrich_rows(rows, use_cache=True):
+    """enrich_row() over rows; unchanged postings are served from enrich_cache."""
+    if not use_cache:
+        return [enrich_row(r) for r in rows]
+    return enrich_cache.enrich_rows_cached(rows, enrich_row)
+
+
+def write_enriched(rows, outfile):
+    # Lists are serialised on the way out so in-memory rows keep them as lists
     with open(outfile, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        w = csv.DictWriter(f, fieldnames=ENRICHED_FIELDNAMES, extrasaction="ignore")
         w.writeheader()
-        for r in enriched:
-            w.writerow({c: r.get(c, "") for c in fieldnames})
+        for r in rows:
+            w.writerow({c: (json.dumps(r[c]) if isinstance(r.get(c), list) else r.get(c, ""))
+                        for c in ENRICHED_FIELDNAMES})
+
+    print(f"[CLEANER] Wrote {len(rows)} enriched rows -> {outfile}")
+    facet_index.write_index(rows, outfile)
+    feature_matrix.write_matrix(rows, outfile)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────────────────────────────────────
+def main():
+    repo    = os.path.dirname(os.path.abspath(__file__))
+    infile  = os.path.join(repo, "jobs_final_hard.csv")
+    outfile = os.path.join(repo, "jobs_cleaned_final_enriched.csv")
 
-    print(f"[CLEANER] Wrote {len(enriched)} enriched rows -> {outfile}")
+    write_enriched(enrich_rows(read_hard_rows(infile)), outfile)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,283 @@
+# dashboard_data.py — v1.0
+# Incremental trend rollups feeding Dashboard/index.html.
+#
+# Each snapshot is merged once into scrape_state/dashboard_rollups.json:
+#   days   : per First_Seen date, new postings by dashboard group and by skill
+#            (a day is written by the first snapshot that sees it and then
+#            frozen, so closed postings still count in the week they appeared)
+#   latest : current-state aggregates from the newest snapshot only
+#            (group cards, top companies, seniority heatmap, skills)
+#   applied_through : newest snapshot date merged; history partitions on or
+#            before it are never read again
+# Emitting the dashboard sums at most TREND_WEEKS × 7 day entries, so a rebuild
+# never rescans history. Output: Dashboard/dashboard_data.json plus a
+# dashboard_data.js wrapper that index.html loads (works from file:// too).
+#
+# Usage:
+#   python dashboard_data.py            # merge new history partitions (or the
+#                                       # enriched CSV) and re-emit
+#   python dashboard_data.py --emit     # re-emit from stored rollups only
+
+import argparse
+import csv
+import json
+import os
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+
+from scrape_health import STATE_DIR, load_json, save_json
+
+REPO_ROOT     = os.path.dirname(os.path.abspath(__file__))
+ROLLUPS_FILE  = os.path.join(STATE_DIR, "dashboard_rollups.json")
+DASHBOARD_DIR = os.path.join(REPO_ROOT, "Dashboard")
+DATA_JSON     = os.path.join(DASHBOARD_DIR, "dashboard_data.json")
+DATA_JS       = os.path.join(DASHBOARD_DIR, "dashboard_data.js")
+
+TREND_WEEKS     = 16
+SKILL_WINDOW    = 4      # weeks compared for rising / stable
+RISING_RATIO    = 1.2
+TOP_COMPANIES   = 12
+HEATMAP_COS     = 8
+TOP_SKILLS      = 8
+
+# Company_Group (clean_jobs_cplus) -> dashboard (name, short, tag, color)
+GROUP_META = {
+    "Warehouse/Processing":   ("Warehouse/Processing", "Warehouse",  "wh", "#146b5c"),
+    "ETL/Connectors":         ("ETL / Connectors",     "ETL",        "et", "#1452a0"),
+    "Data Intelligence":      ("Data Intelligence",    "Data Intel", "di", "#5228a0"),
+    "Data Observability":     ("Data Observability",   "Observ.",    "ob", "#186b30"),
+    "Monitoring/Platforms":   ("Monitoring/Platforms", "Monitoring", "mo", "#a85f0a"),
+    "Other":                  ("Other / Adjacent",     "Other",      "ot", "#636058"),
+}
+# The dashboard has six group cards; vector DBs sit with "Other / Adjacent"
+GROUP_ALIASES = {"Vector DB / AI Storage": "Other"}
+
+HM_SENIORITY = {"Senior": "Senior", "Manager": "Manager", "Director+": "Director+",
+                "Principal/Staff": "P/Staff", "Mid": "Mid"}
+ENG_FUNCTIONS = {"Engineering", "AI/ML & Vector"}
+
+
+def _group(row):
+    g = row.get("Company_Group") or "Other"
+    g = GROUP_ALIASES.get(g, g)
+    return g if g in GROUP_META else "Other"
+
+
+def _skills(row):
+    v = row.get("Extracted_Skills")
+    if isinstance(v, list):
+        return v
+    try:
+        return list(json.loads(v or "[]"))
+    except Exception:
+        return []
+
+
+def _rel(row):
+    try:
+        return float(row.get("Relevancy_to_Actian") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _week_start(iso):
+    d = date.fromisoformat(iso)
+    return d - timedelta(days=d.weekday())
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# ROLLUPS
+# ─────────────────────────────────────────────────────────────────────────────
+def load_rollups(path=ROLLUPS_FILE):
+    rollups = load_json(path, {"applied_through": "", "days": {}, "latest": {}})
+    # Rollups written before the high-water mark kept a list of merged dates
+    legacy = rollups.pop("applied", None)
+    if "applied_through" not in rollups:
+        rollups["applied_through"] = max(legacy or [""])
+    return rollups
+
+
+def save_rollups(rollups, path=ROLLUPS_FILE):
+    newest = date.fromisoformat(rollups["latest"].get("date") or date.today().isoformat())
+    cutoff = (newest - timedelta(weeks=TREND_WEEKS + SKILL_WINDOW * 2)).isoformat()
+    rollups["days"] = {d: v for d, v in rollups["days"].items() if d >= cutoff}
+    save_json(path, rollups)
+
+
+def _current_state(rows, snapshot_date):
+    by_group  = defaultdict(lambda: {"cos": set(), "jobs": 0, "dir": 0, "eng": 0})
+    companies = Counter()
+    company_group = {}
+    seniority = defaultdict(Counter)
+    skill_count, skill_rel = Counter(), Counter()
+
+    for r in rows:
+        g, co = _group(r), r.get("Company", "")
+        s = by_group[g]
+        s["cos"].add(co)
+        s["jobs"] += 1
+        s["dir"]  += r.get("Seniority") == "Director+"
+        s["eng"]  += r.get("Function") in ENG_FUNCTIONS
+        companies[co] += 1
+        company_group[co] = g
+        sen = HM_SENIORITY.get(r.get("Seniority"))
+        if sen:
+            seniority[co][sen] += 1
+        rel = _rel(r)
+        for sk in set(_skills(r)):
+            skill_count[sk] += 1
+            skill_rel[sk]   += rel
+
+    return {
+        "date":      snapshot_date,
+        "jobs":      len(rows),
+        "companies": len(companies),
+        "groups": {g: {"cos": len(v["cos"]), "jobs": v["jobs"], "dir": v["dir"], "eng": v["eng"]}
+                   for g, v in by_group.items()},
+        "companies_jobs":  dict(companies),
+        "company_group":   company_group,
+        "seniority":       {co: dict(c) for co, c in seniority.items()},
+        "skills":          {sk: [n, round(skill_rel[sk], 2)] for sk, n in skill_count.items()},
+    }
+
+
+def merge_snapshot(rollups, rows, snapshot_date):
+    """
+    Fold one snapshot into the rollups. Re-merging the same date is harmless:
+    its own day is recomputed and earlier days are left frozen.
+    """
+    new_by_day = defaultdict(lambda: {"groups": Counter(), "skills": Counter()})
+    for r in rows:
+        first = (r.get("First_Seen") or snapshot_date)[:10]
+        if first > snapshot_date:
+            continue
+        day = new_by_day[first]
+        day["groups"][GROUP_META[_group(r)][1]] += 1
+        for sk in set(_skills(r)):
+            day["skills"][sk] += 1
+
+    for d, v in new_by_day.items():
+        if d == snapshot_date or d not in rollups["days"]:
+            rollups["days"][d] = {"groups": dict(v["groups"]), "skills": dict(v["skills"])}
+
+    if snapshot_date >= rollups["latest"].get("date", ""):
+        rollups["latest"] = _current_state(rows, snapshot_date)
+    rollups["applied_through"] = max(rollups["applied_through"], snapshot_date)
+    return rollups
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# EMIT
+# ─────────────────────────────────────────────────────────────────────────────
+def _weekly(rollups, key, end_week, weeks):
+    starts = [end_week - timedelta(weeks=weeks - 1 - i) for i in range(weeks)]
+    index = {s: i for i, s in enumerate(starts)}
+    series = defaultdict(lambda: [0] * weeks)
+    for d, v in rollups["days"].items():
+        i = index.get(_week_start(d))
+        if i is None:
+            continue
+        for name, n in v.get(key, {}).items():
+            series[name][i] += n
+    return starts, series
+
+
+def build_dashboard(rollups):
+    latest = rollups.get("latest") or {}
+    if not latest:
+        return {}
+    end_week = _week_start(latest["date"])
+
+    starts, group_series = _weekly(rollups, "groups", end_week, TREND_WEEKS)
+    groups = []
+    for g, (name, short, tag, color) in GROUP_META.items():
+        s = latest["groups"].get(g, {"cos": 0, "jobs": 0, "dir": 0, "eng": 0})
+        groups.append({"name": name, "short": short, "cos": s["cos"], "jobs": s["jobs"],
+                       "dir": s["dir"], "eng": s["eng"], "color": color})
+
+    jobs = latest["companies_jobs"]
+    ranked = sorted(jobs, key=lambda co: (-jobs[co], co))
+    top12 = [{"name": co, "jobs": jobs[co], "group": GROUP_META[latest["company_group"][co]][2],
+              "real": True} for co in ranked[:TOP_COMPANIES]]
+    hm_cos = [{"name": co, "real": True, "d": latest["seniority"].get(co, {})}
+              for co in ranked[:HEATMAP_COS]]
+
+    _, skill_series = _weekly(rollups, "skills", end_week, SKILL_WINDOW * 2)
+    skills = []
+    top = sorted(latest["skills"].items(), key=lambda kv: (-kv[1][0], kv[0]))[:TOP_SKILLS]
+    for sk, (count, rel_sum) in top:
+        series = skill_series.get(sk, [0] * SKILL_WINDOW * 2)
+        prior, recent = sum(series[:SKILL_WINDOW]), sum(series[SKILL_WINDOW:])
+        rising = recent >= 3 and recent > prior * RISING_RATIO
+        skills.append({"name": sk, "count": count, "avg": round(rel_sum / count, 1),
+                       "trend": "rising" if rising else "stable"})
+    skills.sort(key=lambda s: -s["avg"])
+
+    return {
+        "generated":  latest["date"],
+        "jobs":       latest["jobs"],
+        "companies":  latest["companies"],
+        "groups":     groups,
+        "trendWeeks": [f"{s:%b} {s.day}" for s in starts],
+        "groupTrend": {short: group_series[short] for _, short, _, _ in GROUP_META.values()},
+        "top12":      top12,
+        "hmCos":      hm_cos,
+        "skills":     skills,
+    }
+
+
+def emit(rollups, json_path=DATA_JSON, js_path=DATA_JS):
+    data = build_dashboard(rollups)
+    if not data:
+        print("[DASHBOARD] no rollups yet — nothing to emit")
+        return None
+    payload = json.dumps(data, separators=(",", ":"))
+    for path, text in ((json_path, payload), (js_path, f"window.DASHBOARD_DATA={payload};\n")):
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    print(f"[DASHBOARD] {data['jobs']} jobs, {len(data['trendWeeks'])} weeks -> {json_path}")
+    return data
+
+
+def update(rows, snapshot_date, path=ROLLUPS_FILE):
+    """run.py hook: merge today's in-memory rows and re-emit."""
+    rollups = merge_snapshot(load_rollups(path), rows, snapshot_date)
+    save_rollups(rollups, path)
+    return emit(rollups)
+
+
+def _pending_history(rollups):
+    """(date, rows) for history partitions newer than applied_through; needs pyarrow."""
+    import snapshots
+    if not snapshots.available():
+        return
+    columns = ["Company", "Company_Group", "Function", "Seniority",
+               "Extracted_Skills", "Relevancy_to_Actian", "First_Seen"]
+    for day in snapshots.snapshot_dates():
+        if day <= rollups["applied_through"]:
+            continue
+        table = snapshots.read_history(columns, since=day, until=day)
+        yield day, table.to_pylist()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Build Dashboard data from run history.")
+    ap.add_argument("--emit", action="store_true", help="re-emit from stored rollups only")
+    args = ap.parse_args()
+
+    rollups = load_rollups()
+    if not args.emit:
+        merged = 0
+        for day, rows in _pending_history(rollups) or []:
+            merge_snapshot(rollups, rows, day)
+            merged += 1
+        if not merged:
+            enriched = os.path.join(REPO_ROOT, "jobs_cleaned_final_enriched.csv")
+            with open(enriched, encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            day = max((r.get("Last_Seen") or "" for r in rows), default="") or date.today().isoformat()
+            merge_snapshot(rollups, rows, day)
+        save_rollups(rollups)
+    emit(rollups)
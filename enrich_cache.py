@@ -0,0 +1,223 @@
+# enrich_cache.py — v1.0
+# Persistent memoisation of enrich_row() (SQLite).
+#
+# Key   = sha1(ruleset version, Company, Job Title, Description, Location, Seniority)
+# Value = the fields enrich_row() derives from them (JSON)
+#
+# The ruleset version hashes every table enrichment reads (_SKILL_CANON,
+# _COMPANY_GROUPS, _PRODUCT_KEYWORDS, _WEIGHTS, the scoring profiles, the
+# gazetteer, ...), the source of the enrichment functions (so regexes inside
+# infer_function / compute_trend_score count too) and RULESET_REV, so
+# editing a rule silently starts a fresh keyspace. Entries not used for
+# PRUNE_DAYS are dropped once per run, which also clears old rulesets.
+#
+# Usage:
+#   python enrich_cache.py stats
+#   python enrich_cache.py clear
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+from datetime import date, timedelta
+
+import clean_jobs_cplus as cleaner
+import gazetteer
+from scrape_health import STATE_DIR
+
+CACHE_FILE = os.path.join(STATE_DIR, "enrich_cache.sqlite3")
+PRUNE_DAYS = 30
+
+# Bump when enrichment changes in a way neither the rule tables nor
+# _rule_code() show (e.g. a helper outside that list)
+RULESET_REV = 1
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS enrich (
+    key        TEXT PRIMARY KEY,
+    payload    TEXT NOT NULL,
+    last_used  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS enrich_last_used ON enrich (last_used);
+"""
+
+# Row fields that enrich_row() reads; everything else it writes is cached
+_INPUT_FIELDS = ("Company", "Job Title", "Description", "Location", "Seniority")
+_BATCH = 500
+
+
+def _rule_code():
+    """Functions whose source is part of the ruleset (resolved lazily: import cycle)."""
+    return (
+        cleaner._normalize_skill_token, cleaner.extract_skills, cleaner.classify_company_group,
+        cleaner.detect_product_focus, cleaner.ScoringProfile.features, cleaner._ai_focus,
+        cleaner.score_features, cleaner.compute_trend_score, cleaner.infer_function,
+        cleaner.enrich_row, gazetteer.parse_location, gazetteer._scan, gazetteer._code_entry,
+    )
+
+
+_ruleset = None
+_pruned = False
+_prune_lock = threading.Lock()
+
+
+def _jsonable(value):
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+def _source(fn):
+    fn = inspect.unwrap(fn)
+    try:
+        return inspect.getsource(fn)
+    except (OSError, TypeError):
+        return fn.__code__.co_code.hex()
+
+
+def ruleset_version():
+    global _ruleset
+    if _ruleset is None:
+        tables = {
+            "rev":             RULESET_REV,
+            "skill_canon":     cleaner._SKILL_CANON,
+            "company_groups":  cleaner._COMPANY_GROUPS,
+            "product_keywords": cleaner._PRODUCT_KEYWORDS,
+            "weights":         cleaner._WEIGHTS,
+            "seniority_value": cleaner._SENIORITY_VALUE,
+            "skill_token_re":  cleaner._SKILL_TOKEN_RE.pattern,
+            "code":            [_source(fn) for fn in _rule_code()],
+            "gazetteer":       gazetteer.GAZETTEER_VERSION,
+            # geos / signal words are order-free; _ACTIAN_GEOS is a set, so its
+            # tuple order changes with string hash randomisation between runs
+            "profiles": [[p.name, p.column, p.skills, sorted(p.geos), p.products,
+                          sorted(p.signal_words), p.weights] for p in cleaner.SCORING_PROFILES],
+        }
+        blob = json.dumps(_jsonable(tables), sort_keys=True)
+        _ruleset = hashlib.sha1(blob.encode()).hexdigest()[:16]
+    return _ruleset
+
+
+def row_key(r):
+    parts = [ruleset_version()] + [str(r.get(f) or "") for f in _INPUT_FIELDS]
+    return hashlib.sha1("\x1f".join(parts).encode()).hexdigest()
+
+
+def output_fields():
+    profile_columns = tuple(p.column for p in cleaner.SCORING_PROFILES)
+    return ("City", "Country", "Region", "Work_Mode", "Extracted_Skills", "Primary_Skill",
+            "Company_Group", "Product_Focus", "Product_Focus_Tokens", "Trend_Score",
+            "Skills_in_Title", "Function", "_features") + profile_columns
+
+
+class EnrichCache:
+
+    def __init__(self, path=CACHE_FILE):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def get_many(self, keys):
+        found = {}
+        keys = list(dict.fromkeys(keys))
+        for i in range(0, len(keys), _BATCH):
+            chunk = keys[i:i + _BATCH]
+            marks = ", ".join("?" * len(chunk))
+            for key, payload in self.conn.execute(
+                    f"SELECT key, payload FROM enrich WHERE key IN ({marks})", chunk):
+                found[key] = json.loads(payload)
+        if found:
+            today = date.today().isoformat()
+            hit = list(found)
+            with self.conn:
+                for i in range(0, len(hit), _BATCH):
+                    chunk = hit[i:i + _BATCH]
+                    marks = ", ".join("?" * len(chunk))
+                    self.conn.execute(
+                        f"UPDATE enrich SET last_used = ? WHERE key IN ({marks})",
+                        [today] + chunk)
+        return found
+
+    def put_many(self, items):
+        today = date.today().isoformat()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO enrich (key, payload, last_used) VALUES (?, ?, ?)",
+                [(key, json.dumps(payload), today) for key, payload in items])
+
+    def prune(self, days=PRUNE_DAYS):
+        cutoff = (date.today() - timedelta(days=days)).isoformat()
+        with self.conn:
+            return self.conn.execute("DELETE FROM enrich WHERE last_used < ?", (cutoff,)).rowcount
+
+    def enrich(self, rows, enrich_row):
+        """enrich_row() for the cache misses only; hits are copied onto the rows."""
+        keys = [row_key(r) for r in rows]
+        cached = self.get_many(keys)
+        fields = output_fields()
+        fresh = {}
+        for r, key in zip(rows, keys):
+            payload = cached.get(key) or fresh.get(key)
+            if payload is not None:
+                r.update(payload)
+                continue
+            enrich_row(r)
+            fresh[key] = {f: r.get(f) for f in fields}
+        if fresh:
+            self.put_many(fresh.items())
+        print(f"[ENRICH CACHE] {len(rows)} rows: {len(rows) - len(fresh)} reused, "
+              f"{len(fresh)} enriched")
+        return rows
+
+    def stats(self):
+        total = self.conn.execute("SELECT COUNT(*) FROM enrich").fetchone()[0]
+        oldest = self.conn.execute("SELECT MIN(last_used) FROM enrich").fetchone()[0]
+        return {"entries": total, "oldest_use": oldest or "", "ruleset": ruleset_version()}
+
+
+def enrich_rows_cached(rows, enrich_row, path=CACHE_FILE):
+    global _pruned
+    with EnrichCache(path) as cache:
+        # Pipelined mode calls this once per company from several threads
+        with _prune_lock:
+            if not _pruned:
+                cache.prune()
+                _pruned = True
+        return cache.enrich(rows, enrich_row)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Inspect or clear the enrichment cache.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("stats", help="entry count and current ruleset version")
+    sub.add_parser("clear", help="delete every cached entry")
+    args = ap.parse_args()
+
+    with EnrichCache() as cache:
+        if args.cmd == "stats":
+            for k, v in cache.stats().items():
+                print(f"  {k:<11} {v}")
+        elif args.cmd == "clear":
+            with cache.conn:
+                n = cache.conn.execute("DELETE FROM enrich").rowcount
+            print(f"[ENRICH CACHE] cleared {n} entries")
@@ -0,0 +1,234 @@
+# facet_index.py — v1.0
+# Inverted facet indexes over the enriched rows.
+#
+# For each facet (skill, product focus, function, seniority, company group,
+# company) every value maps to the sorted ids of the postings carrying it;
+# a posting id is the row's position in the enriched CSV. Questions such as
+# KAFKA ∧ Senior ∧ ETL/Connectors become sorted-array intersections, and
+# facet counts for a result set never decode a JSON column.
+#
+# write_enriched() saves the index next to each enriched CSV it writes, as
+#   scrape_state/<csv stem>.facets.json   (ids delta-encoded)
+#
+# Usage:
+#   python facet_index.py counts [--csv PATH] [skill=KAFKA seniority=Senior ...]
+
+import argparse
+import json
+import os
+from array import array
+from bisect import bisect_left
+from heapq import merge
+
+from scrape_health import STATE_DIR
+
+REPO_ROOT     = os.path.dirname(os.path.abspath(__file__))
+ENRICHED_FILE = os.path.join(REPO_ROOT, "jobs_cleaned_final_enriched.csv")
+
+# facet -> (column, multi-valued)
+FACETS = {
+    "skill":         ("Extracted_Skills", True),
+    "product_focus": ("Product_Focus_Tokens", True),
+    "function":      ("Function", False),
+    "seniority":     ("Seniority", False),
+    "group":         ("Company_Group", False),
+    "company":       ("Company", False),
+}
+INDEX_VERSION = 1
+
+
+def index_path(csv_path):
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(STATE_DIR, f"{stem}.facets.json")
+
+
+def _values(row, column, multi):
+    v = row.get(column)
+    if not multi:
+        return (v,) if v else ()
+    if isinstance(v, str):
+        try:
+            v = json.loads(v or "[]")
+        except Exception:
+            return ()
+    return v or ()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SORTED-ARRAY SET OPERATIONS
+# ─────────────────────────────────────────────────────────────────────────────
+def intersect(a, b):
+    """Intersection of two ascending id arrays."""
+    if len(a) > len(b):
+        a, b = b, a
+    out = array("I")
+    if not a:
+        return out
+    if len(a) * 16 < len(b):
+        # Much smaller side: binary-search each id instead of walking b
+        lo = 0
+        for x in a:
+            lo = bisect_left(b, x, lo)
+            if lo == len(b):
+                break
+            if b[lo] == x:
+                out.append(x)
+        return out
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            out.append(a[i])
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            i += 1
+        else:
+            j += 1
+    return out
+
+
+def union(arrays):
+    out = array("I")
+    last = -1
+    for x in merge(*arrays):
+        if x != last:
+            out.append(x)
+            last = x
+    return out
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# INDEX
+# ─────────────────────────────────────────────────────────────────────────────
+class FacetIndex:
+
+    def __init__(self, n_rows, postings):
+        self.n_rows = n_rows
+        self.postings = postings          # facet -> {value: array('I')}
+        self._lookup = {f: {v.lower(): v for v in vals} for f, vals in postings.items()}
+
+    @classmethod
+    def build(cls, rows):
+        postings = {f: {} for f in FACETS}
+        n = 0
+        for i, r in enumerate(rows):
+            n += 1
+            for facet, (column, multi) in FACETS.items():
+                for v in dict.fromkeys(_values(r, column, multi)):
+                    postings[facet].setdefault(v, array("I")).append(i)
+        return cls(n, postings)
+
+    # ── persistence ──────────────────────────────────────────────────────────
+    def save(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        facets = {}
+        for facet, vals in self.postings.items():
+            facets[facet] = {}
+            for v, ids in vals.items():
+                prev, deltas = 0, []
+                for x in ids:
+                    deltas.append(x - prev)
+                    prev = x
+                facets[facet][v] = deltas
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "rows": self.n_rows, "facets": facets},
+                      f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("version") != INDEX_VERSION:
+            raise ValueError(f"{path}: index version {payload.get('version')} != {INDEX_VERSION}")
+        postings = {}
+        for facet, vals in payload["facets"].items():
+            postings[facet] = {}
+            for v, deltas in vals.items():
+                ids, acc = array("I"), 0
+                for d in deltas:
+                    acc += d
+                    ids.append(acc)
+                postings[facet][v] = ids
+        return cls(payload["rows"], postings)
+
+    # ── queries ──────────────────────────────────────────────────────────────
+    def ids(self, facet, values):
+        """Ids carrying any of `values` (case-insensitive) for one facet."""
+        if facet not in self.postings:
+            raise KeyError(f"unknown facet {facet!r}; expected one of {', '.join(FACETS)}")
+        lookup = self._lookup[facet]
+        arrays = [self.postings[facet][lookup[v.lower()]] for v in values if v.lower() in lookup]
+        if len(arrays) == 1:
+            return arrays[0]
+        return union(arrays)
+
+    def match(self, filters):
+        """
+        filters: {facet: [values]} — values OR-ed within a facet, facets AND-ed.
+        Returns an ascending id array, or None when there are no filters.
+        """
+        selected = sorted((self.ids(f, vals) for f, vals in filters.items() if vals), key=len)
+        if not selected:
+            return None
+        result = selected[0]
+        for ids in selected[1:]:
+            if not result:
+                break
+            result = intersect(result, ids)
+        return result
+
+    def counts(self, facet, ids=None):
+        """{value: count} for one facet, optionally restricted to `ids`."""
+        vals = self.postings[facet]
+        if ids is None:
+            counts = {v: len(p) for v, p in vals.items()}
+        else:
+            counts = {v: len(intersect(ids, p)) for v, p in vals.items()}
+        return dict(sorted(((v, n) for v, n in counts.items() if n),
+                           key=lambda kv: (-kv[1], kv[0])))
+
+
+def write_index(rows, csv_path):
+    """Build and save the index for rows as written to csv_path."""
+    index = FacetIndex.build(rows)
+    path = index_path(csv_path)
+    index.save(path)
+    print(f"[FACETS] {index.n_rows} rows, "
+          f"{sum(len(v) for v in index.postings.values())} values -> {path}")
+    return index
+
+
+def load_index(csv_path=ENRICHED_FILE):
+    """Saved index for csv_path, rebuilt from the CSV if missing or stale."""
+    path = index_path(csv_path)
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(csv_path):
+        try:
+            return FacetIndex.load(path)
+        except Exception as e:
+            print(f"[WARN] could not read {path} -> {e}")
+    import csv
+    with open(csv_path, encoding="utf-8") as f:
+        return write_index(list(csv.DictReader(f)), csv_path)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Facet counts from the inverted indexes.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_counts = sub.add_parser("counts", help="facet counts for postings matching the filters")
+    p_counts.add_argument("--csv", default=ENRICHED_FILE)
+    p_counts.add_argument("--top", type=int, default=10)
+    p_counts.add_argument("filters", nargs="*", metavar="FACET=VALUE[,VALUE]")
+    args = ap.parse_args()
+
+    filters = {}
+    for item in args.filters:
+        facet, _, values = item.partition("=")
+        filters[facet] = [v for v in values.split(",") if v]
+    index = load_index(args.csv)
+    ids = index.match(filters)
+    print(f"  {index.n_rows if ids is None else len(ids)} matching postings")
+    for facet in FACETS:
+        top = list(index.counts(facet, ids).items())[:args.top]
+        print(f"  {facet:<14} " + ", ".join(f"{v} ({n})" for v, n in top))
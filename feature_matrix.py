@@ -0,0 +1,156 @@
+# feature_matrix.py — v1.0
+# Persisted relevancy features + instant re-scoring.
+#
+# enrich_row() keeps the raw relevancy signals of each posting
+# (clean_jobs_cplus.FEATURE_NAMES); write_enriched() stores them per run as
+#   scrape_state/features/<csv stem>/<YYYY-MM-DD>.npz
+#     X     float32 (rows × features)
+#     links Job Link per row
+# A weight vector then re-scores every stored run as one matrix-vector
+# product, so tuning _WEIGHTS no longer means re-running enrichment.
+# Only the last RETAIN_DAYS of runs are kept (the comparison window); the
+# files live in the CI cache, not in git.
+#
+# numpy is optional: without it the run completes, minus the feature files.
+#
+# Usage:
+#   python feature_matrix.py rescore skill_match=5 geo_relevancy=0 [--top 15]
+#   python feature_matrix.py info
+#   python feature_matrix.py prune [--days 30]
+
+import argparse
+import glob
+import os
+from datetime import date, timedelta
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import clean_jobs_cplus as cleaner
+from scrape_health import STATE_DIR
+
+FEATURES_DIR  = os.path.join(STATE_DIR, "features")
+ENRICHED_STEM = "jobs_cleaned_final_enriched"
+RETAIN_DAYS   = 30
+
+
+def available():
+    return np is not None
+
+
+def matrix_dir(csv_path, features_dir=FEATURES_DIR):
+    return os.path.join(features_dir, os.path.splitext(os.path.basename(csv_path))[0])
+
+
+def weight_vector(weights=None):
+    """_WEIGHTS overlaid with `weights`, in FEATURE_NAMES order."""
+    names = cleaner.FEATURE_NAMES
+    merged = dict(cleaner._WEIGHTS, **(weights or {}))
+    unknown = set(merged) - set(names)
+    if unknown:
+        raise KeyError(f"unknown feature(s) {', '.join(sorted(unknown))}; "
+                       f"expected {', '.join(names)}")
+    return np.array([merged[n] for n in names], dtype=np.float64)
+
+
+def write_matrix(rows, csv_path, run_date=None, features_dir=FEATURES_DIR):
+    """Save this run's feature rows; a re-run on the same day replaces the file."""
+    if not available():
+        print("[FEATURES] numpy not installed — skipping feature matrix")
+        return None
+    rows = [r for r in rows if r.get("_features") is not None]
+    X = np.array([r["_features"] for r in rows],
+                 dtype=np.float32).reshape(-1, len(cleaner.FEATURE_NAMES))
+    links = np.array([r.get("Job Link", "") for r in rows], dtype=np.str_)
+    out_dir = matrix_dir(csv_path, features_dir)
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, f"{run_date or date.today().isoformat()}.npz")
+    tmp = path + ".tmp.npz"
+    np.savez(tmp, X=X, links=links)
+    os.replace(tmp, path)
+    print(f"[FEATURES] {X.shape[0]}×{X.shape[1]} -> {path}")
+    prune(os.path.basename(out_dir), features_dir=features_dir)
+    return path
+
+
+def prune(stem=ENRICHED_STEM, days=RETAIN_DAYS, today=None, features_dir=FEATURES_DIR):
+    """Delete matrices older than `days`; returns how many went."""
+    cutoff = ((today or date.today()) - timedelta(days=days)).isoformat()
+    removed = 0
+    for path in glob.glob(os.path.join(features_dir, stem, "*.npz")):
+        if os.path.basename(path)[:-4] < cutoff:
+            os.remove(path)
+            removed += 1
+    if removed:
+        print(f"[FEATURES] pruned {removed} matrices older than {cutoff}")
+    return removed
+
+
+def load_matrices(stem=ENRICHED_STEM, since=None, features_dir=FEATURES_DIR):
+    """Yields (run_date, X, links) for each stored run, oldest first."""
+    for path in sorted(glob.glob(os.path.join(features_dir, stem, "*.npz"))):
+        run_date = os.path.basename(path)[:-4]
+        if since and run_date < since:
+            continue
+        with np.load(path) as data:
+            yield run_date, data["X"], data["links"]
+
+
+def rescore(X, weights=None):
+    """Relevancy for every row of X under `weights`, clipped and rounded like score_features()."""
+    scores = X.astype(np.float64) @ weight_vector(weights)
+    return np.round(np.clip(scores, 0.0, 100.0), 1)
+
+
+def compare(weights, stem=ENRICHED_STEM, since=None, top=15):
+    """Score the latest run under current and proposed weights; print the movers."""
+    runs = list(load_matrices(stem, since))
+    if not runs:
+        print(f"[FEATURES] no stored matrices under {os.path.join(FEATURES_DIR, stem)}")
+        return None
+    X = np.concatenate([x for _, x, _ in runs])
+    base, new = rescore(X), rescore(X, weights)
+    print(f"[FEATURES] {len(runs)} run(s), {X.shape[0]} rows")
+    print(f"  mean {base.mean():.2f} -> {new.mean():.2f}   "
+          f"changed {int((base != new).sum())} rows")
+
+    run_date, X_last, links = runs[-1]
+    base_last, new_last = rescore(X_last), rescore(X_last, weights)
+    order = np.argsort(-new_last, kind="stable")[:top]
+    print(f"  top {top} of {run_date} under new weights:")
+    for i in order:
+        print(f"    {new_last[i]:6.1f}  (was {base_last[i]:5.1f})  {links[i]}")
+    return new
+
+
+def info(stem=ENRICHED_STEM):
+    for run_date, X, _ in load_matrices(stem):
+        print(f"  {run_date}  rows={X.shape[0]:<6} features={X.shape[1]}")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Re-score stored postings with new relevancy weights.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_rescore = sub.add_parser("rescore", help="apply weight overrides to all stored runs")
+    p_rescore.add_argument("weights", nargs="*", metavar="FEATURE=WEIGHT")
+    p_rescore.add_argument("--since", default=None, help="only runs on/after this ISO date")
+    p_rescore.add_argument("--top", type=int, default=15)
+    sub.add_parser("info", help="list stored feature matrices")
+    p_prune = sub.add_parser("prune", help="delete matrices outside the comparison window")
+    p_prune.add_argument("--days", type=int, default=RETAIN_DAYS)
+    args = ap.parse_args()
+
+    if not available():
+        raise SystemExit("numpy is required: pip install numpy")
+    if args.cmd == "rescore":
+        overrides = {}
+        for item in args.weights:
+            name, _, value = item.partition("=")
+            overrides[name] = float(value)
+        compare(overrides, since=args.since, top=args.top)
+    elif args.cmd == "info":
+        info()
+    elif args.cmd == "prune":
+        prune(days=args.days)
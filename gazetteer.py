@@ -0,0 +1,588 @@
+# gazetteer.py — v1.0
+# Offline gazetteer: cities / states → country → region, plus work-mode tags.
+#
+# Every name and alias is tokenised into a word trie once at import;
+# a location string is scanned left to right taking the longest phrase at
+# each token, so "New York City, NY (Hybrid)" is three lookups, not a
+# substring scan per known place. Results are memoised per distinct string.
+#
+#   parse_location(text)  -> GeoLocation(city, state, country, country_code,
+#                                        region, work_mode, country_codes)
+#   find_location(text)   -> (start, end) of the first place / work-mode
+#                            mention, for splitting "Title - Location" text
+#   LOCATION_PATTERN      -> regex source of the same names, for in-page
+#                            (JS) card filters in special_extractors_deep
+#
+# Names that are also ordinary title words ("Reading", "Global", ...) are
+# marked ambiguous: parse_location() accepts them, find_location() does not.
+# Upper-case codes (US, UK, DE, "Raleigh, NC") are only read from upper-case
+# text; a two-letter code right after a comma is taken as a US state.
+#
+# Usage:
+#   python gazetteer.py "Raleigh, NC" "US + 7 more Remote"
+#   python gazetteer.py coverage [--csv PATH]
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+NA, LATAM, EUROPE, MEA, APAC = ("North America", "LATAM", "Europe",
+                                "Middle East & Africa", "APAC")
+
+# code -> (name, region, aliases)
+COUNTRIES = {
+    "US": ("United States", NA, ["united states of america", "usa", "u.s.", "u.s.a."]),
+    "CA": ("Canada", NA, []),
+    "MX": ("Mexico", LATAM, ["méxico"]),
+    "BR": ("Brazil", LATAM, ["brasil"]),
+    "AR": ("Argentina", LATAM, []),
+    "CL": ("Chile", LATAM, []),
+    "CO": ("Colombia", LATAM, []),
+    "PE": ("Peru", LATAM, []),
+    "UY": ("Uruguay", LATAM, []),
+    "CR": ("Costa Rica", LATAM, []),
+    "GB": ("United Kingdom", EUROPE, ["uk", "u.k.", "great britain", "britain",
+                                      "england", "scotland", "wales", "northern ireland"]),
+    "IE": ("Ireland", EUROPE, []),
+    "DE": ("Germany", EUROPE, ["deutschland"]),
+    "FR": ("France", EUROPE, []),
+    "ES": ("Spain", EUROPE, ["españa"]),
+    "PT": ("Portugal", EUROPE, []),
+    "IT": ("Italy", EUROPE, ["italia"]),
+    "NL": ("Netherlands", EUROPE, ["the netherlands", "holland"]),
+    "BE": ("Belgium", EUROPE, []),
+    "LU": ("Luxembourg", EUROPE, []),
+    "CH": ("Switzerland", EUROPE, []),
+    "AT": ("Austria", EUROPE, []),
+    "SE": ("Sweden", EUROPE, []),
+    "NO": ("Norway", EUROPE, []),
+    "DK": ("Denmark", EUROPE, []),
+    "FI": ("Finland", EUROPE, []),
+    "PL": ("Poland", EUROPE, []),
+    "CZ": ("Czech Republic", EUROPE, ["czechia"]),
+    "SK": ("Slovakia", EUROPE, []),
+    "SI": ("Slovenia", EUROPE, []),
+    "HU": ("Hungary", EUROPE, []),
+    "RO": ("Romania", EUROPE, []),
+    "BG": ("Bulgaria", EUROPE, []),
+    "GR": ("Greece", EUROPE, []),
+    "HR": ("Croatia", EUROPE, []),
+    "RS": ("Serbia", EUROPE, []),
+    "UA": ("Ukraine", EUROPE, []),
+    "EE": ("Estonia", EUROPE, []),
+    "LV": ("Latvia", EUROPE, []),
+    "LT": ("Lithuania", EUROPE, []),
+    "IL": ("Israel", MEA, []),
+    "AE": ("United Arab Emirates", MEA, ["uae", "u.a.e."]),
+    "SA": ("Saudi Arabia", MEA, ["ksa"]),
+    "QA": ("Qatar", MEA, []),
+    "TR": ("Turkey", MEA, ["türkiye", "turkiye"]),
+    "EG": ("Egypt", MEA, []),
+    "MA": ("Morocco", MEA, []),
+    "ZA": ("South Africa", MEA, []),
+    "NG": ("Nigeria", MEA, []),
+    "KE": ("Kenya", MEA, []),
+    "IN": ("India", APAC, []),
+    "PK": ("Pakistan", APAC, []),
+    "BD": ("Bangladesh", APAC, []),
+    "LK": ("Sri Lanka", APAC, []),
+    "CN": ("China", APAC, []),
+    "HK": ("Hong Kong", APAC, []),
+    "TW": ("Taiwan", APAC, []),
+    "JP": ("Japan", APAC, []),
+    "KR": ("South Korea", APAC, ["korea", "republic of korea"]),
+    "SG": ("Singapore", APAC, []),
+    "MY": ("Malaysia", APAC, []),
+    "ID": ("Indonesia", APAC, []),
+    "TH": ("Thailand", APAC, []),
+    "VN": ("Vietnam", APAC, ["viet nam"]),
+    "PH": ("Philippines", APAC, []),
+    "AU": ("Australia", APAC, []),
+    "NZ": ("New Zealand", APAC, []),
+}
+
+# code -> name, for upper-case state / province codes
+US_STATES = {
+    "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas",
+    "CA": "California", "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware",
+    "DC": "District of Columbia", "FL": "Florida", "GA": "Georgia", "HI": "Hawaii",
+    "ID": "Idaho", "IL": "Illinois", "IN": "Indiana", "IA": "Iowa", "KS": "Kansas",
+    "KY": "Kentucky", "LA": "Louisiana", "ME": "Maine", "MD": "Maryland",
+    "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota", "MS": "Mississippi",
+    "MO": "Missouri", "MT": "Montana", "NE": "Nebraska", "NV": "Nevada",
+    "NH": "New Hampshire", "NJ": "New Jersey", "NM": "New Mexico", "NY": "New York",
+    "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio", "OK": "Oklahoma",
+    "OR": "Oregon", "PA": "Pennsylvania", "RI": "Rhode Island", "SC": "South Carolina",
+    "SD": "South Dakota", "TN": "Tennessee", "TX": "Texas", "UT": "Utah",
+    "VT": "Vermont", "VA": "Virginia", "WA": "Washington", "WV": "West Virginia",
+    "WI": "Wisconsin", "WY": "Wyoming",
+}
+CA_PROVINCES = {
+    "ON": "Ontario", "QC": "Quebec", "BC": "British Columbia", "AB": "Alberta",
+    "MB": "Manitoba", "NS": "Nova Scotia",
+}
+# State names that are also titles, surnames or countries
+_AMBIGUOUS_STATES = {"Georgia", "Washington", "Indiana", "Maine", "Nevada",
+                     "Virginia", "Montana", "Ohio"}
+
+# city -> (country code, aliases)
+CITIES = {
+    # North America
+    "New York":        ("US", ["new york city", "nyc", "manhattan", "brooklyn"]),
+    "San Francisco":   ("US", ["sf", "san francisco bay area", "bay area"]),
+    "San Jose":        ("US", []),
+    "Palo Alto":       ("US", []),
+    "Mountain View":   ("US", []),
+    "Menlo Park":      ("US", []),
+    "Redwood City":    ("US", []),
+    "San Mateo":       ("US", []),
+    "Sunnyvale":       ("US", []),
+    "Santa Clara":     ("US", []),
+    "Oakland":         ("US", []),
+    "Los Angeles":     ("US", ["la"]),
+    "San Diego":       ("US", []),
+    "Seattle":         ("US", []),
+    "Bellevue":        ("US", []),
+    "Redmond":         ("US", []),
+    "Portland":        ("US", []),
+    "Austin":          ("US", []),
+    "Dallas":          ("US", []),
+    "Houston":         ("US", []),
+    "Denver":          ("US", []),
+    "Boulder":         ("US", []),
+    "Chicago":         ("US", []),
+    "Boston":          ("US", []),
+    "Atlanta":         ("US", []),
+    "Miami":           ("US", []),
+    "Raleigh":         ("US", []),
+    "Research Triangle": ("US", ["rtp"]),
+    "Charlotte":       ("US", []),
+    "Washington DC":   ("US", ["washington d.c."]),
+    "Phoenix":         ("US", []),
+    "Salt Lake City":  ("US", []),
+    "Minneapolis":     ("US", []),
+    "Pittsburgh":      ("US", []),
+    "Philadelphia":    ("US", []),
+    "Nashville":       ("US", []),
+    "Detroit":         ("US", []),
+    "St. Louis":       ("US", ["saint louis", "st louis"]),
+    "Kansas City":     ("US", []),
+    "Herndon":         ("US", []),
+    "Reston":          ("US", []),
+    "McLean":          ("US", []),
+    "Toronto":         ("CA", []),
+    "Vancouver":       ("CA", []),
+    "Montreal":        ("CA", ["montréal"]),
+    "Ottawa":          ("CA", []),
+    "Waterloo":        ("CA", []),
+    "Calgary":         ("CA", []),
+    # Europe
+    "London":          ("GB", []),
+    "Manchester":      ("GB", []),
+    "Reading":         ("GB", []),
+    "Cambridge":       ("GB", []),
+    "Edinburgh":       ("GB", []),
+    "Glasgow":         ("GB", []),
+    "Bristol":         ("GB", []),
+    "Belfast":         ("GB", []),
+    "Leeds":           ("GB", []),
+    "Birmingham":      ("GB", []),
+    "Dublin":          ("IE", []),
+    "Cork":            ("IE", []),
+    "Galway":          ("IE", []),
+    "Limerick":        ("IE", []),
+    "Berlin":          ("DE", []),
+    "Munich":          ("DE", ["münchen", "muenchen"]),
+    "Hamburg":         ("DE", []),
+    "Frankfurt":       ("DE", []),
+    "Cologne":         ("DE", ["köln"]),
+    "Stuttgart":       ("DE", []),
+    "Düsseldorf":      ("DE", ["dusseldorf", "duesseldorf"]),
+    "Walldorf":        ("DE", []),
+    "Paris":           ("FR", []),
+    "Lyon":            ("FR", []),
+    "Toulouse":        ("FR", []),
+    "Madrid":          ("ES", []),
+    "Barcelona":       ("ES", []),
+    "Lisbon":          ("PT", ["lisboa"]),
+    "Porto":           ("PT", []),
+    "Milan":           ("IT", ["milano"]),
+    "Rome":            ("IT", ["roma"]),
+    "Amsterdam":       ("NL", []),
+    "Rotterdam":       ("NL", []),
+    "Utrecht":         ("NL", []),
+    "Eindhoven":       ("NL", []),
+    "Brussels":        ("BE", ["bruxelles"]),
+    "Zurich":          ("CH", ["zürich"]),
+    "Geneva":          ("CH", ["genève"]),
+    "Lausanne":        ("CH", []),
+    "Vienna":          ("AT", ["wien"]),
+    "Stockholm":       ("SE", []),
+    "Oslo":            ("NO", []),
+    "Copenhagen":      ("DK", []),
+    "Helsinki":        ("FI", []),
+    "Warsaw":          ("PL", ["warszawa"]),
+    "Krakow":          ("PL", ["kraków", "cracow"]),
+    "Wroclaw":         ("PL", ["wrocław"]),
+    "Gdansk":          ("PL", ["gdańsk"]),
+    "Prague":          ("CZ", ["praha"]),
+    "Brno":            ("CZ", []),
+    "Bucharest":       ("RO", []),
+    "Cluj-Napoca":     ("RO", ["cluj"]),
+    "Budapest":        ("HU", []),
+    "Athens":          ("GR", []),
+    "Sofia":           ("BG", []),
+    "Belgrade":        ("RS", []),
+    "Kyiv":            ("UA", ["kiev"]),
+    "Lviv":            ("UA", []),
+    "Tallinn":         ("EE", []),
+    "Vilnius":         ("LT", []),
+    # Middle East & Africa
+    "Tel Aviv":        ("IL", ["tel aviv-yafo"]),
+    "Jerusalem":       ("IL", []),
+    "Haifa":           ("IL", []),
+    "Herzliya":        ("IL", []),
+    "Dubai":           ("AE", []),
+    "Abu Dhabi":       ("AE", []),
+    "Riyadh":          ("SA", []),
+    "Istanbul":        ("TR", []),
+    "Cairo":           ("EG", []),
+    "Cape Town":       ("ZA", []),
+    "Johannesburg":    ("ZA", []),
+    "Nairobi":         ("KE", []),
+    "Lagos":           ("NG", []),
+    # APAC
+    "Bengaluru":       ("IN", ["bangalore"]),
+    "Hyderabad":       ("IN", []),
+    "Pune":            ("IN", []),
+    "Mumbai":          ("IN", ["bombay"]),
+    "Chennai":         ("IN", []),
+    "New Delhi":       ("IN", ["delhi", "delhi ncr"]),
+    "Gurugram":        ("IN", ["gurgaon"]),
+    "Noida":           ("IN", []),
+    "Kolkata":         ("IN", []),
+    "Ahmedabad":       ("IN", []),
+    "Beijing":         ("CN", []),
+    "Shanghai":        ("CN", []),
+    "Shenzhen":        ("CN", []),
+    "Tokyo":           ("JP", []),
+    "Osaka":           ("JP", []),
+    "Seoul":           ("KR", []),
+    "Taipei":          ("TW", []),
+    "Kuala Lumpur":    ("MY", []),
+    "Jakarta":         ("ID", []),
+    "Bangkok":         ("TH", []),
+    "Ho Chi Minh City": ("VN", ["saigon"]),
+    "Hanoi":           ("VN", []),
+    "Manila":          ("PH", []),
+    "Sydney":          ("AU", []),
+    "Melbourne":       ("AU", []),
+    "Brisbane":        ("AU", []),
+    "Perth":           ("AU", []),
+    "Canberra":        ("AU", []),
+    "Auckland":        ("NZ", []),
+    "Wellington":      ("NZ", []),
+    # LATAM
+    "São Paulo":       ("BR", ["sao paulo"]),
+    "Rio de Janeiro":  ("BR", []),
+    "Mexico City":     ("MX", ["cdmx", "ciudad de méxico"]),
+    "Guadalajara":     ("MX", []),
+    "Buenos Aires":    ("AR", []),
+    "Bogotá":          ("CO", ["bogota"]),
+    "Medellín":        ("CO", ["medellin"]),
+    "Santiago":        ("CL", []),
+}
+_AMBIGUOUS_CITIES = {"Reading", "Cambridge", "Birmingham", "Portland", "Charlotte",
+                     "Cork", "Santiago", "Sofia", "Perth", "Wellington", "Phoenix",
+                     "Waterloo", "Austin", "Boulder", "Oakland"}
+_AMBIGUOUS_ALIASES = {"sf", "la", "rtp", "ksa"}
+
+# phrase -> region
+REGIONS = {
+    "emea": "EMEA", "europe": EUROPE, "eu": EUROPE, "european union": EUROPE,
+    "dach": EUROPE, "nordics": EUROPE, "benelux": EUROPE, "cee": EUROPE,
+    "apac": APAC, "asia pacific": APAC, "asia": APAC, "anz": APAC,
+    "latam": LATAM, "latin america": LATAM, "south america": LATAM,
+    "north america": NA, "americas": NA, "amer": NA, "noram": NA,
+    "middle east": MEA, "africa": MEA, "mea": MEA,
+    "global": "Global", "worldwide": "Global",
+}
+_AMBIGUOUS_REGIONS = {"global", "eu", "cee", "amer", "mea"}
+
+# phrase -> work mode
+WORK_MODES = {
+    "remote": "Remote", "fully remote": "Remote", "work from home": "Remote",
+    "wfh": "Remote", "home based": "Remote", "anywhere": "Remote",
+    "telecommute": "Remote", "distributed": "Remote",
+    "hybrid": "Hybrid",
+    "on site": "Onsite", "onsite": "Onsite", "in office": "Onsite",
+    "office based": "Onsite",
+}
+_AMBIGUOUS_MODES = {"anywhere", "distributed", "in office"}
+
+# Upper-case codes allowed inside job titles; everything else only in
+# location text ("Sales Engineer - US", but not "IN" from "SALES IN ...")
+_TITLE_SAFE_CODES = {"US", "USA", "UK", "UAE"}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TRIE
+# ─────────────────────────────────────────────────────────────────────────────
+_Entry = namedtuple("_Entry", "kind name code ambiguous")
+
+GeoLocation = namedtuple(
+    "GeoLocation", "city state country country_code region work_mode country_codes")
+_EMPTY = GeoLocation("", "", "", "", "", "", ())
+
+_TOKEN_RE = re.compile(r"[^\W_]+", re.U)
+_END = ""   # trie key for "a phrase ends here"
+
+
+def _tokens(text):
+    return [m.group().lower() for m in _TOKEN_RE.finditer(text)]
+
+
+def _build_trie():
+    trie = {}
+
+    def add(phrase, entry):
+        node = trie
+        for tok in _tokens(phrase):
+            node = node.setdefault(tok, {})
+        # First registration wins: cities are added before countries, so the
+        # more specific reading of a shared name is kept
+        node.setdefault(_END, entry)
+
+    for city, (code, aliases) in CITIES.items():
+        amb = city in _AMBIGUOUS_CITIES
+        add(city, _Entry("city", city, code, amb))
+        for a in aliases:
+            add(a, _Entry("city", city, code, amb or a in _AMBIGUOUS_ALIASES))
+    for name in US_STATES.values():
+        add(name, _Entry("state", name, "US", name in _AMBIGUOUS_STATES))
+    for name in CA_PROVINCES.values():
+        add(name, _Entry("state", name, "CA", False))
+    for code, (name, _, aliases) in COUNTRIES.items():
+        add(name, _Entry("country", name, code, False))
+        for a in aliases:
+            add(a, _Entry("country", name, code, a in _AMBIGUOUS_ALIASES))
+    for phrase, region in REGIONS.items():
+        add(phrase, _Entry("region", region, "", phrase in _AMBIGUOUS_REGIONS))
+    for phrase, mode in WORK_MODES.items():
+        add(phrase, _Entry("mode", mode, "", phrase in _AMBIGUOUS_MODES))
+    return trie
+
+
+_TRIE = _build_trie()
+
+
+def _code_entry(tok, after_comma, strict):
+    """Entry for an upper-case code token, or None."""
+    if strict and tok not in _TITLE_SAFE_CODES and not after_comma:
+        return None
+    if tok == "USA":
+        return _Entry("country", COUNTRIES["US"][0], "US", False)
+    if tok in ("UK", "GB"):
+        return _Entry("country", COUNTRIES["GB"][0], "GB", False)
+    if tok == "UAE":
+        return _Entry("country", COUNTRIES["AE"][0], "AE", False)
+    if len(tok) != 2:
+        return None
+    if tok in US_STATES and (after_comma or tok not in COUNTRIES):
+        return _Entry("state", US_STATES[tok], "US", False)
+    if tok in CA_PROVINCES and after_comma:
+        return _Entry("state", CA_PROVINCES[tok], "CA", False)
+    if tok in COUNTRIES:
+        return _Entry("country", COUNTRIES[tok][0], tok, False)
+    return None
+
+
+def _scan(text, strict):
+    """(start, end, entry) for each gazetteer mention, longest phrase first."""
+    matches = list(_TOKEN_RE.finditer(text))
+    lowered = [m.group().lower() for m in matches]
+    out, i = [], 0
+    while i < len(matches):
+        node, best = _TRIE, None
+        for j in range(i, len(matches)):
+            node = node.get(lowered[j])
+            if node is None:
+                break
+            entry = node.get(_END)
+            if entry is not None and not (strict and entry.ambiguous):
+                best = (j, entry)
+        if best is None:
+            tok = matches[i].group()
+            if tok.isupper() and 2 <= len(tok) <= 3:
+                after_comma = text[:matches[i].start()].rstrip().endswith(",")
+                entry = _code_entry(tok, after_comma, strict)
+                if entry is not None:
+                    best = (i, entry)
+        if best is None:
+            i += 1
+            continue
+        j, entry = best
+        out.append((matches[i].start(), matches[j].end(), entry))
+        i = j + 1
+    return out
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# PUBLIC API
+# ─────────────────────────────────────────────────────────────────────────────
+# Country code -> {code: name} of its states / provinces
+_SUBDIVISIONS = {"US": US_STATES, "CA": CA_PROVINCES}
+
+
+@lru_cache(maxsize=65536)
+def parse_location(text):
+    """
+    Structured GeoLocation for a location string (memoised per string).
+
+    The country is decided by the most specific qualifier present: an
+    explicit country, else a state / province, else the city. "Cambridge, MA"
+    is Cambridge in the US, "London, Ontario" London in Canada; a bare code
+    after a city reads as that city's state where it can ("Boston MA").
+
+    >>> [parse_location(t).country_code for t in (
+    ...     "Cambridge, MA", "London, Ontario", "Toronto, CA", "Palo Alto CA",
+    ...     "Mountain View CA 94043", "Boston MA", "Denver CO")]
+    ['US', 'CA', 'CA', 'US', 'US', 'US', 'US']
+    """
+    if not text:
+        return _EMPTY
+    city = state = region = mode = ""
+    city_code = state_code = country_code = ""
+    for start, end, e in _scan(text, strict=False):
+        if e.kind == "mode":
+            mode = mode or e.name
+        elif e.kind == "region":
+            region = region or e.name
+        elif e.kind == "country":
+            # "Boston MA", "Palo Alto CA": a bare code after a city that is
+            # also a state / province of the city's country names the state
+            sub = _SUBDIVISIONS.get(city_code, {}).get(text[start:end])
+            if sub and not state:
+                state, state_code = sub, city_code
+            else:
+                country_code = country_code or e.code
+        elif e.kind == "city":
+            if not city:
+                city, city_code = e.name, e.code
+        elif e.kind == "state" and not state:
+            state, state_code = e.name, e.code
+            # "Toronto, CA": a code that is also the city's country names
+            # the country, not California
+            if city_code and text[start:end] == city_code:
+                state, state_code = "", ""
+                country_code = country_code or city_code
+    code = country_code or state_code or city_code
+    country = ""
+    if code:
+        country = COUNTRIES[code][0]
+        region = COUNTRIES[code][1]
+    return GeoLocation(city, state, country, code, region, mode, (code,) if code else ())
+
+
+@lru_cache(maxsize=65536)
+def find_location(text):
+    """(start, end) of the first unambiguous place or work-mode mention, or None."""
+    if not text:
+        return None
+    for start, end, _ in _scan(text, strict=True):
+        return start, end
+    return None
+
+
+def has_location(text):
+    return find_location(text) is not None
+
+
+# Region name -> member country codes; EMEA and Global span several regions
+REGION_COUNTRIES = {region: frozenset(c for c, (_, r, _) in COUNTRIES.items() if r == region)
+                    for region in (NA, LATAM, EUROPE, MEA, APAC)}
+REGION_COUNTRIES["EMEA"] = REGION_COUNTRIES[EUROPE] | REGION_COUNTRIES[MEA]
+REGION_COUNTRIES["Global"] = frozenset(COUNTRIES)
+
+
+def country_codes(terms):
+    """
+    Country codes named by free-text terms (profile geo lists). A region
+    term ("europe", "apac") expands to its member countries; a term that
+    names no place raises ValueError.
+    """
+    codes = set()
+    for term in terms:
+        loc = parse_location(term)
+        if loc.country_codes:
+            codes.update(loc.country_codes)
+        elif loc.region in REGION_COUNTRIES:
+            codes.update(REGION_COUNTRIES[loc.region])
+        else:
+            raise ValueError(f"geo {term!r} matches no country or region in the gazetteer")
+    return frozenset(codes)
+
+
+def _pattern_source():
+    """Regex source over every unambiguous phrase (JS-compatible, use with 'i')."""
+    phrases = set()
+
+    def walk(node, prefix):
+        for tok, child in node.items():
+            if tok == _END:
+                if not child.ambiguous:
+                    phrases.add(prefix)
+                continue
+            walk(child, prefix + (tok,))
+
+    walk(_TRIE, ())
+    alts = sorted((r"[\W_]+".join(re.escape(t) for t in p) for p in phrases),
+                  key=lambda s: (-len(s), s))
+    return r"\b(?:" + "|".join(alts) + r")\b"
+
+
+LOCATION_PATTERN = _pattern_source()
+
+# Bump when parse_location() resolves the same data differently, so cached
+# enrichment built on the old reading is recomputed
+_RESOLVER_REVISION = 3
+
+GAZETTEER_VERSION = hashlib.sha1(json.dumps(
+    [_RESOLVER_REVISION, COUNTRIES, US_STATES, CA_PROVINCES, CITIES, REGIONS, WORK_MODES,
+     sorted(_AMBIGUOUS_CITIES | _AMBIGUOUS_STATES | _AMBIGUOUS_REGIONS
+            | _AMBIGUOUS_MODES | _AMBIGUOUS_ALIASES | _TITLE_SAFE_CODES)],
+    sort_keys=True, ensure_ascii=False).encode()).hexdigest()[:12]
+
+
+def coverage(csv_path):
+    with open(csv_path, encoding="utf-8") as f:
+        locations = [r.get("Location") or "" for r in csv.DictReader(f)]
+    filled = [l for l in locations if l.strip()]
+    parsed = [parse_location(l) for l in filled]
+    with_country = sum(1 for g in parsed if g.country_code)
+    with_any = sum(1 for g in parsed if g.country_code or g.region or g.work_mode)
+    print(f"  {len(locations)} rows, {len(filled)} with a Location")
+    print(f"  country resolved : {with_country} ({with_country / max(len(filled), 1):.0%})")
+    print(f"  country/region/mode: {with_any} ({with_any / max(len(filled), 1):.0%})")
+    for l, g in zip(filled, parsed):
+        if not (g.country_code or g.region or g.work_mode):
+            print(f"    unresolved: {l!r}")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Offline location gazetteer.")
+    ap.add_argument("text", nargs="*", help="location strings to parse, or 'coverage'")
+    ap.add_argument("--csv", default=os.path.join(REPO_ROOT, "jobs_final_hard.csv"))
+    args = ap.parse_args()
+    if args.text[:1] == ["coverage"]:
+        coverage(args.csv)
+    else:
+        for t in args.text:
+            print(f"  {t!r:<40} {parse_location(t)}")
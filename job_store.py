@@ -0,0 +1,333 @@
+# job_store.py — v1.0
+# Embedded job store (SQLite) keyed by normalised job URL.
+#
+# Every run upserts its deduplicated rows: First_Seen is kept from the first
+# insert, Last_Seen moves to today, and a posting that reappears is reopened.
+# Postings of a company that produced rows this run but were not seen today
+# are flagged closed instead of silently disappearing. First_Seen lookups are
+# primary-key reads, so the previous CSV no longer has to be scanned.
+#
+# Title and description are mirrored into an FTS5 index (jobs_fts) by
+# triggers, so it stays in step with every upsert; search() ranks with BM25,
+# title hits weighing more than description hits.
+#
+# Postings closed for more than CLOSED_RETENTION_DAYS are deleted after each
+# run (and the file VACUUMed), so the store tracks the live market plus a
+# recent tail rather than growing forever. The store is not committed to
+# git; CI keeps it in the actions cache, and an empty store re-bootstraps
+# First_Seen from jobs_final_hard.csv.
+#
+# Usage:
+#   python job_store.py export [--status open|closed|all] [--out PATH]
+#   python job_store.py stats
+#   python job_store.py prune [--days 90]
+#   python job_store.py search "iceberg AND cdc" [--company X] [--group G]
+
+import argparse
+import csv
+import os
+import re
+import sqlite3
+from datetime import date, datetime, timedelta
+
+from scrape_health import STATE_DIR
+
+STORE_FILE = os.path.join(STATE_DIR, "jobs.sqlite3")
+CLOSED_RETENTION_DAYS = 90
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    norm_link     TEXT PRIMARY KEY,
+    company       TEXT NOT NULL,
+    title         TEXT NOT NULL,
+    link          TEXT NOT NULL,
+    location      TEXT NOT NULL DEFAULT '',
+    posting_date  TEXT NOT NULL DEFAULT '',
+    seniority     TEXT NOT NULL DEFAULT '',
+    description   TEXT NOT NULL DEFAULT '',
+    first_seen    TEXT NOT NULL,
+    last_seen     TEXT NOT NULL,
+    closed        INTEGER NOT NULL DEFAULT 0,
+    closed_on     TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_company_open ON jobs (company, closed);
+CREATE INDEX IF NOT EXISTS jobs_last_seen    ON jobs (last_seen);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5 (
+    title, description, content='jobs', content_rowid='rowid',
+    tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, description)
+    VALUES (new.rowid, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, description)
+    VALUES ('delete', old.rowid, old.title, old.description);
+END;
+-- The daily UPSERT rewrites every column, so only reindex on a real change;
+-- dropped first so stores created with the unconditional trigger pick it up
+DROP TRIGGER IF EXISTS jobs_fts_au;
+CREATE TRIGGER jobs_fts_au AFTER UPDATE OF title, description ON jobs
+WHEN old.title IS NOT new.title OR old.description IS NOT new.description BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, description)
+    VALUES ('delete', old.rowid, old.title, old.description);
+    INSERT INTO jobs_fts (rowid, title, description)
+    VALUES (new.rowid, new.title, new.description);
+END;
+"""
+
+# bm25() column weights: title, description
+_FTS_WEIGHTS = (4.0, 1.0)
+_FTS_TOKEN_RE = re.compile(r"\w+")
+
+# Row dict key -> column
+_COLUMNS = {
+    "Company":      "company",
+    "Job Title":    "title",
+    "Job Link":     "link",
+    "Location":     "location",
+    "Posting Date": "posting_date",
+    "Seniority":    "seniority",
+    "Description":  "description",
+    "First_Seen":   "first_seen",
+    "Last_Seen":    "last_seen",
+}
+
+EXPORT_FIELDNAMES = [
+    "Company", "Job Title", "Job Link", "Location",
+    "Posting Date", "Days Since Posted", "Seniority",
+    "Description", "First_Seen", "Last_Seen", "Closed_On",
+]
+
+
+def _days_since(posting_date, today):
+    if not posting_date:
+        return ""
+    try:
+        return str((today - datetime.fromisoformat(posting_date).date()).days)
+    except Exception:
+        return ""
+
+
+class _FirstSeenLookup:
+    """dict-like .get() over the store, as finalise_rows() expects."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def get(self, norm_link, default=None):
+        row = self.conn.execute(
+            "SELECT first_seen FROM jobs WHERE norm_link = ?", (norm_link,)).fetchone()
+        return row[0] if row else default
+
+
+class JobStore:
+
+    def __init__(self, path=STORE_FILE):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        self._init_fts()
+
+    def _init_fts(self):
+        """Create the FTS index; stores created before it existed are rebuilt once."""
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchone()
+        with self.conn:
+            self.conn.executescript(_FTS_SCHEMA)
+            if not exists and self.count():
+                self.conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+                print(f"[STORE] built full-text index over {self.count()} rows")
+
+    def close(self):
+        self.conn.close()
+
+    def count(self, status="all"):
+        where = {"open": "WHERE closed = 0", "closed": "WHERE closed = 1"}.get(status, "")
+        return self.conn.execute(f"SELECT COUNT(*) FROM jobs {where}").fetchone()[0]
+
+    def first_seen_lookup(self):
+        return _FirstSeenLookup(self.conn)
+
+    # ── writes ───────────────────────────────────────────────────────────────
+    def bootstrap_from_csv(self, path, normalise_url):
+        """One-off import of an existing jobs_final_hard.csv into an empty store."""
+        if self.count() or not os.path.exists(path):
+            return 0
+        with open(path, encoding="utf-8") as f:
+            rows = [r for r in csv.DictReader(f) if r.get("First_Seen")]
+        with self.conn:
+            for r in rows:
+                self._upsert(r, normalise_url(r.get("Job Link", "")), r.get("Last_Seen") or r["First_Seen"])
+        print(f"[STORE] bootstrapped {len(rows)} rows from {path}")
+        return len(rows)
+
+    def _upsert(self, r, norm_link, today):
+        if not norm_link:
+            return
+        self.conn.execute(
+            "INSERT INTO jobs (norm_link, company, title, link, location, posting_date, "
+            "seniority, description, first_seen, last_seen) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (norm_link) DO UPDATE SET "
+            "company = excluded.company, title = excluded.title, link = excluded.link, "
+            "location = excluded.location, posting_date = excluded.posting_date, "
+            "seniority = excluded.seniority, description = excluded.description, "
+            "last_seen = excluded.last_seen, closed = 0, closed_on = NULL",
+            (norm_link, r.get("Company", ""), r.get("Job Title", ""), r.get("Job Link", ""),
+             r.get("Location") or "", r.get("Posting Date") or "", r.get("Seniority") or "",
+             r.get("Description") or "", r.get("First_Seen") or today, today))
+
+    def record_run(self, rows, today, normalise_url, incomplete=()):
+        """
+        Upsert this run's rows and close open postings of the same companies
+        that were not seen today. Companies with no rows this run (failed or
+        not selected) and companies in `incomplete` (scrape cut short) are
+        left untouched. Returns (upserted, closed).
+        """
+        companies = {r.get("Company", "") for r in rows}
+        kept_open = sorted(companies & set(incomplete))
+        if kept_open:
+            print(f"[STORE] incomplete scrape — not closing postings of {', '.join(kept_open)}")
+        companies -= set(kept_open)
+        with self.conn:
+            for r in rows:
+                self._upsert(r, normalise_url(r.get("Job Link", "")), today)
+            closed = 0
+            for company in companies:
+                closed += self.conn.execute(
+                    "UPDATE jobs SET closed = 1, closed_on = ? "
+                    "WHERE company = ? AND closed = 0 AND last_seen < ?",
+                    (today, company, today)).rowcount
+        print(f"[STORE] upserted {len(rows)} rows, closed {closed} postings -> {self.path}")
+        self.prune(today)
+        return len(rows), closed
+
+    def prune(self, today, days=CLOSED_RETENTION_DAYS):
+        """Delete postings closed more than `days` ago; compact the file if any went."""
+        cutoff = (date.fromisoformat(today) - timedelta(days=days)).isoformat()
+        with self.conn:
+            removed = self.conn.execute(
+                "DELETE FROM jobs WHERE closed = 1 AND closed_on < ?", (cutoff,)).rowcount
+            if removed:
+                self.conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('optimize')")
+        if removed:
+            self.conn.execute("VACUUM")
+            print(f"[STORE] pruned {removed} postings closed before {cutoff}")
+        return removed
+
+    # ── reads ────────────────────────────────────────────────────────────────
+    def iter_rows(self, status="open", company=None):
+        """Row dicts in the CSV layout, sorted like jobs_final_hard.csv."""
+        where, args = [], []
+        if status == "open":
+            where.append("closed = 0")
+        elif status == "closed":
+            where.append("closed = 1")
+        if company:
+            where.append("company = ?")
+            args.append(company)
+        sql = ("SELECT " + ", ".join(_COLUMNS.values()) + ", closed_on FROM jobs"
+               + (" WHERE " + " AND ".join(where) if where else "")
+               + " ORDER BY lower(company), lower(title)")
+        today = date.today()
+        keys = list(_COLUMNS) + ["Closed_On"]
+        for values in self.conn.execute(sql, args):
+            r = dict(zip(keys, values))
+            r["Closed_On"] = r["Closed_On"] or ""
+            r["Days Since Posted"] = _days_since(r["Posting Date"], today)
+            yield r
+
+    def search(self, query, company=None, group=None, status="open", limit=20):
+        """
+        BM25-ranked full-text search over title + description. `query` uses
+        FTS5 syntax (terms are AND-ed; OR, NOT, "phrases" and prefix* work);
+        if it does not parse, its words are searched as plain terms.
+        Returns row dicts with Score (lower is better) and a Snippet.
+        """
+        where, args = ["jobs_fts MATCH ?"], [query]
+        if status == "open":
+            where.append("j.closed = 0")
+        elif status == "closed":
+            where.append("j.closed = 1")
+        companies = None
+        if group:
+            from clean_jobs_cplus import classify_company_group
+            companies = [c for (c,) in self.conn.execute("SELECT DISTINCT company FROM jobs")
+                         if classify_company_group(c).lower() == group.lower()]
+        if company:
+            companies = [company] if companies is None or company in companies else []
+        if companies is not None and not companies:
+            return []
+        if companies:
+            where.append(f"j.company IN ({', '.join('?' * len(companies))})")
+            args += companies
+        sql = (f"SELECT {', '.join('j.' + c for c in _COLUMNS.values())}, j.closed_on, "
+               f"bm25(jobs_fts, {_FTS_WEIGHTS[0]}, {_FTS_WEIGHTS[1]}) AS score, "
+               "snippet(jobs_fts, 1, '[', ']', '…', 12) "
+               "FROM jobs_fts JOIN jobs j ON j.rowid = jobs_fts.rowid "
+               f"WHERE {' AND '.join(where)} ORDER BY score LIMIT ?")
+        try:
+            cur = self.conn.execute(sql, args + [limit])
+        except sqlite3.OperationalError:
+            args[0] = " ".join(f'"{t}"' for t in _FTS_TOKEN_RE.findall(query))
+            if not args[0]:
+                return []
+            cur = self.conn.execute(sql, args + [limit])
+        keys = list(_COLUMNS) + ["Closed_On", "Score", "Snippet"]
+        hits = [dict(zip(keys, values)) for values in cur]
+        for h in hits:
+            h["Closed_On"] = h["Closed_On"] or ""
+        return hits
+
+    def export_csv(self, outfile, status="open"):
+        n = 0
+        with open(outfile, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=EXPORT_FIELDNAMES, extrasaction="ignore")
+            w.writeheader()
+            for r in self.iter_rows(status):
+                w.writerow(r)
+                n += 1
+        print(f"[STORE] exported {n} {status} rows -> {outfile}")
+        return n
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Inspect or export the job store.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_exp = sub.add_parser("export", help="write a CSV view of the store")
+    p_exp.add_argument("--status", choices=("open", "closed", "all"), default="open")
+    p_exp.add_argument("--out", default=None)
+    sub.add_parser("stats", help="open / closed counts")
+    p_prune = sub.add_parser("prune", help="delete long-closed postings and VACUUM")
+    p_prune.add_argument("--days", type=int, default=CLOSED_RETENTION_DAYS)
+    p_search = sub.add_parser("search", help="full-text search over title + description")
+    p_search.add_argument("query")
+    p_search.add_argument("--company", default=None)
+    p_search.add_argument("--group", default=None, help="Company_Group, e.g. ETL/Connectors")
+    p_search.add_argument("--status", choices=("open", "closed", "all"), default="open")
+    p_search.add_argument("--limit", type=int, default=20)
+    args = ap.parse_args()
+
+    store = JobStore()
+    if args.cmd == "export":
+        out = args.out or os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                       f"jobs_store_{args.status}.csv")
+        store.export_csv(out, args.status)
+    elif args.cmd == "stats":
+        print(f"  open   {store.count('open'):>6}")
+        print(f"  closed {store.count('closed'):>6}")
+    elif args.cmd == "search":
+        hits = store.search(args.query, args.company, args.group, args.status, args.limit)
+        for h in hits:
+            print(f"  {h['Score']:7.2f}  {h['Company']:<18} {h['Job Title']}")
+            print(f"           {h['Snippet']}")
+        print(f"  {len(hits)} hit(s)")
+    elif args.cmd == "prune":
+        store.prune(date.today().isoformat(), args.days)
+    store.close()
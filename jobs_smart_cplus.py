@@ -6,17 +6,38 @@
 #   4. first_seen / last_seen lifecycle columns
 #   5. Consistent 5-tuple output contract from all code paths
 #   6. Detail fetching writes description into row for enrichment downstream
-
-from playwright.sync_api import sync_playwright
+#   7. Per-host circuit breaker + cross-run negative cache (scrape_health.py)
+#   8. Adaptive navigation timeouts from per-host latency history
+#   9. Extractors may be generators of JobPosting records; iter_scrape() yields
+#      each row as soon as it is enriched
+#  10. Lazy extractor registry + --companies filter; Chromium is only launched
+#      when something first uses the page (API fallbacks, detail fetches)
+#  11. --shard K/N (cost-balanced, sharding.py) and --merge of shard files;
+#      the assignment reads the cost file the merge publishes
+#  12. First_Seen / Last_Seen / closed kept in an SQLite job store (job_store.py)
+#  13. Title / location / seniority / URL normalisers are pure, use precompiled
+#      patterns and are memoised (bench_hotpaths.py)
+#  14. LOC_RE replaced by the offline gazetteer (gazetteer.py)
+#  15. Partial company scrapes are recorded (INCOMPLETE_COMPANIES) so the job
+#      store does not close postings it simply did not get to
+
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, urlunparse
 import re, csv, time, sys, json, os
 from datetime import datetime, date, timedelta
 
 try:
-    from special_extractors_deep import SPECIAL_EXTRACTORS_DEEP
+    from special_extractors_deep import SPECIAL_EXTRACTORS_DEEP, iter_postings, needs_browser
 except ImportError:
     SPECIAL_EXTRACTORS_DEEP = {}
+    iter_postings = None
+    needs_browser = lambda company: True
+
+from scrape_health import (FetchGuard, LATENCY, COMPANY_COSTS, CompanyCostHistory,
+                           TIMEOUT_CEILING_MS, is_timeout, nav_timeout)
+from gazetteer import find_location, has_location
 
 # ─────────────────────────────────────────────────────────────────────────────
 # CONFIG
@@ -68,7 +89,7 @@ COMPANIES = {
     "Zilliz":             ["https://jobs.lever.co/zilliz"],
 }
 
-PAGE_NAV_TIMEOUT     = 40_000
+PAGE_NAV_TIMEOUT     = 40_000      # default until a host has latency history
 PAGE_DOM_TIMEOUT     = 15_000
 SLEEP_BETWEEN        = 0.18
 MAX_DETAIL_PAGES     = 12_000
@@ -81,6 +102,14 @@ PER_COMPANY_CAP_OVERRIDES = {
 
 TODAY = date.today().isoformat()
 
+# Circuit breaker + persisted negative cache for dead / blocking URLs
+FETCH_GUARD = FetchGuard()
+
+# Company -> reason, for companies whose scrape this run was cut short (listing
+# fetch failed, extractor error, timeout, detail cap). The job store leaves
+# their unseen postings open instead of closing them.
+INCOMPLETE_COMPANIES = {}
+
 # Companies with JS-heavy portals — given longer timeout
 SLOW_COMPANIES = {"SAP", "IBM", "Salesforce", "Amazon", "Oracle"}
 
@@ -88,7 +117,7 @@ SLOW_COMPANIES = {"SAP", "IBM", "Salesforce", "Amazon", "Oracle"}
 API_COMPLETE_COMPANIES = {
     "Databricks", "Collibra", "Fivetran", "MongoDB", "Boomi",
     "Matillion", "Anomalo", "Atlan", "Pinecone", "Zilliz",
-    "Monte Carlo", "Datadog",
+    "Monte Carlo", "Datadog", "Amazon",
 }
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -98,10 +127,11 @@ FORBIDDEN_RE = re.compile(
     r'\b(?:privacy|about|press|blog|partners|pricing|docs|support|events|'
     r'resources|login|apply now|read more)\b', re.I
 )
-LOC_RE = re.compile(
-    r'\b(?:remote|hybrid|usa|united states|uk|germany|india|london|new york|'
-    r'singapore|berlin|bengaluru)\b', re.I
-)
+_WS_RE             = re.compile(r'\s+')
+_TRAILING_MODE_RE  = re.compile(r'\((?:remote|hybrid)[^)]+\)\s*$', re.I)
+_LEADING_BULLET_RE = re.compile(r'^[\-•\*]\s*')
+_TRAILING_PAREN_RE = re.compile(r'\(([^)]+)\)\s*$')
+_LOC_SPLIT_RE      = re.compile(r'\s{2,}| - | — | – | \| |·|•|,')
 ROLE_WORDS_RE = re.compile(
     r'\b(?:engineer|developer|manager|director|architect|scientist|analyst|'
     r'product|sre|intern|specialist|consultant|lead|staff|principal)\b', re.I
@@ -142,6 +172,13 @@ PRODUCT_TECH_KEYWORDS = [
 # ─────────────────────────────────────────────────────────────────────────────
 # HELPERS
 # ─────────────────────────────────────────────────────────────────────────────
+# Normalisers below are pure functions of their string argument and see the
+# same inputs many times per run (PATH B cleans a title up to three times),
+# so they are memoised. Sizes are bounded well above one run's distinct inputs.
+NORMALISE_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=NORMALISE_CACHE_SIZE)
 def normalise_url(url: str) -> str:
     """Strip query params, fragments, and trailing slashes for deduplication."""
     if not url:
@@ -170,30 +207,37 @@ def normalize_link(base, href):
         return href
 
 
+@lru_cache(maxsize=NORMALISE_CACHE_SIZE)
 def clean_title(raw):
     if not raw:
         return ""
-    t = re.sub(r'\s+', ' ', raw).strip()
+    t = _WS_RE.sub(' ', raw).strip()
     t = FORBIDDEN_RE.sub('', t)
-    t = re.sub(r'\((?:remote|hybrid)[^)]+\)\s*$', '', t, flags=re.I).strip()
-    t = re.sub(r'^[\-•\*]\s*', '', t)
+    t = _TRAILING_MODE_RE.sub('', t).strip()
+    t = _LEADING_BULLET_RE.sub('', t)
     return t.strip(" -:,.|")[:240]
 
 
+@lru_cache(maxsize=NORMALISE_CACHE_SIZE)
 def extract_location_from_text(txt):
     if not txt:
         return "", ""
     s = txt.replace("\r", " ").replace("\n", " ").strip()
-    paren = re.search(r'\(([^)]+)\)\s*$', s)
+    paren = _TRAILING_PAREN_RE.search(s)
     if paren:
         return s[:paren.start()].strip(" -:,"), paren.group(1)
-    parts = re.split(r'\s{2,}| - | — | – | \| |·|•|,', s)
+    parts = _LOC_SPLIT_RE.split(s)
     parts = [p.strip() for p in parts if p.strip()]
-    if len(parts) >= 2 and (LOC_RE.search(parts[-1]) or len(parts[-1].split()) <= 4):
-        return " ".join(parts[:-1]), parts[-1]
-    m = LOC_RE.search(s)
-    if m:
-        idx = m.start()
+    if len(parts) >= 2:
+        # Last segment is the location when it starts with a place or is
+        # short (≤ 4 words, as before); a place further into a long segment
+        # is left to the whole-string scan below
+        lead = find_location(parts[-1])
+        if (lead and lead[0] == 0) or len(parts[-1].split()) <= 4:
+            return " ".join(parts[:-1]), parts[-1]
+    span = find_location(s)
+    if span:
+        idx = span[0]
         candidate = s[idx:].strip(" -,:;")
         title = s.replace(candidate, "").strip(" -:,")
         return title, candidate
@@ -217,24 +261,25 @@ def try_extract_location_from_card(el):
     return ""
 
 
+_SENIORITY_RULES = (
+    ("Director+",       ("chief ", "cto", "vp ", "director", "head of")),
+    ("Principal/Staff", ("principal", "distinguished", "staff ")),
+    ("Senior",          ("senior", "sr.", "lead ")),
+    ("Manager",         ("manager", "mgr")),
+    ("Mid",             ("mid ", "associate", " ii")),
+    ("Entry",           ("junior", "jr.", "entry")),
+    ("Intern",          ("intern", "internship", "werkstudent")),
+)
+
+
+@lru_cache(maxsize=NORMALISE_CACHE_SIZE)
 def detect_seniority(title):
     if not title:
         return "Unknown"
     t = title.lower()
-    if any(x in t for x in ["chief ", "cto", "vp ", "director", "head of"]):
-        return "Director+"
-    if any(x in t for x in ["principal", "distinguished", "staff "]):
-        return "Principal/Staff"
-    if any(x in t for x in ["senior", "sr.", "lead "]):
-        return "Senior"
-    if any(x in t for x in ["manager", "mgr"]):
-        return "Manager"
-    if any(x in t for x in ["mid ", "associate", " ii"]):
-        return "Mid"
-    if any(x in t for x in ["junior", "jr.", "entry"]):
-        return "Entry"
-    if any(x in t for x in ["intern", "internship", "werkstudent"]):
-        return "Intern"
+    for level, words in _SENIORITY_RULES:
+        if any(x in t for x in words):
+            return level
     return "Unknown"
 
 
@@ -310,18 +355,39 @@ def extract_date_from_html(html_text):
     return ""
 
 
-def fetch_page_content(page, url, nav_timeout=PAGE_NAV_TIMEOUT):
+def fetch_page_content(page, url, timeout=None):
+    skip_reason = FETCH_GUARD.should_skip(url)
+    if skip_reason:
+        print(f"[SKIP-FETCH] {url} -> {skip_reason}")
+        return ""
+    timeout = timeout or nav_timeout(url, PAGE_NAV_TIMEOUT)
     try:
-        page.goto(url, timeout=nav_timeout, wait_until="networkidle")
+        start = time.monotonic()
+        page.goto(url, timeout=timeout, wait_until="networkidle")
         page.wait_for_load_state("networkidle")
+        LATENCY.record(url, (time.monotonic() - start) * 1000)
         page.wait_for_timeout(900)
-        return page.content()
-    except Exception:
+        html = page.content()
+        FETCH_GUARD.record_success(url)
+        return html
+    except Exception as e:
+        if is_timeout(e):
+            LATENCY.record_timeout(url, timeout)
+        # DNS / refused / reset: the host is unreachable, a second wait won't help
+        if "net::ERR_" in str(e):
+            FETCH_GUARD.record_failure(url)
+            return ""
+        # One retry on a lighter load event, with the largest budget the
+        # adaptive timeout allows — the one that just failed is no use
+        retry_timeout = max(timeout, TIMEOUT_CEILING_MS)
         try:
-            page.goto(url, timeout=nav_timeout, wait_until="domcontentloaded")
+            page.goto(url, timeout=retry_timeout, wait_until="domcontentloaded")
             page.wait_for_timeout(900)
-            return page.content()
+            html = page.content()
+            FETCH_GUARD.record_success(url)
+            return html
         except Exception:
+            FETCH_GUARD.record_failure(url)
             return ""
 
 
@@ -414,347 +480,540 @@ def enrich_detail(page, link, detail_count, location_in, date_in):
 # ─────────────────────────────────────────────────────────────────────────────
 # MAIN SCRAPE
 # ─────────────────────────────────────────────────────────────────────────────
-def scrape():
-    rows = []
-    detail_count = 0
+def select_companies(names=None):
+    """
+    COMPANIES restricted to `names` (case-insensitive), in COMPANIES order.
+    None or an empty list selects everything.
+    """
+    if not names:
+        return dict(COMPANIES)
+    wanted = {n.strip().lower() for n in names if n.strip()}
+    selected = {c: urls for c, urls in COMPANIES.items() if c.lower() in wanted}
+    unknown = wanted - {c.lower() for c in selected}
+    if unknown:
+        print(f"[WARN] unknown companies ignored: {', '.join(sorted(unknown))}")
+    return selected
+
+
+def company_needs_browser(company):
+    """
+    Whether the listing page is rendered up front. Registry extractors marked
+    needs_browser=False get no soup; a fallback or detail fetch that does need
+    the page opens it lazily (see lazy_page).
+    """
+    return company not in SPECIAL_EXTRACTORS_DEEP or needs_browser(company)
+
 
+def scrape(companies=None):
+    return list(iter_scrape(companies=companies))
+
+
+def iter_scrape(on_company_done=None, companies=None):
+    """
+    Yield row dicts one at a time, in company order, as soon as each posting
+    has been cleaned and (if needed) detail-enriched. `on_company_done(company)`
+    is called once a company's last row has been yielded. `companies` limits
+    the run to a subset (see select_companies).
+    """
+    budget = {"detail_count": 0}
+    selected = select_companies(companies)
+    INCOMPLETE_COMPANIES.clear()
+
+    with lazy_page() as page:
+        for company, url_list in selected.items():
+            yield from iter_company(page, company, url_list, budget)
+            if on_company_done:
+                on_company_done(company)
+
+    FETCH_GUARD.save()
+    LATENCY.save()
+    COMPANY_COSTS.save()
+
+
+@contextmanager
+def browser_page(needed=True):
+    """Yield a Playwright page, or None without launching Chromium."""
+    if not needed:
+        yield None
+        return
+    from playwright.sync_api import sync_playwright
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True, args=["--no-sandbox"])
-        context = browser.new_context()
-        page = context.new_page()
-
-        for company, url_list in COMPANIES.items():
-            company_rows = []
-            import time as _time
-            company_start = _time.time()
-            COMPANY_TIMEOUT_SECS = 900 if company in SLOW_COMPANIES else 600
-
-            for main_url in url_list:
-                # Per-company timeout check
-                if _time.time() - company_start > COMPANY_TIMEOUT_SECS:
-                    print(f"[TIMEOUT] {company} exceeded {COMPANY_TIMEOUT_SECS}s — skipping remaining URLs")
+        try:
+            yield browser.new_context().new_page()
+        finally:
+            browser.close()
+
+
+class _LazyPage:
+    """Stands in for a Playwright page; Chromium is launched on first use."""
+
+    def __init__(self, stack):
+        self._stack = stack
+        self._page = None
+
+    def __getattr__(self, name):
+        if self._page is None:
+            print(f"[BROWSER] launching Chromium (first use: page.{name})")
+            self._page = self._stack.enter_context(browser_page(True))
+        return getattr(self._page, name)
+
+
+@contextmanager
+def lazy_page():
+    """Yield a page that launches Chromium only if something actually uses it."""
+    with ExitStack() as stack:
+        yield _LazyPage(stack)
+
+
+def _check_detail_cap(company, budget):
+    if budget["detail_count"] >= MAX_DETAIL_PAGES:
+        mark_incomplete(company, f"detail page cap ({MAX_DETAIL_PAGES}) reached")
+
+
+def mark_incomplete(company, reason):
+    """Record that `company` was not fully scraped this run (first reason wins)."""
+    if company not in INCOMPLETE_COMPANIES:
+        print(f"[INCOMPLETE] {company}: {reason}")
+        INCOMPLETE_COMPANIES[company] = reason
+
+
+def iter_company(page, company, url_list, budget):
+    """
+    Rows for one company — the unit of work for iter_scrape() and the
+    work-queue workers. `budget["detail_count"]` is shared across companies
+    so MAX_DETAIL_PAGES applies per run (or per worker). With
+    `budget["defer_details"]` set, special-extractor rows that would need a
+    detail fetch are yielded as-is with `_needs_detail` = True. A scrape cut
+    short is recorded with mark_incomplete().
+    """
+    company_count = 0
+    import time as _time
+    company_start = _time.time()
+    COMPANY_TIMEOUT_SECS = 900 if company in SLOW_COMPANIES else 600
+
+    for main_url in url_list:
+        # Per-company timeout check
+        if _time.time() - company_start > COMPANY_TIMEOUT_SECS:
+            print(f"[TIMEOUT] {company} exceeded {COMPANY_TIMEOUT_SECS}s — skipping remaining URLs")
+            mark_incomplete(company, f"timed out after {COMPANY_TIMEOUT_SECS}s")
+            break
+
+        print(f"\n[SCRAPING] {company} -> {main_url}")
+        soup = None
+        if company_needs_browser(company):
+            listing_html = fetch_page_content(page, main_url)
+            if not listing_html:
+                print(f"[WARN] no html for {company} ({main_url})")
+                mark_incomplete(company, f"no html for {main_url}")
+                continue
+            soup = BeautifulSoup(listing_html, "lxml")
+
+        # ══════════════════════════════════════════════════════════
+        # PATH A — SPECIAL EXTRACTOR
+        # ══════════════════════════════════════════════════════════
+        if company in SPECIAL_EXTRACTORS_DEEP:
+            print(f"[SPECIAL] Running extractor for {company}")
+            try:
+                raw_items = SPECIAL_EXTRACTORS_DEEP[company](soup, page, main_url)
+            except Exception as e:
+                print(f"[SPECIAL ERROR] {company} -> {e}")
+                mark_incomplete(company, f"extractor failed: {e}")
+                # ── CRITICAL: skip generic pipeline even on extractor error ──
+                continue  # move to next URL for this company
+
+            # Extractors may return a list or a generator; either way each
+            # posting is enriched and yielded before the next is pulled.
+            raw_count = 0
+            stopped = lambda e: mark_incomplete(company, f"extractor stopped mid-stream: {e}")
+            for posting in iter_postings(raw_items, company, on_error=stopped):
+                raw_count += 1
+                link, title = posting.link, posting.title
+                desc_text   = posting.description
+                loc_text    = posting.location
+                post_date   = posting.posting_date
+
+                t_candidate, loc_candidate = extract_location_from_text(title)
+                title_final = clean_title(t_candidate or title)
+
+                if should_drop_by_title(title_final):
+                    print(f"[DROP-SPECIAL] {company} | {title_final}")
+                    continue
+
+                location_final = (loc_text or loc_candidate or "").strip()
+                needs_detail = False
+
+                # Skip detail fetch for API companies — they already have full data
+                if company not in API_COMPLETE_COMPANIES and link and (
+                    not location_final or not post_date or not desc_text
+                ):
+                    if budget.get("defer_details"):
+                        # Work-queue mode: another worker fetches it as a detail task
+                        needs_detail = True
+                    else:
+                        _check_detail_cap(company, budget)
+                        location_final, post_date, desc_enriched, budget["detail_count"] = enrich_detail(
+                            page, link, budget["detail_count"], location_final, post_date
+                        )
+                        if not desc_text:
+                            desc_text = desc_enriched
+
+                company_count += 1
+                print(f"[KEEP-SPECIAL] {company} | {title_final}")
+                yield {
+                    "Company": company,
+                    "Job Title": title_final,
+                    "Job Link": link,
+                    "Location": location_final,
+                    "Posting Date": post_date or "",
+                    "Days Since Posted": "",
+                    "Description": desc_text[:4000] if desc_text else "",
+                    "_needs_detail": needs_detail,
+                }
+
+            print(f"[SPECIAL] {company}: {raw_count} raw items")
+
+            # ── SKIP GENERIC PIPELINE — this is the double-scraping fix ──
+            continue
+
+        # ══════════════════════════════════════════════════════════
+        # PATH B — GENERIC PIPELINE (only runs if no special extractor)
+        # ══════════════════════════════════════════════════════════
+        candidates = []
+
+        for a in soup.find_all("a", href=True):
+            href = a.get("href")
+            text = a.get_text(" ", strip=True) or ""
+            href_abs = normalize_link(main_url, href)
+            if is_likely_job_anchor(href_abs, text):
+                candidates.append((href_abs, text, a))
+
+        for el in soup.select("[data-job], .job, .job-listing, .job-card, "
+                              ".opening, .position, .posting, .role, .job-row"):
+            a = el.find("a", href=True)
+            text = a.get_text(" ", strip=True) if a else el.get_text(" ", strip=True)
+            href = normalize_link(main_url, a.get("href")) if a else ""
+            if is_likely_job_anchor(href, text):
+                candidates.append((href, text, el))
+
+        if not candidates:
+            for iframe in soup.find_all("iframe", src=True):
+                src = iframe.get("src")
+                if src and any(k in src for k in (
+                        "greenhouse", "lever", "myworkday",
+                        "bamboohr", "ashby", "jobvite")):
+                    src_full = normalize_link(main_url, src)
+                    iframe_html = fetch_page_content(page, src_full)
+                    if iframe_html:
+                        f_soup = BeautifulSoup(iframe_html, "lxml")
+                        for a in f_soup.find_all("a", href=True):
+                            href = a.get("href")
+                            text = a.get_text(" ", strip=True) or ""
+                            href_abs = normalize_link(src_full, href)
+                            if is_likely_job_anchor(href_abs, text):
+                                candidates.append((href_abs, text, a))
+
+        # dedupe + skip rules
+        seen_generic = set()
+        filtered = []
+        for href, text, el in candidates:
+            if not href or href.rstrip("/") == main_url.rstrip("/"):
+                continue
+            norm = normalise_url(href)
+            if norm in seen_generic:
+                continue
+            seen_generic.add(norm)
+            skip = False
+            low_text = (text or "").lower()
+            for c, rules in COMPANY_SKIP_RULES.items():
+                if c.lower() == company.lower():
+                    for r in rules:
+                        if re.search(r, low_text) or re.search(r, href, re.I):
+                            skip = True
+                            break
+                if skip:
                     break
+            if not skip:
+                filtered.append((href, text, el))
+
+        for link, anchor_text, el in filtered:
+            time.sleep(SLEEP_BETWEEN)
 
-                print(f"\n[SCRAPING] {company} -> {main_url}")
-                listing_html = fetch_page_content(page, main_url)
-                if not listing_html:
-                    print(f"[WARN] no html for {company} ({main_url})")
+            jt_div = None
+            try:
+                jt_div = el.select_one("[data-automation-id='jobTitle']")
+            except Exception:
+                pass
+
+            title_candidate = (jt_div.get_text(" ", strip=True)
+                               if jt_div else
+                               re.sub(r'\s+', ' ', anchor_text or "").strip())
+
+            title_clean, location_candidate = extract_location_from_text(title_candidate)
+            title_clean = clean_title(title_clean or title_candidate)
+            title_low = title_clean.lower()
+
+            # Product filter
+            if "product" in title_low:
+                if any(re.search(p, title_low) for p in NON_TECH_PRODUCT_PATTERNS):
+                    print(f"[DROP-PRODUCT-TITLE] {title_clean}")
                     continue
 
-                soup = BeautifulSoup(listing_html, "lxml")
-
-                # ══════════════════════════════════════════════════════════
-                # PATH A — SPECIAL EXTRACTOR
-                # ══════════════════════════════════════════════════════════
-                if company in SPECIAL_EXTRACTORS_DEEP:
-                    print(f"[SPECIAL] Running extractor for {company}")
-                    try:
-                        raw_items = SPECIAL_EXTRACTORS_DEEP[company](soup, page, main_url)
-                        print(f"[SPECIAL] {company}: {len(raw_items)} raw items")
-                    except Exception as e:
-                        print(f"[SPECIAL ERROR] {company} -> {e}")
-                        # ── CRITICAL: skip generic pipeline even on extractor error ──
-                        continue  # move to next URL for this company
-
-                    for item in raw_items:
-                        if not item:
-                            continue
-
-                        # Normalise to (link, title, desc, loc, date)
-                        if len(item) == 5:
-                            link, title, desc_text, loc_text, post_date = item
-                        elif len(item) == 3:
-                            link, title, _ = item
-                            desc_text = loc_text = post_date = ""
-                        elif len(item) == 2:
-                            link, title = item
-                            desc_text = loc_text = post_date = ""
-                        else:
-                            link = item[0]
-                            title = item[1] if len(item) > 1 else ""
-                            desc_text = loc_text = post_date = ""
-
-                        t_candidate, loc_candidate = extract_location_from_text(title)
-                        title_final = clean_title(t_candidate or title)
-
-                        if should_drop_by_title(title_final):
-                            print(f"[DROP-SPECIAL] {company} | {title_final}")
-                            continue
-
-                        location_final = (loc_text or loc_candidate or "").strip()
-
-                        # Skip detail fetch for API companies — they already have full data
-                        if company not in API_COMPLETE_COMPANIES and link and (
-                            not location_final or not post_date or not desc_text
-                        ):
-                            location_final, post_date, desc_enriched, detail_count = enrich_detail(
-                                page, link, detail_count, location_final, post_date
-                            )
-                            if not desc_text:
-                                desc_text = desc_enriched
-
-                        company_rows.append({
-                            "Company": company,
-                            "Job Title": title_final,
-                            "Job Link": link,
-                            "Location": location_final,
-                            "Posting Date": post_date or "",
-                            "Days Since Posted": "",
-                            "Description": desc_text[:4000] if desc_text else "",
-                        })
-                        print(f"[KEEP-SPECIAL] {company} | {title_final}")
-
-                    # ── SKIP GENERIC PIPELINE — this is the double-scraping fix ──
+            card_loc = try_extract_location_from_card(el)
+            if card_loc and not location_candidate:
+                location_candidate = card_loc
+
+            must_detail = (
+                company.lower() in CRITICAL_COMPANIES
+                or not location_candidate
+                or len((title_clean or "").split()) < 2
+                or has_location(title_candidate)
+                or any(x in (link or "").lower() for x in [
+                    "/job/", "/jobs/", "greenhouse", "lever.co",
+                    "ashby", "bamboohr", "myworkdayjobs",
+                    "gr8people", "welcometothejungle",
+                ])
+                or ("product" in title_low)
+            )
+
+            light_score = score_title_desc(title_candidate, "", company)
+            desc_text = ""
+
+            posting_date = ""
+            if light_score >= RELEVANCY_THRESHOLD and not must_detail:
+                print(f"[KEEP-LIGHT] {company} | {title_candidate} | score={light_score}")
+            else:
+                if light_score <= 0 and not must_detail:
+                    print(f"[DROP-LIGHT] {company} | {title_candidate} score={light_score}")
                     continue
 
-                # ══════════════════════════════════════════════════════════
-                # PATH B — GENERIC PIPELINE (only runs if no special extractor)
-                # ══════════════════════════════════════════════════════════
-                candidates = []
-
-                for a in soup.find_all("a", href=True):
-                    href = a.get("href")
-                    text = a.get_text(" ", strip=True) or ""
-                    href_abs = normalize_link(main_url, href)
-                    if is_likely_job_anchor(href_abs, text):
-                        candidates.append((href_abs, text, a))
-
-                for el in soup.select("[data-job], .job, .job-listing, .job-card, "
-                                      ".opening, .position, .posting, .role, .job-row"):
-                    a = el.find("a", href=True)
-                    text = a.get_text(" ", strip=True) if a else el.get_text(" ", strip=True)
-                    href = normalize_link(main_url, a.get("href")) if a else ""
-                    if is_likely_job_anchor(href, text):
-                        candidates.append((href, text, el))
-
-                if not candidates:
-                    for iframe in soup.find_all("iframe", src=True):
-                        src = iframe.get("src")
-                        if src and any(k in src for k in (
-                                "greenhouse", "lever", "myworkday",
-                                "bamboohr", "ashby", "jobvite")):
-                            src_full = normalize_link(main_url, src)
-                            iframe_html = fetch_page_content(page, src_full)
-                            if iframe_html:
-                                f_soup = BeautifulSoup(iframe_html, "lxml")
-                                for a in f_soup.find_all("a", href=True):
-                                    href = a.get("href")
-                                    text = a.get_text(" ", strip=True) or ""
-                                    href_abs = normalize_link(src_full, href)
-                                    if is_likely_job_anchor(href_abs, text):
-                                        candidates.append((href_abs, text, a))
-
-                # dedupe + skip rules
-                seen_generic = set()
-                filtered = []
-                for href, text, el in candidates:
-                    if not href or href.rstrip("/") == main_url.rstrip("/"):
-                        continue
-                    norm = normalise_url(href)
-                    if norm in seen_generic:
+                _check_detail_cap(company, budget)
+                location_candidate, posting_date, desc_text, budget["detail_count"] = enrich_detail(
+                    page, link, budget["detail_count"], location_candidate, ""
+                )
+
+                # Detail-level product filter
+                if "product" in title_low:
+                    if not any(k in (desc_text or "").lower() for k in PRODUCT_TECH_KEYWORDS):
+                        print(f"[DROP-PRODUCT] {company} | {title_clean}")
                         continue
-                    seen_generic.add(norm)
-                    skip = False
-                    low_text = (text or "").lower()
-                    for c, rules in COMPANY_SKIP_RULES.items():
-                        if c.lower() == company.lower():
-                            for r in rules:
-                                if re.search(r, low_text) or re.search(r, href, re.I):
-                                    skip = True
-                                    break
-                        if skip:
-                            break
-                    if not skip:
-                        filtered.append((href, text, el))
-
-                for link, anchor_text, el in filtered:
-                    time.sleep(SLEEP_BETWEEN)
-
-                    jt_div = None
-                    try:
-                        jt_div = el.select_one("[data-automation-id='jobTitle']")
-                    except Exception:
-                        pass
-
-                    title_candidate = (jt_div.get_text(" ", strip=True)
-                                       if jt_div else
-                                       re.sub(r'\s+', ' ', anchor_text or "").strip())
-
-                    title_clean, location_candidate = extract_location_from_text(title_candidate)
-                    title_clean = clean_title(title_clean or title_candidate)
-                    title_low = title_clean.lower()
-
-                    # Product filter
-                    if "product" in title_low:
-                        if any(re.search(p, title_low) for p in NON_TECH_PRODUCT_PATTERNS):
-                            print(f"[DROP-PRODUCT-TITLE] {title_clean}")
-                            continue
-
-                    card_loc = try_extract_location_from_card(el)
-                    if card_loc and not location_candidate:
-                        location_candidate = card_loc
-
-                    must_detail = (
-                        company.lower() in CRITICAL_COMPANIES
-                        or not location_candidate
-                        or len((title_clean or "").split()) < 2
-                        or LOC_RE.search(title_candidate)
-                        or any(x in (link or "").lower() for x in [
-                            "/job/", "/jobs/", "greenhouse", "lever.co",
-                            "ashby", "bamboohr", "myworkdayjobs",
-                            "gr8people", "welcometothejungle",
-                        ])
-                        or ("product" in title_low)
-                    )
-
-                    light_score = score_title_desc(title_candidate, "", company)
-                    desc_text = ""
-
-                    posting_date = ""
-                    if light_score >= RELEVANCY_THRESHOLD and not must_detail:
-                        print(f"[KEEP-LIGHT] {company} | {title_candidate} | score={light_score}")
-                    else:
-                        if light_score <= 0 and not must_detail:
-                            print(f"[DROP-LIGHT] {company} | {title_candidate} score={light_score}")
-                            continue
 
-                        location_candidate, posting_date, desc_text, detail_count = enrich_detail(
-                            page, link, detail_count, location_candidate, ""
-                        )
+                # H1 title override for generic pages
+                try:
+                    detail_html_for_title = fetch_page_content(page, link) or ""
+                    if detail_html_for_title:
+                        s_detail = BeautifulSoup(detail_html_for_title, "lxml")
+                        h1 = s_detail.find("h1")
+                        if h1:
+                            newt = clean_title(h1.get_text(" ", strip=True))
+                            if newt and newt != title_clean:
+                                title_clean = newt
+                except Exception:
+                    pass
 
-                        # Detail-level product filter
-                        if "product" in title_low:
-                            if not any(k in (desc_text or "").lower() for k in PRODUCT_TECH_KEYWORDS):
-                                print(f"[DROP-PRODUCT] {company} | {title_clean}")
-                                continue
-
-                        # H1 title override for generic pages
-                        try:
-                            detail_html_for_title = fetch_page_content(page, link) or ""
-                            if detail_html_for_title:
-                                s_detail = BeautifulSoup(detail_html_for_title, "lxml")
-                                h1 = s_detail.find("h1")
-                                if h1:
-                                    newt = clean_title(h1.get_text(" ", strip=True))
-                                    if newt and newt != title_clean:
-                                        title_clean = newt
-                        except Exception:
-                            pass
-
-                        final_score = score_title_desc(title_clean or title_candidate,
-                                                       desc_text, company)
-                        print(f"[FINAL_SCORE] {company} final={final_score}")
-                        if final_score < RELEVANCY_THRESHOLD:
-                            print(f"[DROP-FINAL] {company} | {title_clean}")
-                            continue
-
-                    final_title, loc_from_title = extract_location_from_text(title_clean)
-                    final_title = clean_title(final_title)
-                    if loc_from_title and not location_candidate:
-                        location_candidate = loc_from_title
-                    final_location = (location_candidate or loc_from_title or "").strip()
-
-                    # Final product filter after cleanup
-                    if "product" in final_title.lower():
-                        if not any(k in (desc_text or "").lower() for k in PRODUCT_TECH_KEYWORDS):
-                            print(f"[DROP-PRODUCT-FINAL] {final_title}")
-                            continue
-
-                    if not should_drop_by_title(final_title):
-                        company_rows.append({
-                            "Company": company,
-                            "Job Title": final_title,
-                            "Job Link": link,
-                            "Location": final_location,
-                            "Posting Date": posting_date if 'posting_date' in dir() else "",
-                            "Days Since Posted": "",
-                            "Description": desc_text[:4000] if desc_text else "",
-                        })
-                    else:
-                        print(f"[DROP] {company} | {final_title}")
+                final_score = score_title_desc(title_clean or title_candidate,
+                                               desc_text, company)
+                print(f"[FINAL_SCORE] {company} final={final_score}")
+                if final_score < RELEVANCY_THRESHOLD:
+                    print(f"[DROP-FINAL] {company} | {title_clean}")
+                    continue
 
-            # Per-company row cap check
-            cap = PER_COMPANY_CAP_OVERRIDES.get(company, PER_COMPANY_ROW_CAP)
-            if len(company_rows) > cap:
-                print(f"[ANOMALY WARNING] {company} produced {len(company_rows)} rows "
-                      f"(cap={cap}). Investigate before trusting this data.")
+            final_title, loc_from_title = extract_location_from_text(title_clean)
+            final_title = clean_title(final_title)
+            if loc_from_title and not location_candidate:
+                location_candidate = loc_from_title
+            final_location = (location_candidate or loc_from_title or "").strip()
 
-            rows.extend(company_rows)
+            # Final product filter after cleanup
+            if "product" in final_title.lower():
+                if not any(k in (desc_text or "").lower() for k in PRODUCT_TECH_KEYWORDS):
+                    print(f"[DROP-PRODUCT-FINAL] {final_title}")
+                    continue
 
-        browser.close()
-    return rows
+            if not should_drop_by_title(final_title):
+                company_count += 1
+                yield {
+                    "Company": company,
+                    "Job Title": final_title,
+                    "Job Link": link,
+                    "Location": final_location,
+                    "Posting Date": posting_date or "",
+                    "Days Since Posted": "",
+                    "Description": desc_text[:4000] if desc_text else "",
+                }
+            else:
+                print(f"[DROP] {company} | {final_title}")
+
+    COMPANY_COSTS.record(company, _time.time() - company_start)
+
+    # Per-company row cap check
+    cap = PER_COMPANY_CAP_OVERRIDES.get(company, PER_COMPANY_ROW_CAP)
+    if company_count > cap:
+        print(f"[ANOMALY WARNING] {company} produced {company_count} rows "
+              f"(cap={cap}). Investigate before trusting this data.")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# ENTRY POINT
+# POST-SCRAPE STAGES  (shared with pipeline.py)
 # ─────────────────────────────────────────────────────────────────────────────
-if __name__ == "__main__":
-    try:
-        all_rows = scrape()
+HARD_FIELDNAMES = [
+    "Company", "Job Title", "Job Link", "Location",
+    "Posting Date", "Days Since Posted", "Seniority",
+    "Description", "First_Seen", "Last_Seen",
+]
 
-        # Seniority
-        for r in all_rows:
-            r["Seniority"] = detect_seniority(r.get("Job Title", ""))
 
-        # Load existing CSV for first_seen tracking
-        repo_root = os.path.dirname(os.path.abspath(__file__))
-        outfile   = os.path.join(repo_root, "jobs_final_hard.csv")
+def default_outfile():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "jobs_final_hard.csv")
 
-        existing_first_seen = {}
-        if os.path.exists(outfile):
-            try:
-                with open(outfile, encoding="utf-8") as f:
-                    for row in csv.DictReader(f):
-                        lk = normalise_url(row.get("Job Link", ""))
-                        if lk and row.get("First_Seen"):
-                            existing_first_seen[lk] = row["First_Seen"]
-            except Exception:
-                pass
 
-        # Deduplication using normalised URLs
-        dedup = {}
-        for r in all_rows:
-            norm_lk = normalise_url(r.get("Job Link", ""))
-            if not norm_lk:
-                continue
-            if norm_lk in dedup:
-                # prefer row with posting date
-                if not dedup[norm_lk].get("Posting Date") and r.get("Posting Date"):
-                    dedup[norm_lk] = r
-                continue
+def subset_path(path):
+    """Where a --companies run writes, so the full nightly CSV is left intact."""
+    root, ext = os.path.splitext(path)
+    return f"{root}_subset{ext}"
 
-            # Days since posted
-            pd = r.get("Posting Date") or ""
-            if pd:
-                try:
-                    r["Days Since Posted"] = str(
-                        (date.today() - datetime.fromisoformat(pd).date()).days)
-                except Exception:
-                    r["Days Since Posted"] = ""
 
-            # Lifecycle columns
-            r["First_Seen"] = existing_first_seen.get(norm_lk, TODAY)
-            r["Last_Seen"]  = TODAY
+def parse_companies(value):
+    return [c for c in (value or "").split(",") if c.strip()]
+
+
+def merge_shards(paths, outfile):
+    """Combine shard CSVs with the usual dedup, First_Seen carry-over and sort."""
+    import sharding
+    rows, incomplete = [], {}
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                shard_rows = list(csv.DictReader(f))
+        except Exception as e:
+            print(f"[WARN] could not read shard {path} -> {e}")
+            continue
+        print(f"[MERGE] {path}: {len(shard_rows)} rows")
+        rows.extend(shard_rows)
+        COMPANY_COSTS.merge_observed(sharding.read_costs(path))
+        incomplete.update(sharding.read_incomplete(path))
+
+    out = finalise_and_persist(rows, incomplete)
+    write_hard_csv(out, outfile)
+    COMPANY_COSTS.save()
+    sharding.publish_costs(COMPANY_COSTS.costs)
+    return out
+
+
+def finalise_and_persist(rows, incomplete=None):
+    """
+    finalise_rows() with First_Seen read from the job store, then record the
+    run there (upserts + closed flags). `incomplete` names companies whose
+    postings must not be closed (default: this process's INCOMPLETE_COMPANIES).
+    Returns the finalised rows.
+    """
+    from job_store import JobStore
+    if incomplete is None:
+        incomplete = INCOMPLETE_COMPANIES
+    store = JobStore()
+    try:
+        store.bootstrap_from_csv(default_outfile(), normalise_url)
+        out = finalise_rows(rows, store.first_seen_lookup())
+        store.record_run(out, TODAY, normalise_url, incomplete)
+    finally:
+        store.close()
+    return out
+
+
+def prepare_row(r):
+    """Row-local fields: seniority and days since posted."""
+    r["Seniority"] = detect_seniority(r.get("Job Title", ""))
+    posted = r.get("Posting Date") or ""
+    r["Days Since Posted"] = ""
+    if posted:
+        try:
+            r["Days Since Posted"] = str(
+                (date.today() - datetime.fromisoformat(posted).date()).days)
+        except Exception:
+            pass
+    return r
+
+
+def finalise_rows(rows, existing_first_seen):
+    """Dedup on normalised URL, stamp lifecycle columns, sort for output."""
+    dedup = {}
+    for r in rows:
+        norm_lk = normalise_url(r.get("Job Link", ""))
+        if not norm_lk:
+            continue
+        if norm_lk in dedup:
+            # prefer row with posting date
+            if not dedup[norm_lk].get("Posting Date") and r.get("Posting Date"):
+                dedup[norm_lk] = r
+            continue
+        dedup[norm_lk] = r
+
+    for norm_lk, r in dedup.items():
+        r["First_Seen"] = existing_first_seen.get(norm_lk, TODAY)
+        r["Last_Seen"]  = TODAY
 
-            dedup[norm_lk] = r
+    return sorted(dedup.values(),
+                  key=lambda x: (x.get("Company","").lower(),
+                                 x.get("Job Title","").lower()))
 
-        out = sorted(dedup.values(),
-                     key=lambda x: (x.get("Company","").lower(),
-                                    x.get("Job Title","").lower()))
 
-        fieldnames = [
-            "Company", "Job Title", "Job Link", "Location",
-            "Posting Date", "Days Since Posted", "Seniority",
-            "Description", "First_Seen", "Last_Seen",
-        ]
+def write_hard_csv(rows, outfile):
+    with open(outfile, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=HARD_FIELDNAMES, extrasaction="ignore")
+        writer.writeheader()
+        for r in rows:
+            writer.writerow({k: r.get(k, "") or "" for k in HARD_FIELDNAMES})
+    print(f"\n[OK] wrote {len(rows)} deduplicated rows -> {outfile}")
 
-        with open(outfile, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-            writer.writeheader()
-            for r in out:
-                writer.writerow({k: r.get(k, "") or "" for k in fieldnames})
 
-        print(f"\n[OK] wrote {len(out)} deduplicated rows -> {outfile}")
+# ─────────────────────────────────────────────────────────────────────────────
+# ENTRY POINT
+# ─────────────────────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    import argparse
+    ap = argparse.ArgumentParser(description="Scrape careers pages into jobs_final_hard.csv.")
+    ap.add_argument("--companies", default="",
+                    help="comma-separated subset, e.g. 'Databricks,MongoDB' "
+                         "(writes jobs_final_hard_subset.csv)")
+    ap.add_argument("--shard", default="", metavar="K/N",
+                    help="scrape only shard K of N and write shards/jobs_final_hard.shard-K-of-N.csv")
+    ap.add_argument("--costs", default=None, metavar="PATH",
+                    help="cost file for the --shard assignment "
+                         "(default: shards/company_cost.json, published by --merge)")
+    ap.add_argument("--merge", nargs="+", metavar="SHARD_CSV",
+                    help="merge shard CSVs into jobs_final_hard.csv and exit")
+    args = ap.parse_args()
+    companies = parse_companies(args.companies)
+    outfile   = default_outfile()
+
+    try:
+        if args.merge:
+            merge_shards(args.merge, outfile)
+        else:
+            target = subset_path(outfile) if companies else outfile
+            if args.shard:
+                import sharding
+                k, n = sharding.parse_shard(args.shard)
+                # Same published costs on every node -> same assignment; local
+                # timings only travel to the merge via the .costs.json sidecar
+                plan = CompanyCostHistory(args.costs or sharding.PUBLISHED_COSTS_FILE,
+                                          read_only=True)
+                COMPANY_COSTS.read_only = True
+                companies = sharding.shard_companies(
+                    select_companies(companies), k, n, plan.cost)
+                target = sharding.shard_path(k, n)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+
+            # An empty shard still writes its (empty) file so the merge sees it
+            all_rows = [prepare_row(r) for r in scrape(companies)] if (
+                companies or not args.shard) else []
+            # Shard nodes leave lifecycle to the merge; their store is not shared
+            out = (finalise_rows(all_rows, {}) if args.shard
+                   else finalise_and_persist(all_rows))
+            write_hard_csv(out, target)
+            if args.shard:
+                sharding.write_costs(target, COMPANY_COSTS.observed)
+                sharding.write_incomplete(target, INCOMPLETE_COMPANIES)
 
     except KeyboardInterrupt:
         print("Interrupted")
@@ -0,0 +1,86 @@
+# pipeline.py — v1.0
+# Pipelined scrape → clean → validate in one process.
+#
+# The browser stays on the main thread (Playwright's sync API is bound to it);
+# as soon as iter_scrape() finishes a company, that company's rows are handed
+# to a worker pool which runs prepare_row + enrich_row and the per-company
+# checks while the browser moves on to the next company. When the last
+# company is scraped only the cross-company dedup, the two CSV writes and the
+# full validator remain.
+#
+# Usage:
+#   python pipeline.py
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import jobs_smart_cplus as scraper
+import clean_jobs_cplus as cleaner
+import validate_output as validator
+import snapshots
+import dashboard_data
+
+# Enrichment is light regex work; threads keep it off the scrape loop without
+# pickling rows across processes.
+ENRICH_WORKERS = 4
+
+
+def process_company(company, rows):
+    """Worker stage: row-local normalisation, enrichment and per-company checks."""
+    start = time.monotonic()
+    for r in rows:
+        scraper.prepare_row(r)
+    cleaner.enrich_rows(rows)
+    for issue in validator.check_company_rows(company, rows):
+        print(f"[PIPELINE WARN] {issue}")
+    print(f"[PIPELINE] {company}: {len(rows)} rows enriched "
+          f"in {time.monotonic() - start:.2f}s")
+    return rows
+
+
+def run_pipelined(hard_outfile=None, enriched_outfile=None, workers=ENRICH_WORKERS,
+                  companies=None):
+    """Scrape with enrichment overlapped; returns the final enriched rows."""
+    repo = os.path.dirname(os.path.abspath(__file__))
+    hard_outfile     = hard_outfile or scraper.default_outfile()
+    enriched_outfile = enriched_outfile or os.path.join(repo, "jobs_cleaned_final_enriched.csv")
+
+    pending, futures = {}, []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        def company_done(company):
+            rows = pending.pop(company, [])
+            if rows:
+                futures.append(pool.submit(process_company, company, rows))
+
+        for r in scraper.iter_scrape(on_company_done=company_done, companies=companies):
+            pending.setdefault(r["Company"], []).append(r)
+
+        # Futures are collected in submission (= company) order so dedup keeps
+        # the same first-occurrence preference as the serial path
+        all_rows = []
+        for fut in futures:
+            try:
+                all_rows.extend(fut.result())
+            except Exception as e:
+                print(f"[PIPELINE ERROR] enrichment failed -> {e}")
+
+    out = scraper.finalise_and_persist(all_rows)
+    scraper.write_hard_csv(out, hard_outfile)
+    cleaner.write_enriched(out, enriched_outfile)
+    return out
+
+
+if __name__ == "__main__":
+    try:
+        started = time.monotonic()
+        out = run_pipelined()
+        print(f"[PIPELINE] scrape + enrich finished in {time.monotonic() - started:.0f}s")
+        validator.validate_rows(out, cleaner.ENRICHED_FIELDNAMES)
+        snapshots.append_snapshot(out)
+        dashboard_data.update(out, scraper.TODAY)
+    except KeyboardInterrupt:
+        print("Interrupted")
+        sys.exit(1)
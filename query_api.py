@@ -0,0 +1,284 @@
+# query_api.py — v1.0
+# Read-only HTTP query API over jobs_cleaned_final_enriched.csv (stdlib only).
+#
+#   GET /jobs?company=&group=&function=&seniority=&skill=
+#            &min_relevancy=&since=&until=&limit=&offset=
+#   GET /facets?<same filters>      value counts per facet for the matches
+#   GET /health
+#
+# Filters are case-insensitive; comma-separated values within one filter are
+# OR-ed, different filters are AND-ed. since/until bound First_Seen
+# (YYYY-MM-DD, inclusive). Results are ordered by Relevancy_to_Actian,
+# highest first.
+#
+# The CSV is loaded once into a relevancy-ordered row list. Facet filters use
+# the index write_enriched() persisted next to it (facet_index.py, ids are CSV
+# row positions), rebuilt in memory only when that file is missing, stale or
+# for a different row count; the whole snapshot is reloaded when the CSV
+# changes. Responses
+# carry an ETag derived from (data version, normalised query), so a matching
+# If-None-Match is answered 304 without running the query, and rendered pages
+# are kept in a small in-process LRU.
+#
+# Usage:
+#   python query_api.py [--host 127.0.0.1] [--port 8765] [--csv PATH]
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from facet_index import FacetIndex, index_path
+
+REPO_ROOT     = os.path.dirname(os.path.abspath(__file__))
+ENRICHED_FILE = os.path.join(REPO_ROOT, "jobs_cleaned_final_enriched.csv")
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT     = 500
+CACHE_SIZE    = 256
+
+# query parameters that are facet_index.FACETS names
+_FILTERS = ("company", "group", "function", "seniority", "skill")
+_PARAMS = set(_FILTERS) | {"min_relevancy", "since", "until", "limit", "offset"}
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+class QueryError(ValueError):
+    pass
+
+
+def _skills(value):
+    try:
+        return json.loads(value or "[]")
+    except Exception:
+        return []
+
+
+def _relevancy(row):
+    try:
+        return float(row.get("Relevancy_to_Actian") or 0)
+    except ValueError:
+        return 0.0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# INDEX
+# ─────────────────────────────────────────────────────────────────────────────
+class JobIndex:
+    """Immutable snapshot of the enriched CSV plus its lookup structures."""
+
+    def __init__(self, path):
+        st = os.stat(path)
+        self.version = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+        with open(path, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        self.facets = self._facet_index(path, rows)
+        for r in rows:
+            r["Extracted_Skills"] = _skills(r.get("Extracted_Skills"))
+            r["Relevancy_to_Actian"] = _relevancy(r)
+
+        # Facet ids are CSV positions; rank maps them to positions in
+        # relevancy order, where results are read from.
+        order = sorted(range(len(rows)), key=lambda i: -rows[i]["Relevancy_to_Actian"])
+        self.rows = [rows[i] for i in order]
+        self.rank = [0] * len(rows)
+        for pos, i in enumerate(order):
+            self.rank[i] = pos
+
+    @staticmethod
+    def _facet_index(path, rows):
+        """The persisted index when it matches this CSV, else one built in memory."""
+        saved = index_path(path)
+        if os.path.exists(saved) and os.path.getmtime(saved) >= os.path.getmtime(path):
+            try:
+                index = FacetIndex.load(saved)
+                if index.n_rows == len(rows):
+                    return index
+            except Exception as e:
+                print(f"[API] could not read {saved} -> {e}")
+        print(f"[API] no current facet index for {path} — building in memory")
+        return FacetIndex.build(rows)
+
+    def _match(self, q):
+        return self.facets.match({p: q[p] for p in _FILTERS if p in q})
+
+    def facet_counts(self, q):
+        """Value counts per facet over postings matching the facet filters."""
+        ids = self._match(q)
+        return {"total": self.facets.n_rows if ids is None else len(ids),
+                "facets": {f: self.facets.counts(f, ids) for f in self.facets.postings}}
+
+    def search(self, q):
+        """q is the normalised query dict from parse_query(). Returns (total, rows)."""
+        ids = self._match(q)
+        candidates = range(len(self.rows)) if ids is None else sorted(self.rank[i] for i in ids)
+
+        min_rel, since, until = q.get("min_relevancy"), q.get("since"), q.get("until")
+        hits = []
+        for i in candidates:
+            r = self.rows[i]
+            if min_rel is not None and r["Relevancy_to_Actian"] < min_rel:
+                break   # relevancy order: nothing further can qualify
+            first = r.get("First_Seen") or ""
+            if (since and first < since) or (until and first > until):
+                continue
+            hits.append(r)
+        offset, limit = q["offset"], q["limit"]
+        return len(hits), hits[offset:offset + limit]
+
+
+def parse_query(query_string):
+    """Validate and normalise a query string into a hashable-ready dict."""
+    raw = parse_qs(query_string, keep_blank_values=False)
+    unknown = set(raw) - _PARAMS
+    if unknown:
+        raise QueryError(f"unknown parameter(s): {', '.join(sorted(unknown))}")
+    q = {}
+    for param in _FILTERS:
+        if param in raw:
+            values = {v.strip().lower() for item in raw[param] for v in item.split(",") if v.strip()}
+            if values:
+                q[param] = sorted(values)
+    try:
+        if "min_relevancy" in raw:
+            q["min_relevancy"] = float(raw["min_relevancy"][-1])
+        q["limit"] = min(int(raw.get("limit", [DEFAULT_LIMIT])[-1]), MAX_LIMIT)
+        q["offset"] = max(int(raw.get("offset", [0])[-1]), 0)
+    except ValueError as e:
+        raise QueryError(str(e))
+    if q["limit"] < 1:
+        raise QueryError("limit must be >= 1")
+    for param in ("since", "until"):
+        if param in raw:
+            value = raw[param][-1].strip()
+            try:
+                if not _DATE_RE.match(value):
+                    raise ValueError
+                date.fromisoformat(value)
+            except ValueError:
+                raise QueryError(f"{param} must be an ISO date (YYYY-MM-DD), got {value!r}")
+            q[param] = value
+    return q
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SERVICE
+# ─────────────────────────────────────────────────────────────────────────────
+class QueryService:
+    """Holds the current JobIndex (reloaded on file change) and the result LRU."""
+
+    def __init__(self, path=ENRICHED_FILE, cache_size=CACHE_SIZE):
+        self.path = path
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._index = None
+        self._cache = OrderedDict()
+
+    def index(self):
+        st = os.stat(self.path)
+        version = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+        with self._lock:
+            if self._index is None or self._index.version != version:
+                self._index = JobIndex(self.path)
+                self._cache.clear()
+                print(f"[API] loaded {len(self._index.rows)} rows (version {self._index.version})")
+            return self._index
+
+    @staticmethod
+    def etag(version, route, q):
+        key = json.dumps([version, route, q], sort_keys=True)
+        return '"' + hashlib.sha1(key.encode()).hexdigest()[:20] + '"'
+
+    def query(self, route, q):
+        """route is "/jobs" or "/facets". Returns (etag, body_bytes), from the LRU when possible."""
+        index = self.index()
+        tag = self.etag(index.version, route, q)
+        with self._lock:
+            if tag in self._cache:
+                self._cache.move_to_end(tag)
+                return tag, self._cache[tag]
+        if route == "/facets":
+            payload = index.facet_counts(q)
+        else:
+            total, rows = index.search(q)
+            payload = {"total": total, "offset": q["offset"], "limit": q["limit"], "rows": rows}
+        body = json.dumps(payload).encode()
+        with self._lock:
+            self._cache[tag] = body
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return tag, body
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service = None   # set by serve()
+
+    def _send(self, status, body=b"", etag=None):
+        self.send_response(status)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if status != 304:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._send(status, json.dumps({"error": message}).encode())
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        try:
+            if url.path == "/health":
+                index = self.service.index()
+                self._send(200, json.dumps({"rows": len(index.rows),
+                                            "version": index.version}).encode())
+            elif url.path in ("/jobs", "/facets"):
+                q = parse_query(url.query)
+                # The ETag depends only on data version + query: check it first
+                tag = self.service.etag(self.service.index().version, url.path, q)
+                if tag in (self.headers.get("If-None-Match") or ""):
+                    self._send(304, etag=tag)
+                    return
+                tag, body = self.service.query(url.path, q)
+                self._send(200, body, etag=tag)
+            else:
+                self._error(404, f"no route {url.path}")
+        except QueryError as e:
+            self._error(400, str(e))
+        except FileNotFoundError:
+            self._error(503, f"{self.service.path} not found — run the pipeline first")
+
+    def log_message(self, fmt, *args):
+        print(f"[API] {self.address_string()} {fmt % args}")
+
+
+def serve(host="127.0.0.1", port=8765, path=ENRICHED_FILE):
+    _Handler.service = QueryService(path)
+    server = ThreadingHTTPServer((host, port), _Handler)
+    print(f"[API] serving {path} on http://{host}:{port}/jobs")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Interrupted")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Read-only query API over the enriched job data.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--csv", default=ENRICHED_FILE)
+    args = ap.parse_args()
+    serve(args.host, args.port, args.csv)
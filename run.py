@@ -0,0 +1,118 @@
+# run.py — v1.0
+# Single-process entry point: scrape → dedup/lifecycle → enrich → validate
+# → history snapshot → dashboard rollups.
+#
+# Rows stay in memory between stages instead of round-tripping through
+# jobs_final_hard.csv and jobs_cleaned_final_enriched.csv; both CSVs are still
+# written at the end so downstream consumers see the same artifacts.
+#
+# Usage:
+#   python run.py                  # stages in series
+#   python run.py --pipelined      # enrichment overlapped with scraping (pipeline.py)
+#   python run.py --profile        # cProfile the whole run -> scrape_state/run.prof
+#   python run.py --companies "Databricks,MongoDB"
+#                                  # subset run -> *_subset.csv, full CSVs untouched
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import time
+
+import jobs_smart_cplus as scraper
+import clean_jobs_cplus as cleaner
+import validate_output as validator
+import pipeline
+import snapshots
+import dashboard_data
+from scrape_health import STATE_DIR
+
+REPO_ROOT        = os.path.dirname(os.path.abspath(__file__))
+HARD_OUTFILE     = os.path.join(REPO_ROOT, "jobs_final_hard.csv")
+ENRICHED_OUTFILE = os.path.join(REPO_ROOT, "jobs_cleaned_final_enriched.csv")
+PROFILE_FILE     = os.path.join(STATE_DIR, "run.prof")
+
+
+class _Stage:
+    """Context manager that prints wall time per stage."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.monotonic()
+        return self
+
+    def __exit__(self, *exc):
+        print(f"[RUN] {self.name} took {time.monotonic() - self.start:.1f}s")
+        return False
+
+
+def _outfiles(companies):
+    if companies:
+        return scraper.subset_path(HARD_OUTFILE), scraper.subset_path(ENRICHED_OUTFILE)
+    return HARD_OUTFILE, ENRICHED_OUTFILE
+
+
+def run_serial(companies=None):
+    hard_outfile, enriched_outfile = _outfiles(companies)
+    with _Stage("scrape"):
+        rows = [scraper.prepare_row(r) for r in scraper.scrape(companies)]
+    with _Stage("dedup + lifecycle"):
+        out = scraper.finalise_and_persist(rows)
+    with _Stage("enrich"):
+        out = cleaner.enrich_rows(out)
+    with _Stage("write"):
+        scraper.write_hard_csv(out, hard_outfile)
+        cleaner.write_enriched(out, enriched_outfile)
+    return out
+
+
+def run(pipelined=False, companies=None):
+    if pipelined:
+        with _Stage("pipelined scrape + enrich"):
+            out = pipeline.run_pipelined(*_outfiles(companies), companies=companies)
+    else:
+        out = run_serial(companies)
+    with _Stage("validate"):
+        validator.validate_rows(out, cleaner.ENRICHED_FIELDNAMES)
+    if not companies:
+        with _Stage("snapshot"):
+            snapshots.append_snapshot(out)
+        with _Stage("dashboard"):
+            dashboard_data.update(out, scraper.TODAY)
+    return out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Scrape, enrich and validate in one process.")
+    ap.add_argument("--pipelined", action="store_true",
+                    help="enrich each company on worker threads while scraping continues")
+    ap.add_argument("--companies", default="",
+                    help="comma-separated subset, e.g. 'Databricks,MongoDB'")
+    ap.add_argument("--profile", nargs="?", const=PROFILE_FILE, default=None, metavar="PATH",
+                    help=f"write cProfile stats (default {PROFILE_FILE})")
+    args = ap.parse_args(argv)
+    companies = scraper.parse_companies(args.companies)
+
+    if not args.profile:
+        run(args.pipelined, companies)
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(run, args.pipelined, companies)
+    finally:
+        os.makedirs(os.path.dirname(os.path.abspath(args.profile)), exist_ok=True)
+        profiler.dump_stats(args.profile)
+        print(f"\n[RUN] profile written -> {args.profile}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("Interrupted")
+        sys.exit(1)
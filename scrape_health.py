@@ -0,0 +1,300 @@
+# scrape_health.py — v1.0
+# Fetch health tracking shared by the scraper and extractors:
+#   1. Per-host circuit breaker — trips after N consecutive failures in a run
+#   2. Cross-run negative cache — failing URLs are retried on a backoff
+#      schedule (1, 2, 4, 8, 14 days) instead of every night
+#   3. Per-host latency histograms — navigation timeouts set at p99 × margin;
+#      a timeout counts as a sample at the timeout, so a slowed host recovers
+#   4. Per-company scrape cost (seconds, EWMA) — used to balance --shard K/N
+
+import json
+import os
+import time
+from datetime import date, timedelta
+from urllib.parse import urlparse
+
+try:
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+except ImportError:
+    PlaywrightTimeoutError = None
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CONFIG
+# ─────────────────────────────────────────────────────────────────────────────
+STATE_DIR           = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scrape_state")
+NEGATIVE_CACHE_FILE = os.path.join(STATE_DIR, "negative_cache.json")
+
+CIRCUIT_BREAKER_THRESHOLD = 3     # consecutive failures per host before skipping
+MAX_BACKOFF_DAYS          = 14
+NEGATIVE_CACHE_TTL_DAYS   = 60    # forget entries that stopped failing long ago
+
+LATENCY_FILE = os.path.join(STATE_DIR, "latency.json")
+
+# Histogram bucket upper edges (ms) — roughly log-spaced
+LATENCY_BUCKETS_MS = [
+    250, 500, 1_000, 2_000, 3_000, 5_000, 7_500, 10_000,
+    15_000, 20_000, 30_000, 45_000, 60_000, 90_000, 120_000,
+]
+TIMEOUT_MARGIN       = 2.0
+TIMEOUT_FLOOR_MS     = 10_000
+TIMEOUT_CEILING_MS   = 90_000
+MIN_LATENCY_SAMPLES  = 5      # below this the caller's default timeout is used
+LATENCY_DAILY_DECAY  = 0.9    # older runs weigh less, so hosts can get faster/slower
+
+COMPANY_COST_FILE    = os.path.join(STATE_DIR, "company_cost.json")
+COMPANY_COST_ALPHA   = 0.5    # weight of the newest observation
+DEFAULT_COMPANY_COST = 60.0   # seconds, for companies never timed
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# HELPERS
+# ─────────────────────────────────────────────────────────────────────────────
+def host_of(url):
+    try:
+        return urlparse(url or "").netloc.lower()
+    except Exception:
+        return ""
+
+
+def cache_key(url):
+    """URL without fragment or trailing slash — query kept (it selects content)."""
+    return (url or "").strip().split("#", 1)[0].rstrip("/")
+
+
+def backoff_days(failures):
+    return min(2 ** max(failures - 1, 0), MAX_BACKOFF_DAYS)
+
+
+def load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[WARN] could not read {path} -> {e}")
+        return default
+
+
+def save_json(path, payload):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# FETCH GUARD
+# ─────────────────────────────────────────────────────────────────────────────
+class FetchGuard:
+    """
+    Decides whether a URL is worth fetching and records the outcome.
+    Circuit state lives for one run; the negative cache is persisted.
+    """
+
+    def __init__(self, path=NEGATIVE_CACHE_FILE, threshold=CIRCUIT_BREAKER_THRESHOLD,
+                 today=None):
+        self.path       = path
+        self.threshold  = threshold
+        self.today      = today or date.today()
+        self.consecutive = {}      # host -> consecutive failures this run
+        self.open_hosts  = set()
+        self.negative    = load_json(path, {})   # key -> {failures, last_failure, next_retry}
+        self.skipped     = 0
+
+    def should_skip(self, url):
+        """Return a short reason string if the URL should not be fetched, else ''."""
+        host = host_of(url)
+        if host in self.open_hosts:
+            self.skipped += 1
+            return f"circuit open for {host}"
+        entry = self.negative.get(cache_key(url))
+        if entry and entry.get("next_retry", "") > self.today.isoformat():
+            self.skipped += 1
+            return (f"negative cache ({entry.get('failures')} failures, "
+                    f"retry {entry['next_retry']})")
+        return ""
+
+    def record_success(self, url):
+        self.consecutive[host_of(url)] = 0
+        self.negative.pop(cache_key(url), None)
+
+    def record_failure(self, url):
+        host = host_of(url)
+        n = self.consecutive.get(host, 0) + 1
+        self.consecutive[host] = n
+        if n >= self.threshold and host not in self.open_hosts:
+            self.open_hosts.add(host)
+            print(f"[CIRCUIT OPEN] {host} after {n} consecutive failures — "
+                  f"skipping its remaining URLs this run")
+
+        key = cache_key(url)
+        entry = self.negative.get(key, {})
+        # Count at most one failure per URL per day
+        if entry.get("last_failure") != self.today.isoformat():
+            failures = entry.get("failures", 0) + 1
+            self.negative[key] = {
+                "failures":     failures,
+                "last_failure": self.today.isoformat(),
+                "next_retry":   (self.today + timedelta(days=backoff_days(failures))).isoformat(),
+            }
+
+    def save(self):
+        cutoff = (self.today - timedelta(days=NEGATIVE_CACHE_TTL_DAYS)).isoformat()
+        self.negative = {k: v for k, v in self.negative.items()
+                         if v.get("last_failure", "") >= cutoff}
+        try:
+            save_json(self.path, self.negative)
+        except Exception as e:
+            print(f"[WARN] could not save negative cache -> {e}")
+        if self.skipped or self.open_hosts:
+            print(f"[HEALTH] skipped {self.skipped} fetches; "
+                  f"open circuits: {', '.join(sorted(self.open_hosts)) or 'none'}")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# LATENCY HISTORY / ADAPTIVE TIMEOUTS
+# ─────────────────────────────────────────────────────────────────────────────
+class LatencyHistory:
+    """
+    Per-host navigation latency histograms persisted across runs.
+    Each host maps to {"counts": [...one per bucket...], "updated": iso date}.
+    """
+
+    def __init__(self, path=LATENCY_FILE, today=None):
+        self.path  = path
+        self.today = (today or date.today()).isoformat()
+        self.hosts = load_json(path, {})
+        self.timed_out = {}    # host -> longest timeout hit this run (ms)
+        for entry in self.hosts.values():
+            if entry.get("updated") != self.today:
+                entry["counts"]  = [c * LATENCY_DAILY_DECAY for c in entry.get("counts", [])]
+                entry["updated"] = self.today      # decay at most once per day
+
+    def record(self, url, elapsed_ms):
+        host = host_of(url)
+        if not host:
+            return
+        entry = self.hosts.setdefault(
+            host, {"counts": [0.0] * len(LATENCY_BUCKETS_MS), "updated": self.today})
+        idx = len(LATENCY_BUCKETS_MS) - 1
+        for i, edge in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= edge:
+                idx = i
+                break
+        entry["counts"][idx] += 1
+        entry["updated"] = self.today
+
+    def record_timeout(self, url, timeout_ms):
+        """
+        A navigation that hit its timeout took *at least* that long. Record it
+        as a sample there, and for the rest of the run start this host at
+        timeout × margin, so the timeout climbs instead of repeating until the
+        circuit breaker trips.
+        """
+        host = host_of(url)
+        if not host:
+            return
+        self.record(url, timeout_ms)
+        self.timed_out[host] = max(self.timed_out.get(host, 0), timeout_ms)
+
+    def percentile(self, url, q=0.99):
+        """Upper bucket edge containing the q-th percentile, or None if too few samples."""
+        counts = self.hosts.get(host_of(url), {}).get("counts") or []
+        total = sum(counts)
+        if total < MIN_LATENCY_SAMPLES:
+            return None
+        running = 0.0
+        for edge, c in zip(LATENCY_BUCKETS_MS, counts):
+            running += c
+            if running >= q * total:
+                return edge
+        return LATENCY_BUCKETS_MS[-1]
+
+    def timeout_for(self, url, default_ms):
+        p99 = self.percentile(url)
+        timeout = default_ms if p99 is None else max(TIMEOUT_FLOOR_MS, p99 * TIMEOUT_MARGIN)
+        hit = self.timed_out.get(host_of(url))
+        if hit:
+            timeout = max(timeout, hit * TIMEOUT_MARGIN)
+        return int(min(TIMEOUT_CEILING_MS, timeout))
+
+    def save(self):
+        payload = {h: {"counts": [round(c, 3) for c in e["counts"]], "updated": e["updated"]}
+                   for h, e in self.hosts.items() if sum(e["counts"]) >= 0.5}
+        try:
+            save_json(self.path, payload)
+        except Exception as e:
+            print(f"[WARN] could not save latency history -> {e}")
+
+
+LATENCY = LatencyHistory()
+
+
+def nav_timeout(url, default_ms):
+    return LATENCY.timeout_for(url, default_ms)
+
+
+def is_timeout(exc):
+    """True for Playwright's own TimeoutError ("Timeout 30000ms exceeded.")."""
+    return PlaywrightTimeoutError is not None and isinstance(exc, PlaywrightTimeoutError)
+
+
+def timed_goto(page, url, default_timeout, wait_until="networkidle"):
+    """page.goto with an adaptive timeout; completions and timeouts feed the histogram."""
+    timeout = nav_timeout(url, default_timeout)
+    start = time.monotonic()
+    try:
+        resp = page.goto(url, timeout=timeout, wait_until=wait_until)
+    except Exception as e:
+        if is_timeout(e):
+            LATENCY.record_timeout(url, timeout)
+        raise
+    LATENCY.record(url, (time.monotonic() - start) * 1000)
+    return resp
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# PER-COMPANY COST
+# ─────────────────────────────────────────────────────────────────────────────
+class CompanyCostHistory:
+    """
+    Wall-clock seconds per company, smoothed across runs.
+    `observed` holds only this run's timings (shard nodes ship it to the merge).
+    A read-only history never writes its file (shard nodes, see sharding.py).
+    """
+
+    def __init__(self, path=COMPANY_COST_FILE, read_only=False):
+        self.path      = path
+        self.costs     = load_json(path, {})
+        self.observed  = {}
+        self.read_only = read_only
+
+    def record(self, company, seconds):
+        self.observed[company] = round(seconds, 1)
+        old = self.costs.get(company)
+        new = seconds if old is None else (
+            COMPANY_COST_ALPHA * seconds + (1 - COMPANY_COST_ALPHA) * old)
+        self.costs[company] = round(new, 1)
+
+    def merge_observed(self, observed):
+        for company, seconds in observed.items():
+            self.record(company, seconds)
+
+    def cost(self, company):
+        if company in self.costs:
+            return self.costs[company]
+        known = sorted(self.costs.values())
+        return known[len(known) // 2] if known else DEFAULT_COMPANY_COST
+
+    def save(self):
+        if self.read_only:
+            return
+        try:
+            save_json(self.path, self.costs)
+        except Exception as e:
+            print(f"[WARN] could not save company costs -> {e}")
+
+
+COMPANY_COSTS = CompanyCostHistory()
@@ -0,0 +1,114 @@
+# sharding.py — v1.0
+# Split the company list across N machines, balanced by historical cost.
+#
+# Every node computes the same assignment from one published cost file,
+# shards/company_cost.json (or --costs PATH): companies are sorted by cost
+# (descending, name as tie-break) and each goes to the currently lightest
+# shard (LPT). Nodes never write cost history; a node scrapes only its shard
+# and writes
+#   shards/jobs_final_hard.shard-K-of-N.csv   + .costs.json / .incomplete.json sidecars
+# and `python jobs_smart_cplus.py --merge shards/*.csv` produces the usual
+# jobs_final_hard.csv (leaving postings of incomplete companies open), folds
+# every cost sidecar into the cost history and
+# re-publishes shards/company_cost.json for the next night's assignment.
+# Commit (or otherwise share) that file so all nodes read the same one;
+# without it every company costs the same and nodes still agree.
+
+import json
+import os
+import re
+
+SHARD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "shards")
+PUBLISHED_COSTS_FILE = os.path.join(SHARD_DIR, "company_cost.json")
+
+_SHARD_RE = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+
+
+def parse_shard(value):
+    """'2/4' -> (2, 4); shards are numbered 1..N."""
+    m = _SHARD_RE.match(value or "")
+    if not m:
+        raise ValueError(f"--shard expects K/N, got {value!r}")
+    k, n = int(m.group(1)), int(m.group(2))
+    if not 1 <= k <= n:
+        raise ValueError(f"--shard {value}: K must be between 1 and N")
+    return k, n
+
+
+def assign_shards(companies, n, cost):
+    """
+    Longest-processing-time assignment. Returns a list of N company lists,
+    each kept in the input order. `cost(company)` returns seconds.
+    """
+    order = {c: i for i, c in enumerate(companies)}
+    loads = [0.0] * n
+    buckets = [[] for _ in range(n)]
+    for company in sorted(companies, key=lambda c: (-cost(c), c)):
+        idx = min(range(n), key=lambda i: (loads[i], i))
+        loads[idx] += cost(company)
+        buckets[idx].append(company)
+    for idx, bucket in enumerate(buckets):
+        bucket.sort(key=order.get)
+        print(f"[SHARD] {idx + 1}/{n}: {len(bucket)} companies, ~{loads[idx]:.0f}s")
+    return buckets
+
+
+def shard_companies(companies, k, n, cost):
+    return assign_shards(list(companies), n, cost)[k - 1]
+
+
+def shard_path(k, n, shard_dir=SHARD_DIR):
+    return os.path.join(shard_dir, f"jobs_final_hard.shard-{k}-of-{n}.csv")
+
+
+def costs_path(csv_path):
+    return os.path.splitext(csv_path)[0] + ".costs.json"
+
+
+def write_costs(csv_path, observed):
+    with open(costs_path(csv_path), "w", encoding="utf-8") as f:
+        json.dump(observed, f, indent=1, sort_keys=True)
+
+
+def publish_costs(costs, path=PUBLISHED_COSTS_FILE):
+    """Written by the merge only; the cost table every node assigns from."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(costs, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+    print(f"[SHARD] published {len(costs)} company costs -> {path}")
+
+
+def read_costs(csv_path):
+    path = costs_path(csv_path)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[WARN] could not read {path} -> {e}")
+        return {}
+
+
+def incomplete_path(csv_path):
+    return os.path.splitext(csv_path)[0] + ".incomplete.json"
+
+
+def write_incomplete(csv_path, incomplete):
+    """Companies this node did not fully scrape (company -> reason)."""
+    with open(incomplete_path(csv_path), "w", encoding="utf-8") as f:
+        json.dump(incomplete, f, indent=1, sort_keys=True)
+
+
+def read_incomplete(csv_path):
+    path = incomplete_path(csv_path)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[WARN] could not read {path} -> {e}")
+        return {}
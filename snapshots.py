@@ -0,0 +1,210 @@
+# snapshots.py — v1.0
+# Append-only daily history of the enriched output as partitioned Parquet.
+#
+#   history/snapshot_date=YYYY-MM-DD/part-<HHMMSS>-<pid>.parquet
+#
+# Low-cardinality columns (Company, Function, Seniority, Company_Group, ...)
+# are dictionary-encoded; read_history() uses pyarrow.dataset so trend
+# queries read only the partitions and columns they ask for. Re-runs on the
+# same day add parts; `compact` folds each day's parts into one file, the
+# newest run winning for duplicate Job Links. CI compacts before committing,
+# so git only ever holds one part-compacted.parquet per day.
+#
+# pyarrow is optional: without it the run still completes, minus the snapshot.
+#
+# Usage:
+#   python snapshots.py compact
+#   python snapshots.py info
+
+import argparse
+import glob
+import json
+import os
+import time
+from datetime import date
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = ds = pq = None
+
+HISTORY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history")
+PARTITION_KEY = "snapshot_date"
+COMPACTED_NAME = "part-compacted.parquet"
+
+_DICT_STRING = ("Company", "Function", "Seniority", "Company_Group",
+                "Product_Focus", "Primary_Skill")
+_PLAIN_STRING = ("Job Title", "Job Link", "Location", "Posting Date",
+                 "Skills_in_Title", "First_Seen", "Last_Seen")
+_FLOAT = ("Relevancy_to_Actian", "Trend_Score")
+
+
+def available():
+    return pa is not None
+
+
+def snapshot_schema():
+    fields = [pa.field(c, pa.dictionary(pa.int32(), pa.string())) for c in _DICT_STRING]
+    fields += [pa.field(c, pa.string()) for c in _PLAIN_STRING]
+    fields += [pa.field("Days Since Posted", pa.int32()),
+               pa.field("Extracted_Skills", pa.list_(pa.string()))]
+    fields += [pa.field(c, pa.float32()) for c in _FLOAT]
+    return pa.schema(fields)
+
+
+def _to_int(v):
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(v):
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def _skills(v):
+    if isinstance(v, list):
+        return v
+    if not v:
+        return []
+    try:
+        return list(json.loads(v))
+    except Exception:
+        return []
+
+
+def rows_to_table(rows):
+    """Enriched row dicts (in-memory or read back from CSV) -> Arrow table."""
+    schema = snapshot_schema()
+    cols = {}
+    for c in _DICT_STRING + _PLAIN_STRING:
+        cols[c] = [str(r.get(c) or "") for r in rows]
+    cols["Days Since Posted"] = [_to_int(r.get("Days Since Posted")) for r in rows]
+    cols["Extracted_Skills"]  = [_skills(r.get("Extracted_Skills")) for r in rows]
+    for c in _FLOAT:
+        cols[c] = [_to_float(r.get(c)) for r in rows]
+    arrays = []
+    for field in schema:
+        values = cols[field.name]
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def partition_dir(snapshot_date, history_dir=HISTORY_DIR):
+    return os.path.join(history_dir, f"{PARTITION_KEY}={snapshot_date}")
+
+
+def append_snapshot(rows, snapshot_date=None, history_dir=HISTORY_DIR):
+    """Write this run's rows as a new part in today's partition. Returns the path."""
+    if not available():
+        print("[SNAPSHOT] pyarrow not installed — skipping history snapshot")
+        return None
+    snapshot_date = snapshot_date or date.today().isoformat()
+    part_dir = partition_dir(snapshot_date, history_dir)
+    os.makedirs(part_dir, exist_ok=True)
+    path = os.path.join(part_dir, f"part-{time.strftime('%H%M%S')}-{os.getpid()}.parquet")
+    pq.write_table(rows_to_table(rows), path, compression="zstd")
+    print(f"[SNAPSHOT] {len(rows)} rows -> {path}")
+    return path
+
+
+def history_dataset(history_dir=HISTORY_DIR):
+    partitioning = ds.partitioning(pa.schema([(PARTITION_KEY, pa.string())]), flavor="hive")
+    return ds.dataset(history_dir, format="parquet", partitioning=partitioning,
+                      schema=snapshot_schema().append(pa.field(PARTITION_KEY, pa.string())))
+
+
+def read_history(columns=None, since=None, until=None, history_dir=HISTORY_DIR):
+    """
+    Arrow table of snapshots, optionally limited to `columns` and an ISO date
+    range (inclusive). Partition pruning means untouched days are never opened.
+    """
+    if not available():
+        raise RuntimeError("pyarrow is required to read snapshot history")
+    if not os.path.isdir(history_dir):
+        return None
+    expr = None
+    if since:
+        expr = ds.field(PARTITION_KEY) >= since
+    if until:
+        cond = ds.field(PARTITION_KEY) <= until
+        expr = cond if expr is None else expr & cond
+    cols = None if columns is None else list(dict.fromkeys(list(columns) + [PARTITION_KEY]))
+    return history_dataset(history_dir).to_table(columns=cols, filter=expr)
+
+
+def snapshot_dates(history_dir=HISTORY_DIR):
+    prefix = f"{PARTITION_KEY}="
+    return sorted(d[len(prefix):] for d in os.listdir(history_dir)
+                  if d.startswith(prefix)) if os.path.isdir(history_dir) else []
+
+
+def compact(history_dir=HISTORY_DIR):
+    """Fold each day's parts into one file; the newest part wins per Job Link."""
+    if not available():
+        print("[SNAPSHOT] pyarrow not installed — nothing to compact")
+        return 0
+    compacted = 0
+    for day in snapshot_dates(history_dir):
+        part_dir = partition_dir(day, history_dir)
+        parts = sorted(glob.glob(os.path.join(part_dir, "*.parquet")))
+        target = os.path.join(part_dir, COMPACTED_NAME)
+        if len(parts) == 1 and parts[0] != target:
+            # A lone run part only needs the stable name
+            os.replace(parts[0], target)
+            compacted += 1
+            continue
+        if len(parts) < 2:
+            continue
+        # part-compacted sorts after part-HHMMSS, but it is always older
+        parts.sort(key=lambda p: (os.path.basename(p) != COMPACTED_NAME, p))
+        tables = [pq.read_table(p, schema=snapshot_schema()) for p in parts]
+
+        keep, seen = [], set()
+        offset = sum(t.num_rows for t in tables)
+        for t in reversed(tables):
+            offset -= t.num_rows
+            links = t.column("Job Link").to_pylist()
+            for i in range(t.num_rows - 1, -1, -1):
+                if links[i] not in seen:
+                    seen.add(links[i])
+                    keep.append(offset + i)
+        merged = pa.concat_tables(tables).take(pa.array(sorted(keep)))
+
+        pq.write_table(merged, target + ".tmp", compression="zstd")
+        os.replace(target + ".tmp", target)
+        for p in parts:
+            if p != target:
+                os.remove(p)
+        print(f"[SNAPSHOT] {day}: {len(parts)} parts -> {merged.num_rows} rows")
+        compacted += 1
+    return compacted
+
+
+def info(history_dir=HISTORY_DIR):
+    for day in snapshot_dates(history_dir):
+        parts = glob.glob(os.path.join(partition_dir(day, history_dir), "*.parquet"))
+        size = sum(os.path.getsize(p) for p in parts)
+        rows = sum(pq.ParquetFile(p).metadata.num_rows for p in parts) if available() else "?"
+        print(f"  {day}  parts={len(parts):<3} rows={rows:<6} {size / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Parquet snapshot history.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("compact", help="merge each day's parts into one file")
+    sub.add_parser("info", help="list partitions")
+    args = ap.parse_args()
+    if args.cmd == "compact":
+        compact()
+    elif args.cmd == "info":
+        info()
@@ -1,95 +1,116 @@
-# special_extractors_deep/__init__.py — v3.0
-# Master registry. All extractors return list of 5-tuples:
+# special_extractors_deep/__init__.py — v4.0
+# Master registry (lazy). Company name -> (module, function, needs_browser);
+# an extractor module is imported on first lookup, so single-company runs
+# only pay for the modules they use. needs_browser=False marks extractors
+# whose primary path never touches the listing soup or the Playwright page;
+# they get soup=None and a page that only launches Chromium if a fallback
+# or detail fetch uses it.
+#
+# Extractors return (or yield, as generators) JobPosting records or legacy
+# 5-tuples:
 #   (job_link, title, description, location, posting_date)
 # Shorter tuples (2 or 3) are accepted but 5-tuples give richer enrichment.
+# iter_postings() adapts any of these lazily for scrape().
 #
 # ATS coverage:
-#   Greenhouse API  : Databricks, Collibra, Fivetran, Datadog, MongoDB, Boomi, Anomalo
+#   Greenhouse API  : Databricks, Collibra, Fivetran, MongoDB, Boomi, Zilliz (streamed — _greenhouse.py)
 #   Lever API       : Matillion
 #   Ashby API       : Atlan, Anomalo, Monte Carlo
-#   Workday cxs API : Alteryx, Teradata
-#   Playwright DOM  : Snowflake, Salesforce, IBM, Oracle, Sifflet + all others
-
-from .alteryx     import extract_alteryx
-from .amazon      import extract_amazon
-from .anomalo     import extract_anomalo
-from .ataccama    import extract_ataccama
-from .atlan       import extract_atlan
-from .bigeye      import extract_bigeye
-from .boomi       import extract_boomi
-from .cloudera    import extract_cloudera
-from .collibra    import extract_collibra
-from .couchbase   import extract_couchbase
-from .dataworld   import extract_dataworld
-from .databricks  import extract_databricks
-from .datadog     import extract_datadog
-from .decube      import extract_decube
-from .exasol      import extract_exasol
-from .firebolt    import extract_firebolt
-from .fivetran    import extract_fivetran
-from .ibm         import extract_ibm
-from .informatica import extract_informatica
-from .influxdata  import extract_influxdata
-from .matillion   import extract_matillion
-from .mongodb     import extract_mongodb
-from .montecarlo  import extract_montecarlo
-from .oracle      import extract_oracle
-from .pentaho     import extract_pentaho
-from .pinecone    import extract_pinecone           # NEW — vector DB
-from .precisely   import extract_precisely
-from .qdrant      import extract_qdrant             # NEW — vector DB
-from .qlik        import extract_qlik
-from .sifflet     import extract_sifflet
-from .solidatus   import extract_solidatus
-from .syniti      import extract_syniti
-from .teradata    import extract_teradata
-from .vertica     import extract_vertica
-from .weaviate    import extract_weaviate           # NEW — vector DB
-from .yellowbrick import extract_yellowbrick
-from .zilliz      import extract_zilliz             # NEW — Milvus/Zilliz
-from .sap         import extract_sap
-from .salesforce  import extract_salesforce
-from .snowflake   import extract_snowflake
-
-SPECIAL_EXTRACTORS_DEEP = {
-    "Alteryx":     extract_alteryx,
-    "Amazon":      extract_amazon,
-    "Anomalo":     extract_anomalo,
-    "Ataccama":    extract_ataccama,
-    "Atlan":       extract_atlan,
-    "BigEye":      extract_bigeye,
-    "Boomi":       extract_boomi,
-    "Cloudera":    extract_cloudera,
-    "Collibra":    extract_collibra,
-    "Couchbase":   extract_couchbase,
-    "Data.World":  extract_dataworld,
-    "Databricks":  extract_databricks,
-    "Datadog":     extract_datadog,
-    "Decube":      extract_decube,
-    "Exasol":      extract_exasol,
-    "Firebolt":    extract_firebolt,
-    "Fivetran":    extract_fivetran,
-    "IBM":         extract_ibm,
-    "Informatica": extract_informatica,
-    "InfluxData":  extract_influxdata,
-    "Matillion":   extract_matillion,
-    "MongoDB":     extract_mongodb,
-    "Monte Carlo": extract_montecarlo,
-    "Oracle":      extract_oracle,
-    "Pentaho":     extract_pentaho,
-    "Pinecone":    extract_pinecone,                # NEW
-    "Precisely":   extract_precisely,
-    "Qdrant":      extract_qdrant,                  # NEW
-    "Qlik":        extract_qlik,
-    "Sifflet":     extract_sifflet,
-    "Solidatus":   extract_solidatus,
-    "Syniti":      extract_syniti,
-    "Teradata":    extract_teradata,
-    "Vertica":     extract_vertica,
-    "Weaviate":    extract_weaviate,                # NEW
-    "Yellowbrick": extract_yellowbrick,
-    "Zilliz":      extract_zilliz,                  # NEW — covers Milvus
-    "SAP":         extract_sap,
-    "Salesforce":  extract_salesforce,
-    "Snowflake":   extract_snowflake,
+#   Workday cxs API : Alteryx, Teradata (POST search, pooled pages — _workday.py)
+#   Amazon search   : Amazon (category[] facets, pooled pages)
+#   SuccessFactors  : SAP (startrow= pages over HTTP — _successfactors.py)
+#   Oracle RC REST  : Oracle (recruitingCEJobRequisitions — _oracle_rc.py)
+#   Playwright DOM  : Snowflake, Salesforce, IBM, Sifflet + all others
+#                     (Oracle only when its REST search returns nothing)
+
+import importlib
+from collections.abc import Mapping
+
+from .posting     import JobPosting, iter_postings
+
+__all__ = ["SPECIAL_EXTRACTORS_DEEP", "JobPosting", "iter_postings", "needs_browser"]
+
+_REGISTRY = {
+    "Alteryx":     ("alteryx",     "extract_alteryx",     False),
+    "Amazon":      ("amazon",      "extract_amazon",      False),
+    "Anomalo":     ("anomalo",     "extract_anomalo",     True),    # DOM fallback
+    "Ataccama":    ("ataccama",    "extract_ataccama",    True),
+    "Atlan":       ("atlan",       "extract_atlan",       True),    # DOM fallback
+    "BigEye":      ("bigeye",      "extract_bigeye",      False),
+    "Boomi":       ("boomi",       "extract_boomi",       False),
+    "Cloudera":    ("cloudera",    "extract_cloudera",    True),
+    "Collibra":    ("collibra",    "extract_collibra",    False),
+    "Couchbase":   ("couchbase",   "extract_couchbase",   True),
+    "Data.World":  ("dataworld",   "extract_dataworld",   True),
+    "Databricks":  ("databricks",  "extract_databricks",  False),
+    "Datadog":     ("datadog",     "extract_datadog",     True),
+    "Decube":      ("decube",      "extract_decube",      True),
+    "Exasol":      ("exasol",      "extract_exasol",      True),
+    "Firebolt":    ("firebolt",    "extract_firebolt",    True),
+    "Fivetran":    ("fivetran",    "extract_fivetran",    False),
+    "IBM":         ("ibm",         "extract_ibm",         True),
+    "Informatica": ("informatica", "extract_informatica", True),
+    "InfluxData":  ("influxdata",  "extract_influxdata",  True),
+    "Matillion":   ("matillion",   "extract_matillion",   False),
+    "MongoDB":     ("mongodb",     "extract_mongodb",     False),
+    "Monte Carlo": ("montecarlo",  "extract_montecarlo",  True),    # soup fallback
+    "Oracle":      ("oracle",      "extract_oracle",      False),   # DOM fallback renders itself
+    "Pentaho":     ("pentaho",     "extract_pentaho",     True),
+    "Pinecone":    ("pinecone",    "extract_pinecone",    True),    # DOM fallback
+    "Precisely":   ("precisely",   "extract_precisely",   True),
+    "Qdrant":      ("qdrant",      "extract_qdrant",      True),
+    "Qlik":        ("qlik",        "extract_qlik",        True),
+    "Sifflet":     ("sifflet",     "extract_sifflet",     True),
+    "Solidatus":   ("solidatus",   "extract_solidatus",   True),
+    "Syniti":      ("syniti",      "extract_syniti",      True),
+    "Teradata":    ("teradata",    "extract_teradata",    False),   # DOM fallback renders itself
+    "Vertica":     ("vertica",     "extract_vertica",     True),
+    "Weaviate":    ("weaviate",    "extract_weaviate",    True),
+    "Yellowbrick": ("yellowbrick", "extract_yellowbrick", True),
+    "Zilliz":      ("zilliz",      "extract_zilliz",      False),   # covers Milvus
+    "SAP":         ("sap",         "extract_sap",         False),   # listing fallback renders itself
+    "Salesforce":  ("salesforce",  "extract_salesforce",  True),
+    "Snowflake":   ("snowflake",   "extract_snowflake",   True),
 }
+
+
+class _LazyExtractors(Mapping):
+    """Read-only company -> extractor mapping that imports modules on first use."""
+
+    def __init__(self, registry):
+        self._registry = registry
+        self._loaded   = {}
+
+    def __getitem__(self, company):
+        fn = self._loaded.get(company)
+        if fn is None:
+            module, attr, _ = self._registry[company]
+            fn = getattr(importlib.import_module(f".{module}", __name__), attr)
+            self._loaded[company] = fn
+        return fn
+
+    def __contains__(self, company):
+        return company in self._registry
+
+    def __iter__(self):
+        return iter(self._registry)
+
+    def __len__(self):
+        return len(self._registry)
+
+
+SPECIAL_EXTRACTORS_DEEP = _LazyExtractors(_REGISTRY)
+
+
+def needs_browser(company):
+    """False for registered extractors that need no pre-rendered listing soup."""
+    entry = _REGISTRY.get(company)
+    return entry[2] if entry else True
+
+
+def __getattr__(name):
+    # Keep `from special_extractors_deep import extract_x` working
+    for module, attr, _ in _REGISTRY.values():
+        if attr == name:
+            return getattr(importlib.import_module(f".{module}", __name__), attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
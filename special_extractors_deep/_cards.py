@@ -0,0 +1,193 @@
+# special_extractors_deep/_cards.py — v1.0
+# In-page job-card extraction for DOM extractors.
+#
+# A small selector spec is evaluated inside the browser with page.evaluate and
+# only a compact [{href, title, location}] array crosses back to Python, instead
+# of serialising the whole rendered DOM with page.content() and re-parsing it
+# with BeautifulSoup. cards_from_soup() applies the same spec to an already
+# parsed soup and is used when in-page evaluation is unavailable.
+#
+# Spec keys:
+#   anchors           : selectors tried in order (job links)
+#   first_match_only  : stop after the first selector that yields cards
+#   card              : selectors for the nearest ancestor card, tried in order
+#   heading           : heading selector inside the card (title fallback)
+#   heading_first     : prefer the card heading over the anchor text
+#   min_title_len     : shorter titles fall back to the heading, then are dropped
+#   location          : selectors inside the card, tried in order
+#   location_pattern  : optional regex a location text must match (case-insensitive)
+#   location_max_len  : optional max location length
+#   href_pattern      : optional regex the absolute link must match
+#   text_pattern      : optional regex the title must match (case-insensitive)
+
+import re
+from urllib.parse import urljoin
+
+_CARDS_JS = r"""
+(spec) => {
+  const clean = (s) => (s || "").replace(/\s+/g, " ").trim();
+  // Text nodes joined with a space, like get_text(" ") in cards_from_soup —
+  // textContent would glue "Engineer" and "Remote" in sibling spans together
+  const text = (el) => {
+    const parts = [];
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    for (let n = walker.nextNode(); n; n = walker.nextNode()) {
+      const t = n.nodeValue.trim();
+      if (t) parts.push(t);
+    }
+    return clean(parts.join(" "));
+  };
+  const hrefRe = spec.href_pattern ? new RegExp(spec.href_pattern) : null;
+  const textRe = spec.text_pattern ? new RegExp(spec.text_pattern, "i") : null;
+  const locRe  = spec.location_pattern ? new RegExp(spec.location_pattern, "i") : null;
+  const minLen = spec.min_title_len || 0;
+  const maxLoc = spec.location_max_len || 0;
+  const out = [];
+  const seen = new Set();
+
+  for (const sel of spec.anchors || []) {
+    let found = 0;
+    for (const a of document.querySelectorAll(sel)) {
+      const raw = (a.getAttribute("href") || "").trim();
+      if (!raw) continue;
+      const href = a.href || raw;
+      if (hrefRe && !hrefRe.test(href)) continue;
+      if (seen.has(href)) continue;
+      seen.add(href);
+
+      let card = null;
+      const parent = a.parentElement;
+      for (const c of spec.card || []) {
+        card = parent ? parent.closest(c) : null;
+        if (card) break;
+      }
+      const heading = () => {
+        const h = card && spec.heading ? card.querySelector(spec.heading) : null;
+        return h ? text(h) : "";
+      };
+
+      let title = "";
+      if (spec.heading_first) {
+        title = heading() || text(a);
+      } else {
+        title = text(a);
+        if (title.length < minLen) title = heading() || title;
+      }
+      if (!title || title.length < minLen) continue;
+      if (textRe && !textRe.test(title)) continue;
+
+      let location = "";
+      if (card) {
+        outer:
+        for (const ls of spec.location || []) {
+          for (const el of card.querySelectorAll(ls)) {
+            const t = text(el);
+            if (locRe && !(t && locRe.test(t))) continue;
+            if (maxLoc && t.length >= maxLoc) continue;
+            location = t;
+            break outer;
+          }
+        }
+      }
+      out.push({href, title, location});
+      found++;
+    }
+    if (found && spec.first_match_only) break;
+  }
+  return out;
+}
+"""
+
+
+def _clean(s):
+    return re.sub(r"\s+", " ", s or "").strip()
+
+
+def cards_from_soup(soup, spec, base_url):
+    """Python mirror of _CARDS_JS for an already-parsed BeautifulSoup document."""
+    href_re = re.compile(spec["href_pattern"]) if spec.get("href_pattern") else None
+    text_re = re.compile(spec["text_pattern"], re.I) if spec.get("text_pattern") else None
+    loc_re  = re.compile(spec["location_pattern"], re.I) if spec.get("location_pattern") else None
+    min_len = spec.get("min_title_len", 0)
+    max_loc = spec.get("location_max_len", 0)
+    out, seen = [], set()
+
+    for sel in spec.get("anchors", []):
+        found = 0
+        for a in soup.select(sel):
+            raw = (a.get("href") or "").strip()
+            if not raw:
+                continue
+            href = urljoin(base_url, raw)
+            if href_re and not href_re.search(href):
+                continue
+            if href in seen:
+                continue
+            seen.add(href)
+
+            card = None
+            for c in spec.get("card", []):
+                card = _closest(a, c)
+                if card:
+                    break
+
+            def heading():
+                h = card.select_one(spec["heading"]) if card and spec.get("heading") else None
+                return _clean(h.get_text(" ", strip=True)) if h else ""
+
+            if spec.get("heading_first"):
+                title = heading() or _clean(a.get_text(" ", strip=True))
+            else:
+                title = _clean(a.get_text(" ", strip=True))
+                if len(title) < min_len:
+                    title = heading() or title
+            if not title or len(title) < min_len:
+                continue
+            if text_re and not text_re.search(title):
+                continue
+
+            location = _card_location(card, spec, loc_re, max_loc) if card else ""
+            out.append({"href": href, "title": title, "location": location})
+            found += 1
+        if found and spec.get("first_match_only"):
+            break
+    return out
+
+
+def _card_location(card, spec, loc_re, max_loc):
+    for ls in spec.get("location", []):
+        for el in card.select(ls):
+            t = _clean(el.get_text(" ", strip=True))
+            if loc_re and not (t and loc_re.search(t)):
+                continue
+            if max_loc and len(t) >= max_loc:
+                continue
+            return t
+    return ""
+
+
+def _closest(el, selector):
+    """Nearest ancestor (excluding el) matching a CSS selector."""
+    for parent in el.parents:
+        if getattr(parent, "name", None) in (None, "[document]"):
+            break
+        try:
+            if parent.css.match(selector):
+                return parent
+        except Exception:
+            return None
+    return None
+
+
+def extract_cards(page, spec, soup=None, base_url=""):
+    """
+    Evaluate `spec` in the current page; fall back to parsing `soup`
+    when in-page evaluation is unavailable.
+    """
+    try:
+        return page.evaluate(_CARDS_JS, spec) or []
+    except Exception as e:
+        print(f"[CARDS] in-page extraction failed -> {e}")
+    if soup is None:
+        return []
+    return cards_from_soup(soup, spec, base_url)
@@ -0,0 +1,50 @@
+# special_extractors_deep/_greenhouse.py — v1.0
+# Greenhouse job-board API adapter.
+# ?content=true boards carry full HTML descriptions and run to several MB for
+# large companies, so the response is parsed as a stream: each job is
+# filtered and text-stripped as soon as it arrives instead of after r.json()
+# has materialised the whole board. Extractors built on it are generators.
+
+from bs4 import BeautifulSoup
+from ._http import stream_json_array
+from .posting import JobPosting
+
+GREENHOUSE_API = "https://boards-api.greenhouse.io/v1/boards/{board}/jobs"
+
+
+def iter_board_jobs(board, content=True):
+    """Yield raw job dicts from a Greenhouse board as the response downloads."""
+    params = {"content": "true"} if content else None
+    yield from stream_json_array(GREENHOUSE_API.format(board=board), "jobs", params=params)
+
+
+def greenhouse_posting(job):
+    """Map one raw job dict to a JobPosting, or None."""
+    title = (job.get("title") or "").strip()
+    link  = (job.get("absolute_url") or "").strip()
+    if not title or not link:
+        return None
+
+    loc = ""
+    loc_data = job.get("location")
+    if isinstance(loc_data, dict):
+        loc = loc_data.get("name", "")
+
+    # Use first_published_at (actual public posting date)
+    # Fall back to updated_at only if unavailable
+    posting_date = ""
+    for date_field in ("first_published_at", "updated_at"):
+        raw = job.get(date_field, "")
+        if raw:
+            posting_date = raw.split("T")[0]
+            break
+
+    desc_text = ""
+    desc_html = job.get("content", "")
+    if desc_html:
+        try:
+            desc_text = BeautifulSoup(desc_html, "lxml").get_text(" ", strip=True)[:4000]
+        except Exception:
+            pass
+
+    return JobPosting(link, title, desc_text, loc, posting_date)
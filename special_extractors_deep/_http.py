@@ -0,0 +1,175 @@
+# special_extractors_deep/_http.py — v1.0
+# Shared pooled HTTP session for API extractors.
+#   - one keep-alive connection pool per host instead of a fresh
+#     connection per requests.get()
+#   - retries with backoff on 429 / 5xx
+#   - at most HTTP_POOL_SIZE requests in flight across all threads, however
+#     fetch_concurrently() calls are nested
+#   - fetch_concurrently() for independent page fetches (offsets, keywords)
+#   - stream_json_array() parses big board payloads one element at a time
+
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_POOL_SIZE   = 16
+HTTP_WORKERS     = 6
+HTTP_TIMEOUT     = 20
+DEFAULT_HEADERS  = {"User-Agent": "Mozilla/5.0", "Accept": "application/json"}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class _BoundedSession(requests.Session):
+    """Session whose requests wait for a free pool slot instead of overflowing it."""
+
+    def __init__(self, limit):
+        super().__init__()
+        self._slots = threading.BoundedSemaphore(limit)
+
+    def request(self, *args, **kwargs):
+        with self._slots:
+            return super().request(*args, **kwargs)
+
+
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(total=2, backoff_factor=0.5,
+                          status_forcelist=(429, 500, 502, 503, 504),
+                          allowed_methods=None)
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE,
+                                  pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+            s = _BoundedSession(HTTP_POOL_SIZE)
+            s.headers.update(DEFAULT_HEADERS)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _session = s
+        return _session
+
+
+def fetch_concurrently(fn, args, max_workers=HTTP_WORKERS):
+    """Map fn over args on a small thread pool; results keep the order of args."""
+    args = list(args)
+    if len(args) <= 1:
+        return [fn(a) for a in args]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(args))) as pool:
+        return list(pool.map(fn, args))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# STREAMING JSON
+# ─────────────────────────────────────────────────────────────────────────────
+STREAM_CHUNK_CHARS = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WS = " \t\r\n"
+
+
+def iter_json_array(chunks, key=None):
+    """
+    Incrementally yield the elements of a JSON array from an iterable of text
+    chunks — the top-level array, or the array under top-level `key` (a key
+    of the same name inside a nested object is not a match).
+    Only the element currently being parsed is held in memory.
+    """
+    buf = ""
+    chunks = iter(chunks)
+    exhausted = False
+
+    def more():
+        nonlocal buf, exhausted
+        try:
+            buf += next(chunks)
+            return True
+        except StopIteration:
+            exhausted = True
+            return False
+
+    # Locate the opening bracket of the wanted array
+    if key is None:
+        while not buf.lstrip(_WS):
+            if not more():
+                return
+        buf = buf.lstrip(_WS)
+        if buf[0] != "[":
+            return
+        buf = buf[1:]
+    else:
+        # Scan outside string literals, tracking depth; only a `"key": [` whose
+        # key string sits directly in the top-level object opens the array
+        target = json.dumps(key, ensure_ascii=False)[1:-1]
+        depth, in_str, escaped, after_colon = 0, False, False, False
+        last_key, i = "", 0
+        while True:
+            if i == len(buf):
+                buf, i = "", 0
+                if not more():
+                    return
+            ch = buf[i]
+            i += 1
+            if in_str:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_str = False
+                    continue
+                if depth == 1 and len(last_key) <= len(target):
+                    last_key += ch
+            elif ch == '"':
+                in_str, last_key, after_colon = True, "", False
+            elif ch == ":":
+                after_colon = depth == 1
+            elif ch in "{[":
+                if ch == "[" and after_colon and last_key == target:
+                    buf = buf[i:]
+                    break
+                depth += 1
+                after_colon = False
+            elif ch in "}]":
+                depth -= 1
+                after_colon = False
+            elif ch not in _WS:
+                after_colon = False
+
+    while True:
+        buf = buf.lstrip(_WS + ",")
+        if not buf:
+            if not more():
+                raise ValueError("truncated JSON array")
+            continue
+        if buf[0] == "]":
+            return
+        try:
+            item, end = _decoder.raw_decode(buf)
+        except json.JSONDecodeError:
+            if exhausted or not more():
+                raise
+            continue
+        # Objects, arrays and strings are self-delimiting; a number can be cut
+        # mid-token ("12" | "3.5e7"), so only trust it once a delimiter follows
+        if buf[0] not in "{[\"" and (end == len(buf) or buf[end] not in _WS + ",]"):
+            if not exhausted and more():
+                continue
+            if end != len(buf):
+                raise ValueError(f"malformed JSON array element near {buf[:40]!r}")
+        buf = buf[end:]
+        yield item
+
+
+def stream_json_array(url, key=None, params=None):
+    """GET `url` and yield array elements as the body downloads."""
+    with get_session().get(url, params=params, stream=True, timeout=HTTP_TIMEOUT) as r:
+        r.raise_for_status()
+        r.encoding = r.encoding or "utf-8"
+        yield from iter_json_array(
+            r.iter_content(chunk_size=STREAM_CHUNK_CHARS, decode_unicode=True), key)
@@ -0,0 +1,80 @@
+# special_extractors_deep/_oracle_rc.py — v1.0
+# Oracle Recruiting Cloud (HCM candidate experience) REST adapter.
+# Queries recruitingCEJobRequisitions with keyword filtering and offset
+# pagination; pages after the first are fetched concurrently. Any company on
+# Oracle Recruiting Cloud can use it with its own host / site number /
+# public job URL.
+
+from bs4 import BeautifulSoup
+from ._http import get_session, fetch_concurrently, HTTP_TIMEOUT
+
+ORC_PAGE_SIZE = 25
+ORC_MAX_ROWS  = 1000
+ORC_EXPAND    = ("requisitionList.secondaryLocations,flexFieldsFacet.values,"
+                 "requisitionList.requisitionFlexFields")
+
+
+def _finder(site_number, keyword, offset):
+    parts = [
+        f"siteNumber={site_number}",
+        "facetsList=LOCATIONS;WORK_LOCATIONS;WORKPLACE_TYPES;TITLES;CATEGORIES;"
+        "ORGANIZATIONS;POSTING_DATES;FLEX_FIELDS",
+        f"limit={ORC_PAGE_SIZE}",
+        f"offset={offset}",
+        "sortBy=POSTING_DATES_DESC",
+    ]
+    if keyword:
+        parts.insert(1, f'keyword="{keyword}"')
+    return "findReqs;" + ",".join(parts)
+
+
+def oracle_requisitions(host, site_number, keyword="", label="Oracle", max_rows=ORC_MAX_ROWS):
+    """Requisitions (raw dicts) for one keyword search, newest first, at most `max_rows`."""
+    api = f"{host}/hcmRestApi/resources/latest/recruitingCEJobRequisitions"
+    session = get_session()
+
+    def fetch(offset):
+        params = {"onlyData": "true", "expand": ORC_EXPAND,
+                  "finder": _finder(site_number, keyword, offset)}
+        try:
+            r = session.get(api, params=params, timeout=HTTP_TIMEOUT)
+            r.raise_for_status()
+            items = r.json().get("items") or [{}]
+            return items[0]
+        except Exception as e:
+            print(f"[{label}] REST failed at offset {offset} ({keyword!r}): {e}")
+            return {}
+
+    first = fetch(0)
+    reqs  = list(first.get("requisitionList") or [])
+    total = min(int(first.get("TotalJobsCount") or 0), max_rows)
+    for data in fetch_concurrently(fetch, range(ORC_PAGE_SIZE, total, ORC_PAGE_SIZE)):
+        reqs.extend(data.get("requisitionList") or [])
+    return reqs
+
+
+def requisition_tuple(req, job_url_template):
+    """Map one requisition to (link, title, description, location, posting_date)."""
+    req_id = req.get("Id")
+    title  = (req.get("Title") or "").strip()
+    if not req_id or not title:
+        return None
+    loc = req.get("PrimaryLocation") or ""
+    secondary = [s.get("Name") for s in (req.get("secondaryLocations") or [])
+                 if isinstance(s, dict) and s.get("Name")]
+    if secondary:
+        loc = "; ".join([loc] + secondary) if loc else "; ".join(secondary)
+    desc = " ".join(filter(None, [req.get("ShortDescriptionStr"),
+                                  req.get("ExternalResponsibilitiesStr")]))
+    if "<" in desc:
+        try:
+            desc = BeautifulSoup(desc, "lxml").get_text(" ", strip=True)
+        except Exception:
+            pass
+    return (
+        job_url_template.format(id=req_id),
+        title,
+        desc[:4000],
+        loc,
+        (req.get("PostedDate") or "").split("T")[0],
+    )
@@ -0,0 +1,88 @@
+# special_extractors_deep/_successfactors.py — v1.0
+# SuccessFactors career-site adapter (server-rendered search results).
+# Walks startrow= pages over plain HTTP — first page gives the total, the rest
+# are fetched concurrently — and parses title / link / location / date from
+# the result table rows. Descriptions come from the job pages, also over HTTP.
+
+import re
+from datetime import datetime
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+from ._http import get_session, fetch_concurrently, HTTP_TIMEOUT
+
+SF_PAGE_SIZE = 25
+SF_MAX_PAGES = 40
+SF_HTML_HEADERS = {"Accept": "text/html"}
+
+_TOTAL_RE = re.compile(r"of\s+([\d,.]+)", re.I)
+_DATE_FORMATS = ("%b %d, %Y", "%d %b %Y", "%d.%m.%Y", "%m/%d/%Y", "%Y-%m-%d")
+
+
+def _iso_date(raw):
+    raw = (raw or "").strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(raw, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return ""
+
+
+def _get_html(url, params=None):
+    r = get_session().get(url, params=params, headers=SF_HTML_HEADERS, timeout=HTTP_TIMEOUT)
+    r.raise_for_status()
+    return r.text
+
+
+def parse_result_rows(html, base_url):
+    """Return (rows, total) from one search-results page."""
+    s = BeautifulSoup(html, "lxml")
+    rows = []
+    for tr in s.select("tr.data-row"):
+        a = tr.select_one("a.jobTitle-link") or tr.select_one("a[href*='/job/']")
+        if not a or not a.get("href"):
+            continue
+        loc_el  = tr.select_one("span.jobLocation, .jobLocation")
+        date_el = tr.select_one("span.jobDate, .jobDate")
+        rows.append({
+            "link":     urljoin(base_url, a["href"].strip()),
+            "title":    a.get_text(" ", strip=True),
+            "location": loc_el.get_text(" ", strip=True) if loc_el else "",
+            "date":     _iso_date(date_el.get_text(" ", strip=True)) if date_el else "",
+        })
+
+    total = 0
+    label = s.select_one(".paginationLabel")
+    m = _TOTAL_RE.search(label.get_text(" ", strip=True)) if label else None
+    if m:
+        total = int(re.sub(r"[,.]", "", m.group(1)))
+    return rows, total
+
+
+def successfactors_search(base_url, query="", label="SuccessFactors", max_pages=SF_MAX_PAGES):
+    """Result rows for one keyword search, newest first, at most `max_pages` pages."""
+    search_url = urljoin(base_url, "/search/")
+
+    def fetch(startrow):
+        params = {"q": query, "startrow": startrow,
+                  "sortColumn": "referencedate", "sortDirection": "desc"}
+        try:
+            return parse_result_rows(_get_html(search_url, params), base_url)
+        except Exception as e:
+            print(f"[{label}] search failed at startrow {startrow} ({query!r}): {e}")
+            return [], 0
+
+    rows, total = fetch(0)
+    last = min(total, SF_PAGE_SIZE * max_pages)
+    for more, _ in fetch_concurrently(fetch, range(SF_PAGE_SIZE, last, SF_PAGE_SIZE)):
+        rows.extend(more)
+    return rows
+
+
+def successfactors_description(link):
+    try:
+        s = BeautifulSoup(_get_html(link), "lxml")
+    except Exception:
+        return ""
+    el = s.select_one("span.jobdescription, .jobdescription, [itemprop='description']")
+    return el.get_text(" ", strip=True)[:4000] if el else ""
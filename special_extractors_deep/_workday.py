@@ -0,0 +1,112 @@
+# special_extractors_deep/_workday.py — v1.0
+# Workday cxs job-search adapter.
+# Filters are pushed to the server (searchText / appliedFacets in the POST
+# body) and pages after the first are fetched concurrently over the pooled
+# session. workday_relevant_postings() narrows one walk by job-family facets
+# instead of running several overlapping keyword searches.
+# workday_details() reads description and start date from the per-job cxs
+# endpoint, so rows are complete without a Playwright detail fetch.
+
+import re
+
+from bs4 import BeautifulSoup
+
+from ._http import get_session, fetch_concurrently, HTTP_TIMEOUT
+
+WORKDAY_PAGE_SIZE = 20      # cxs API maximum
+FAMILY_FACETS     = ("jobFamilyGroup", "jobFamily")
+
+
+def _fetcher(domain, tenant, site, search_text, applied_facets, label):
+    api = f"{domain}/wday/cxs/{tenant}/{site}/jobs"
+    session = get_session()
+
+    def fetch(offset):
+        body = {
+            "appliedFacets": applied_facets or {},
+            "limit":         WORKDAY_PAGE_SIZE,
+            "offset":        offset,
+            "searchText":    search_text,
+        }
+        try:
+            r = session.post(api, json=body, timeout=HTTP_TIMEOUT)
+            r.raise_for_status()
+            return r.json()
+        except Exception as e:
+            print(f"[{label}] API failed at offset {offset} ({search_text!r}): {e}")
+            return {}
+
+    return fetch
+
+
+def workday_postings(domain, tenant, site, search_text="", applied_facets=None,
+                     label="Workday", first=None):
+    """Return the raw jobPostings list for one search (`first`: page 0, if already fetched)."""
+    fetch = _fetcher(domain, tenant, site, search_text, applied_facets, label)
+    first = first if first is not None else fetch(0)
+    postings = list(first.get("jobPostings") or [])
+    # total is only reported on the first page
+    total = first.get("total") or 0
+    offsets = range(WORKDAY_PAGE_SIZE, total, WORKDAY_PAGE_SIZE)
+    for data in fetch_concurrently(fetch, offsets):
+        postings.extend(data.get("jobPostings") or [])
+    return postings
+
+
+def family_facets(page, pattern):
+    """{facetParameter: [ids]} for job-family facet values whose name matches `pattern`."""
+    pattern = re.compile(pattern, re.I) if isinstance(pattern, str) else pattern
+    applied = {}
+    facets = list(page.get("facets") or [])
+    while facets:
+        facet = facets.pop(0)
+        values = facet.get("values") or []
+        # Some tenants nest facet groups one level down
+        facets.extend(v for v in values if v.get("facetParameter"))
+        if facet.get("facetParameter") not in FAMILY_FACETS:
+            continue
+        ids = [v.get("id") for v in values
+               if v.get("id") and pattern.search(v.get("descriptor") or "")]
+        if ids:
+            applied.setdefault(facet["facetParameter"], []).extend(ids)
+    # jobFamilyGroup is the coarser level; prefer it when both match
+    for param in FAMILY_FACETS:
+        if param in applied:
+            return {param: applied[param]}
+    return {}
+
+
+def workday_relevant_postings(domain, tenant, site, family_pattern, label="Workday"):
+    """
+    One walk over the board. The unfiltered first page reports the job-family
+    facets; when some match `family_pattern` only those families are walked,
+    otherwise the unfiltered walk continues from the page already fetched.
+    """
+    first = _fetcher(domain, tenant, site, "", None, label)(0)
+    applied = family_facets(first, family_pattern)
+    if not applied:
+        return workday_postings(domain, tenant, site, label=label, first=first)
+    print(f"[{label}] walking job families {applied}")
+    return workday_postings(domain, tenant, site, applied_facets=applied, label=label)
+
+
+def workday_details(domain, tenant, site, paths, label="Workday"):
+    """(description, start_date) per externalPath, fetched concurrently; ("", "") on failure."""
+    api = f"{domain}/wday/cxs/{tenant}/{site}"
+    session = get_session()
+
+    def fetch(path):
+        if path.startswith("http"):
+            return "", ""   # externalUrl: hosted off the cxs API
+        try:
+            r = session.get(api + path, timeout=HTTP_TIMEOUT)
+            r.raise_for_status()
+            info = r.json().get("jobPostingInfo") or {}
+        except Exception as e:
+            print(f"[{label}] detail API failed for {path}: {e}")
+            return "", ""
+        html = info.get("jobDescription") or ""
+        desc = BeautifulSoup(html, "lxml").get_text(" ", strip=True) if html else ""
+        return desc[:4000], (info.get("startDate") or "").split("T")[0]
+
+    return fetch_concurrently(fetch, list(paths))
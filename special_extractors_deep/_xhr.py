@@ -0,0 +1,141 @@
+# special_extractors_deep/_xhr.py — v1.0
+# Generic XHR/JSON capture for SPA career sites.
+#
+# Most SPA boards load their job list from a JSON endpoint the browser already
+# fetches. JsonCapture listens to page "response" events while the extractor
+# navigates / scrolls / clicks "Load more", and map_jobs() turns the captured
+# payloads into 5-tuples using a small per-company field-mapping spec:
+#
+#   url_pattern : regex matched against response URLs
+#   jobs_path   : dotted path (or list of paths) to the job list inside each
+#                 payload; "*" flattens a list level (e.g. "results.*.hits")
+#   link / title / location / date / description :
+#                 dotted path, list of alternative paths, or callable(job) -> str
+
+import re
+from bs4 import BeautifulSoup
+
+
+class JsonCapture:
+    """Collect JSON responses whose URL matches `url_pattern` while active."""
+
+    def __init__(self, page, url_pattern):
+        self.page      = page
+        self.url_re    = re.compile(url_pattern)
+        self.responses = []
+
+    def _on_response(self, response):
+        try:
+            if not self.url_re.search(response.url):
+                return
+            if "json" not in (response.headers.get("content-type") or ""):
+                return
+            self.responses.append(response)
+        except Exception:
+            pass
+
+    def __enter__(self):
+        self.page.on("response", self._on_response)
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            self.page.remove_listener("response", self._on_response)
+        except Exception:
+            pass
+        return False
+
+    def payloads(self):
+        """Parsed bodies — read before the page navigates away."""
+        out = []
+        for response in self.responses:
+            try:
+                out.append(response.json())
+            except Exception:
+                continue
+        return out
+
+
+def dig(obj, path):
+    """Resolve a dotted path; '*' flattens one list level."""
+    items = [obj]
+    for key in (path.split(".") if path else []):
+        nxt = []
+        for it in items:
+            if key == "*":
+                if isinstance(it, list):
+                    nxt.extend(it)
+            elif isinstance(it, dict) and key in it:
+                nxt.append(it[key])
+            elif isinstance(it, list) and key.isdigit() and int(key) < len(it):
+                nxt.append(it[int(key)])
+        items = nxt
+    return items
+
+
+def _field(job, getter):
+    if not getter:
+        return ""
+    if callable(getter):
+        try:
+            return getter(job) or ""
+        except Exception:
+            return ""
+    for path in ([getter] if isinstance(getter, str) else getter):
+        for value in dig(job, path):
+            if isinstance(value, list):
+                value = ", ".join(str(v) for v in value if v)
+            if value not in (None, ""):
+                return str(value)
+    return ""
+
+
+def map_jobs(payloads, spec):
+    """Map captured payloads to (link, title, description, location, posting_date)."""
+    out, seen = [], set()
+    paths = spec["jobs_path"]
+    paths = [paths] if isinstance(paths, str) else paths
+    for payload in payloads:
+        for jobs in (j for path in paths for j in dig(payload, path)):
+            for job in (jobs if isinstance(jobs, list) else [jobs]):
+                if not isinstance(job, dict):
+                    continue
+                link  = _field(job, spec.get("link")).strip()
+                title = _field(job, spec.get("title")).strip()
+                if not link or not title or link in seen:
+                    continue
+                seen.add(link)
+
+                desc = _field(job, spec.get("description"))
+                if "<" in desc:
+                    try:
+                        desc = BeautifulSoup(desc, "lxml").get_text(" ", strip=True)
+                    except Exception:
+                        pass
+
+                out.append((
+                    link,
+                    title,
+                    desc[:4000],
+                    _field(job, spec.get("location")).strip(),
+                    _field(job, spec.get("date")).split("T")[0],
+                ))
+    return out
+
+
+def _slug(text):
+    return re.sub(r"[^A-Za-z0-9]+", "-", text or "").strip("-")
+
+
+def phenom_spec(base_url, job_prefix):
+    """Field mapping for Phenom People boards (refineSearch widget payloads)."""
+    return {
+        "url_pattern": r"/widgets|/api/jobs",
+        "jobs_path":   ["refineSearch.data.jobs", "data.jobs"],
+        "link": lambda j: (f"{base_url}{job_prefix}{j['jobSeqNo']}/{_slug(j.get('title'))}"
+                           if j.get("jobSeqNo") else j.get("applyUrl", "")),
+        "title":       "title",
+        "location":    ["cityStateCountry", "location", "multi_location"],
+        "date":        ["postedDate", "dateCreated"],
+        "description": ["descriptionTeaser", "description"],
+    }
@@ -1,10 +1,13 @@
 # amazon.py
 # Deep extractor for https://www.amazon.jobs/en/
-# Extracts all AWS + Amazon Data/ETL/Engineering relevant roles via API calls.
+# Extracts all AWS + Amazon Data/ETL/Engineering relevant roles via the search API.
+# Category facets are sent server-side (multi-valued category[]), 100 results
+# per request, pages fetched concurrently over the pooled HTTP session.
 
-import json, re, time
-from urllib.parse import urljoin, urlencode
-from bs4 import BeautifulSoup
+import re
+from datetime import datetime
+from urllib.parse import urljoin
+from ._http import get_session, fetch_concurrently, HTTP_TIMEOUT
 
 RELEVANT = re.compile(
     r"(data|etl|pipeline|integration|analytics|warehouse|lake|engineer|ml|"
@@ -12,51 +15,58 @@ RELEVANT = re.compile(
     re.I
 )
 
-API_BASE = "https://www.amazon.jobs/en/search.json?"
+API_BASE = "https://www.amazon.jobs/en/search.json"
+
+CATEGORIES = [
+    "Software Development",
+    "Business Intelligence",
+    "Machine Learning Science",
+    "Solutions Architect",
+]
+RESULT_LIMIT = 100      # API maximum per request
+MAX_RESULTS  = 1000
+
+
+def _params(offset):
+    # List of pairs so every category[] value is sent (a dict keeps only the last)
+    return ([("category[]", c) for c in CATEGORIES] + [
+        ("radius", "24km"),
+        ("offset", offset),
+        ("result_limit", RESULT_LIMIT),
+        ("sort", "recent"),
+    ])
+
+
+def _fetch(offset):
+    try:
+        r = get_session().get(API_BASE, params=_params(offset), timeout=HTTP_TIMEOUT)
+        r.raise_for_status()
+        return r.json()
+    except Exception as e:
+        print(f"[Amazon] API failed at offset {offset}: {e}")
+        return {}
+
+
+def _iso_date(raw):
+    # posted_date looks like "October 17, 2026"
+    try:
+        return datetime.strptime((raw or "").strip(), "%B %d, %Y").date().isoformat()
+    except ValueError:
+        return ""
 
 
 def extract_amazon(soup, page, base_url):
     results = []
     seen = set()
 
-    # Amazon search API supports pagination & filters
-    # We fetch first ~10 pages (enough for 500–800 roles)
-    MAX_PAGES = 10
-
-    for page_num in range(1, MAX_PAGES + 1):
-
-        params = {
-            "normalized_country_code[]": "",
-            "radius": "24km",
-            "offset": (page_num - 1) * 10,
-            "result_limit": 10,
-            "sort": "recent",
-            "category[]": "Software Development",
-            "category[]": "Business Intelligence",
-            "category[]": "Machine Learning Science",
-            "category[]": "Solutions Architect",
-        }
-
-        api_url = API_BASE + urlencode(params, doseq=True)
-
-        try:
-            page.goto(api_url, wait_until="networkidle", timeout=45000)
-            time.sleep(0.3)
-            raw = page.inner_text("pre")  # API result is JSON in <pre>
-            data = json.loads(raw)
-        except Exception:
-            continue
-
-        jobs = data.get("jobs", [])
-        if not jobs:
-            break
-
-        for j in jobs:
-            title = j.get("title", "").strip()
-            link = j.get("job_path", "")
-            loc = j.get("normalized_location", "")
-            date = j.get("posted_date", "")
+    first = _fetch(0)
+    total = min(int(first.get("hits") or 0), MAX_RESULTS)
+    pages = [first] + fetch_concurrently(_fetch, range(RESULT_LIMIT, total, RESULT_LIMIT))
 
+    for data in pages:
+        for j in data.get("jobs", []):
+            title = (j.get("title") or "").strip()
+            link = j.get("job_path", "")
             if not title or not link:
                 continue
 
@@ -70,8 +80,10 @@ def extract_amazon(soup, page, base_url):
                 continue
             seen.add(full_link)
 
-            label = f"{title} ({loc})" if loc else title
+            loc  = j.get("normalized_location") or j.get("location") or ""
+            desc = (j.get("description_short") or j.get("description") or "")[:4000]
 
-            results.append((full_link, label))
+            results.append((full_link, title, desc, loc, _iso_date(j.get("posted_date"))))
 
+    print(f"[Amazon] Extracted {len(results)} jobs")
     return results
@@ -4,6 +4,7 @@
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+from scrape_health import timed_goto
 
 def extract_anomalo(soup, page, main_url):
     API_URL = "https://api.ashbyhq.com/posting-api/job-board/anomalo"
@@ -51,7 +52,7 @@ def _dom_fallback(page):
     seen = set()
     ASHBY_URL = "https://jobs.ashbyhq.com/anomalo"
     try:
-        page.goto(ASHBY_URL, timeout=45000, wait_until="networkidle")
+        timed_goto(page, ASHBY_URL, 45000, wait_until="networkidle")
         page.wait_for_timeout(1000)
         from bs4 import BeautifulSoup
         s = BeautifulSoup(page.content(), "lxml")
@@ -4,6 +4,7 @@
 from bs4 import BeautifulSoup
 import re
 from urllib.parse import urljoin
+from scrape_health import timed_goto
 
 ATACCAMA_URL = "https://jobs.ataccama.com/"
 
@@ -13,7 +14,7 @@ def extract_ataccama(soup, page, base_url):
 
     # Load the real careers page
     try:
-        page.goto(ATACCAMA_URL, timeout=45000, wait_until="networkidle")
+        timed_goto(page, ATACCAMA_URL, 45000, wait_until="networkidle")
         page.wait_for_timeout(800)
         html = page.content()
     except Exception:
@@ -4,6 +4,7 @@
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+from scrape_health import timed_goto
 
 ASHBY_URL = "https://jobs.ashbyhq.com/atlan"
 
@@ -52,7 +53,7 @@ def _dom_fallback(page):
     out = []
     seen = set()
     try:
-        page.goto(ASHBY_URL, timeout=45000, wait_until="networkidle")
+        timed_goto(page, ASHBY_URL, 45000, wait_until="networkidle")
         page.wait_for_timeout(1000)
         s = BeautifulSoup(page.content(), "lxml")
         for a in s.select("a[href*='/atlan/'], a[href*='/job/'], a[href*='ashbyhq.com/atlan/']"):
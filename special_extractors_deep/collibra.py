@@ -1,54 +1,19 @@
-# special_extractors_deep/collibra.py — v2.0
+# special_extractors_deep/collibra.py — v2.1
 # Uses Greenhouse API with content=true for full metadata
 # Returns consistent 5-tuples matching the pipeline contract
+# Board is parsed as a stream — generator yields each JobPosting as it arrives
 
-import requests
-from bs4 import BeautifulSoup
+from ._greenhouse import iter_board_jobs, greenhouse_posting
 
 def extract_collibra(soup, page, main_url):
-    API_URL = "https://boards-api.greenhouse.io/v1/boards/collibra/jobs?content=true"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    out = []
-
+    count = 0
     try:
-        r = requests.get(API_URL, headers=headers, timeout=20)
-        r.raise_for_status()
-        data = r.json()
+        for job in iter_board_jobs("collibra"):
+            posting = greenhouse_posting(job)
+            if posting:
+                count += 1
+                yield posting
     except Exception as e:
         print(f"[Collibra extractor error] {e}")
-        return out
-
-    for job in data.get("jobs", []):
-        title = (job.get("title") or "").strip()
-        link  = (job.get("absolute_url") or "").strip()
-
-        if not title or not link:
-            continue
-
-        # Location
-        loc = ""
-        loc_data = job.get("location")
-        if isinstance(loc_data, dict):
-            loc = loc_data.get("name", "")
-
-        # Posting date
-        posting_date = ""
-        for date_field in ("first_published_at", "updated_at"):
-            raw = job.get(date_field, "")
-            if raw:
-                posting_date = raw.split("T")[0]
-                break
-
-        # Description
-        desc_text = ""
-        desc_html = job.get("content", "")
-        if desc_html:
-            try:
-                desc_text = BeautifulSoup(desc_html, "lxml").get_text(" ", strip=True)[:4000]
-            except Exception:
-                pass
-
-        out.append((link, title, desc_text, loc, posting_date))
 
-    print(f"[Collibra API] Extracted {len(out)} jobs")
-    return out
+    print(f"[Collibra API] Extracted {count} jobs")
@@ -3,6 +3,7 @@
 
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+from scrape_health import timed_goto
 
 GH_URL = "https://job-boards.greenhouse.io/embed/job_board?for=couchbaseinc"
 
@@ -12,7 +13,7 @@ def extract_couchbase(soup, page, base_url):
 
     try:
         # Load the Greenhouse embedded job board
-        page.goto(GH_URL, timeout=45000, wait_until="networkidle")
+        timed_goto(page, GH_URL, 45000, wait_until="networkidle")
         page.wait_for_timeout(900)
         html = page.content()
     except Exception:
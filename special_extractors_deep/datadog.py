@@ -1,10 +1,13 @@
 # special_extractors_deep/datadog.py — v3.0
 # Datadog uses a custom React careers page — no public Greenhouse API
 # Playwright DOM scraping with relevance pre-filter
+# Job list JSON (Algolia search) is captured off the wire first; cards are
+# read in-page (page.evaluate) as the fallback
 
 import re
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from scrape_health import timed_goto
+from ._cards import extract_cards
+from ._xhr import JsonCapture, map_jobs
 
 CAREERS_URL = "https://careers.datadoghq.com/all-jobs/"
 
@@ -23,70 +26,66 @@ DROP = re.compile(
     re.I
 )
 
+# Algolia search responses behind the React job list
+XHR_SPEC = {
+    "url_pattern": r"algolia\.net/1/indexes/",
+    "jobs_path":   ["hits", "results.*.hits"],
+    "link":        ["absolute_url", "url"],
+    "title":       "title",
+    "location":    ["location_string", "locations", "location.name"],
+    "date":        ["first_published_at", "updated_at"],
+    "description": ["description", "content"],
+}
+
+CARD_SPEC = {
+    "anchors": ["a[href*='/job/']", ".job-listing a[href]", "li.opening a[href]"],
+    "first_match_only": True,
+    "card":     ["li, div"],
+    "heading":  "h2, h3, h4",
+    "min_title_len": 4,
+    "text_pattern": RELEVANT.pattern,
+    "location": ["span, [class*='location']"],
+    "location_pattern": r"\b(remote|usa|york|paris|london|dublin)\b",
+    "location_max_len": 60,
+}
+
 def extract_datadog(soup, page, base_url):
     out = []
-    seen = set()
 
-    try:
-        page.goto(CAREERS_URL, timeout=45000, wait_until="networkidle")
-        page.wait_for_timeout(2000)
-        for _ in range(5):
-            page.keyboard.press("End")
-            page.wait_for_timeout(800)
-        for _ in range(10):
-            try:
-                btn = page.query_selector(
-                    "button:has-text('Load more'), button:has-text('Show more')"
-                )
-                if btn and btn.is_visible():
-                    btn.click()
-                    page.wait_for_timeout(1200)
-                else:
+    with JsonCapture(page, XHR_SPEC["url_pattern"]) as capture:
+        try:
+            timed_goto(page, CAREERS_URL, 45000, wait_until="networkidle")
+            page.wait_for_timeout(2000)
+            for _ in range(5):
+                page.keyboard.press("End")
+                page.wait_for_timeout(800)
+            for _ in range(10):
+                try:
+                    btn = page.query_selector(
+                        "button:has-text('Load more'), button:has-text('Show more')"
+                    )
+                    if btn and btn.is_visible():
+                        btn.click()
+                        page.wait_for_timeout(1200)
+                    else:
+                        break
+                except Exception:
                     break
-            except Exception:
-                break
-        html = page.content()
-    except Exception as e:
-        print(f"[Datadog] render error: {e}")
-        html = ""
-
-    s = BeautifulSoup(html or "", "lxml") if html else soup
+        except Exception as e:
+            print(f"[Datadog] render error: {e}")
 
-    for sel in ["a[href*='/job/']", ".job-listing a[href]", "li.opening a[href]"]:
-        for a in s.select(sel):
-            href = a.get("href", "").strip()
-            if not href:
-                continue
-            link = href if href.startswith("http") else urljoin("https://careers.datadoghq.com", href)
-            if link in seen:
-                continue
-            seen.add(link)
+        captured = map_jobs(capture.payloads(), XHR_SPEC)
 
-            title = a.get_text(" ", strip=True)
-            if not title:
-                parent = a.find_parent(["li", "div"])
-                if parent:
-                    h = parent.find(["h2", "h3", "h4"])
-                    if h:
-                        title = h.get_text(" ", strip=True)
-            if not title or len(title) < 4:
-                continue
-
-            if DROP.search(title) or not RELEVANT.search(title):
-                continue
-
-            loc = ""
-            parent = a.find_parent(["li", "div"])
-            if parent:
-                for el in parent.select("span, [class*='location']"):
-                    t = el.get_text(" ", strip=True)
-                    if t and re.search(r"\b(remote|usa|york|paris|london|dublin)\b", t, re.I) and len(t) < 60:
-                        loc = t
-                        break
+    if captured:
+        out = [item for item in captured
+               if RELEVANT.search(item[1]) and not DROP.search(item[1])]
+        print(f"[Datadog] Extracted {len(out)} relevant jobs (JSON capture)")
+        return out
 
-            out.append((link, title, "", loc, ""))
-        if out:
-            break
+    for card in extract_cards(page, CARD_SPEC, soup, CAREERS_URL):
+        if DROP.search(card["title"]):
+            continue
+        out.append((card["href"], card["title"], "", card["location"], ""))
 
     print(f"[Datadog] Extracted {len(out)} relevant jobs")
     return out
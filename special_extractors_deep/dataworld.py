@@ -4,6 +4,7 @@
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import time, re
+from scrape_health import timed_goto
 
 def extract_dataworld(soup, page, base_url):
     results = []
@@ -11,7 +12,7 @@ def extract_dataworld(soup, page, base_url):
 
     # --- Dynamic load + scroll ---
     try:
-        page.goto(base_url, wait_until="networkidle", timeout=45000)
+        timed_goto(page, base_url, 45000, wait_until="networkidle")
         for _ in range(3):
             page.mouse.wheel(0, 1400)
             time.sleep(0.7)
@@ -3,6 +3,7 @@
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import time
+from scrape_health import timed_goto
 
 def extract_decube(soup, page, base_url):
     results = []
@@ -10,7 +11,7 @@ def extract_decube(soup, page, base_url):
 
     # --- Force JS rendering + lazy load scroll ---
     try:
-        page.goto(base_url, wait_until="networkidle", timeout=45000)
+        timed_goto(page, base_url, 45000, wait_until="networkidle")
         for _ in range(2):
             page.mouse.wheel(0, 1200)
             time.sleep(0.7)
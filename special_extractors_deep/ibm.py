@@ -1,12 +1,11 @@
 # special_extractors_deep/ibm.py — v2.0
 # IBM Phenom People platform
 # Added: relevance pre-filter, 5-tuple output, load-more pagination
+# Cards are read in-page (page.evaluate) — no full-DOM serialisation
 
 import re
-import time
-import json
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from scrape_health import timed_goto
+from ._cards import extract_cards
 
 BASE_URL = "https://www.ibm.com/careers/search"
 
@@ -17,13 +16,33 @@ RELEVANT = re.compile(
     re.I
 )
 
+CARD_SPEC = {
+    "anchors": [
+        "a[href*='/job/']",
+        "a[href*='/jobs/']",
+        "a[href*='jobId=']",
+        "div[data-ph-at-id='job-card'] a[href]",
+        ".job-list-item a[href]",
+    ],
+    "card": [
+        "div[class*='job' i], div[class*='card' i], div[class*='result' i], "
+        "div[class*='listing' i]",
+        "li",
+    ],
+    "heading":  "h2, h3, h4",
+    "min_title_len": 3,
+    # Relevance filter in-page — IBM posts thousands of unrelated roles
+    "text_pattern": RELEVANT.pattern,
+    "location": [".job-location", ".location", "span[class*='location']", "p"],
+    "location_max_len": 80,
+}
+
 def extract_ibm(soup, page, base_url):
     out = []
-    seen = set()
 
     # JS render with scroll and load-more
     try:
-        page.goto(base_url, wait_until="networkidle", timeout=55000)
+        timed_goto(page, base_url, 55000, wait_until="networkidle")
         page.wait_for_timeout(2000)
 
         for _ in range(5):
@@ -45,66 +64,15 @@ def extract_ibm(soup, page, base_url):
             except Exception:
                 break
 
-        html = page.content()
-        soup = BeautifulSoup(html, "lxml")
     except Exception as e:
         print(f"[IBM] render error: {e}")
 
-    selectors = [
-        "a[href*='/job/']",
-        "a[href*='/jobs/']",
-        "a[href*='jobId=']",
-        "div[data-ph-at-id='job-card'] a[href]",
-        ".job-list-item a[href]",
-    ]
-
-    for sel in selectors:
-        for a in soup.select(sel):
-            href = a.get("href", "")
-            if not href:
-                continue
-
-            # Skip search/filter pages
-            if "search" in href.lower() and "job" not in href.lower():
-                continue
-
-            link = urljoin(base_url, href)
-            if link in seen:
-                continue
-            seen.add(link)
-
-            # Title
-            title = a.get_text(" ", strip=True)
-            if not title or len(title) < 3:
-                parent = a.find_parent(["div", "li"])
-                if parent:
-                    h = parent.find(["h2", "h3", "h4"])
-                    if h:
-                        title = h.get_text(" ", strip=True)
-            if not title or len(title) < 3:
-                continue
-
-            # Relevance filter — IBM posts thousands of unrelated roles
-            if not RELEVANT.search(title):
-                continue
-
-            # Location
-            loc = ""
-            card = (
-                a.find_parent("div", class_=re.compile(r"(job|card|result|listing)", re.I))
-                or a.find_parent("li")
-            )
-            if card:
-                for loc_sel in [".job-location", ".location",
-                                 "span[class*='location']", "p"]:
-                    el = card.select_one(loc_sel)
-                    if el:
-                        candidate = el.get_text(" ", strip=True)
-                        if len(candidate) < 80:
-                            loc = candidate
-                            break
-
-            out.append((link, title, "", loc, ""))
+    for card in extract_cards(page, CARD_SPEC, soup, base_url):
+        href = card["href"].lower()
+        # Skip search/filter pages
+        if "search" in href and "job" not in href:
+            continue
+        out.append((card["href"], card["title"], "", card["location"], ""))
 
     print(f"[IBM] Extracted {len(out)} jobs")
     return out
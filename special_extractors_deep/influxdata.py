@@ -5,6 +5,7 @@
 import re, time, json
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
+from scrape_health import timed_goto
 
 # Strong relevance filter
 RELEVANT = re.compile(
@@ -15,7 +16,7 @@ RELEVANT = re.compile(
 def fetch_detail(page, link):
     """Optional detail extraction for location + date."""
     try:
-        page.goto(link, timeout=45000, wait_until="networkidle")
+        timed_goto(page, link, 45000, wait_until="networkidle")
         page.wait_for_timeout(900)
 
         s = BeautifulSoup(page.content(), "lxml")
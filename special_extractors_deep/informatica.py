@@ -3,6 +3,7 @@
 from bs4 import BeautifulSoup
 import json, re
 from urllib.parse import urljoin
+from scrape_health import timed_goto
 
 def extract_informatica(soup, page, main_url):
     """
@@ -42,7 +43,7 @@ def extract_informatica(soup, page, main_url):
     if iframe and ("gr8people" in iframe["src"].lower()):
         iframe_url = urljoin(main_url, iframe["src"])
         try:
-            page.goto(iframe_url, timeout=30000, wait_until="networkidle")
+            timed_goto(page, iframe_url, 30000, wait_until="networkidle")
             page.wait_for_timeout(600)
             iframe_html = page.content()
         except:
@@ -1,12 +1,18 @@
 # special_extractors_deep/oracle.py — v2.0
 # Fixed: missing `return out` on last line of original
 # Improved: 5-tuple output, better title/location extraction, relevance pre-filter
+# Primary path: Oracle Recruiting Cloud REST (recruitingCEJobRequisitions) —
+# a few narrow keyword searches (newest first, row-capped) with concurrent
+# offset pages, 5-tuples with descriptions inline (no per-job fetch). A run
+# costs at most len(SEARCH_TERMS) × SEARCH_MAX_ROWS / 25 requests.
+# Fallback: render + scroll, cards read in-page (page.evaluate)
 
 import re
 import time
-import json
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from scrape_health import timed_goto
+from ._cards import extract_cards
+from ._http import fetch_concurrently
+from ._oracle_rc import oracle_requisitions, requisition_tuple
 
 RELEVANT = re.compile(
     r"\b(data|etl|integration|pipeline|engineer|analyst|architect|"
@@ -14,13 +20,73 @@ RELEVANT = re.compile(
     re.I
 )
 
+ORC_HOST        = "https://eeho.fa.us2.oraclecloud.com"
+ORC_SITE_NUMBER = "CX_45001"
+ORC_JOB_URL     = "https://careers.oracle.com/en/sites/jobsearch/job/{id}"
+
+# Server-side keyword searches — union of results is filtered with RELEVANT.
+# Kept to data-platform terms; "engineer" / "developer" match most of the board.
+SEARCH_TERMS    = ["data", "database", "integration", "analytics"]
+SEARCH_MAX_ROWS = 250       # per search, newest first
+MAX_JOBS        = 300       # = PER_COMPANY_ROW_CAP
+
+CARD_SPEC = {
+    "anchors": [
+        "a[href*='/job/']",
+        "a[href*='/jobs/']",
+        "div[data-qa='search-result'] a[href]",
+        ".job-card a[href]",
+        ".card a[href]",
+        "li a[href*='/job/']",
+    ],
+    "card": [
+        "div[class*='job' i], div[class*='card' i], div[class*='item' i]",
+        "li",
+        "article",
+    ],
+    "heading":  "h2, h3, h4",
+    "min_title_len": 3,
+    # Pre-filter noise in-page
+    "text_pattern": RELEVANT.pattern,
+    "location": [".job-location", ".location", "span.location", "p"],
+    "location_max_len": 60,
+}
+
 def extract_oracle(soup, page, base_url):
+    out = _rest(base_url)
+    if out:
+        print(f"[Oracle] Extracted {len(out)} jobs (Recruiting Cloud REST)")
+        return out
+    return _dom(soup, page, base_url)
+
+
+def _rest(base_url):
     out = []
     seen = set()
+    searches = fetch_concurrently(
+        lambda term: oracle_requisitions(ORC_HOST, ORC_SITE_NUMBER, term, label="Oracle",
+                                         max_rows=SEARCH_MAX_ROWS),
+        SEARCH_TERMS,
+    )
+    for reqs in searches:
+        for req in reqs:
+            item = requisition_tuple(req, ORC_JOB_URL)
+            if not item or item[0] in seen:
+                continue
+            seen.add(item[0])
+            if RELEVANT.search(item[1]):
+                out.append(item)
+    if len(out) > MAX_JOBS:
+        print(f"[Oracle] {len(out)} relevant jobs — keeping the newest {MAX_JOBS}")
+        out.sort(key=lambda item: item[4], reverse=True)
+        out = out[:MAX_JOBS]
+    return out
 
+
+def _dom(soup, page, base_url):
     # JS-render with scroll
     try:
-        page.goto(base_url, wait_until="networkidle", timeout=50000)
+        timed_goto(page, base_url, 50000, wait_until="networkidle")
         for _ in range(4):
             page.mouse.wheel(0, 1400)
             time.sleep(0.7)
@@ -38,63 +104,11 @@ def extract_oracle(soup, page, base_url):
                     break
             except Exception:
                 break
-        html = page.content()
-        soup = BeautifulSoup(html, "lxml")
     except Exception as e:
         print(f"[Oracle] render error: {e}")
 
-    selectors = [
-        "a[href*='/job/']",
-        "a[href*='/jobs/']",
-        "div[data-qa='search-result'] a[href]",
-        ".job-card a[href]",
-        ".card a[href]",
-        "li a[href*='/job/']",
-    ]
-
-    for sel in selectors:
-        for a in soup.select(sel):
-            href = a.get("href", "")
-            if not href:
-                continue
-            link = urljoin(base_url, href)
-            if link in seen:
-                continue
-            seen.add(link)
-
-            # Title
-            title = a.get_text(" ", strip=True)
-            if not title or len(title) < 3:
-                parent = a.find_parent(["div", "li", "article"])
-                if parent:
-                    h = parent.find(["h2", "h3", "h4"])
-                    if h:
-                        title = h.get_text(" ", strip=True)
-
-            if not title or len(title) < 3:
-                continue
-
-            # Pre-filter noise
-            if not RELEVANT.search(title):
-                continue
-
-            # Location
-            loc = ""
-            card = (
-                a.find_parent("div", class_=re.compile(r"(job|card|item)", re.I))
-                or a.find_parent("li")
-                or a.find_parent("article")
-            )
-            if card:
-                for loc_sel in [".job-location", ".location", "span.location", "p"]:
-                    el = card.select_one(loc_sel)
-                    if el:
-                        candidate = el.get_text(" ", strip=True)
-                        if len(candidate) < 60:
-                            loc = candidate
-                            break
-
-            out.append((link, title, "", loc, ""))
+    out = [(c["href"], c["title"], "", c["location"], "")
+           for c in extract_cards(page, CARD_SPEC, soup, base_url)]
 
     print(f"[Oracle] Extracted {len(out)} jobs")
-    return out  # was missing in original!
+    return out
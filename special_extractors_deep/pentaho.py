@@ -2,6 +2,7 @@
 
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+from scrape_health import timed_goto
 
 def extract_pentaho(soup, page, main_url):
     """
@@ -42,7 +43,7 @@ def extract_pentaho(soup, page, main_url):
     if iframe and "hitachivantara" in iframe.get("src", "").lower():
         iframe_url = urljoin(main_url, iframe["src"])
         try:
-            page.goto(iframe_url, timeout=35000, wait_until="networkidle")
+            timed_goto(page, iframe_url, 35000, wait_until="networkidle")
             page.wait_for_timeout(700)
             ih = page.content()
         except:
@@ -4,6 +4,7 @@
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+from scrape_health import timed_goto
 
 ASHBY_URL = "https://jobs.ashbyhq.com/pinecone"
 
@@ -52,7 +53,7 @@ def _dom_fallback(page):
     out = []
     seen = set()
     try:
-        page.goto(ASHBY_URL, timeout=45000, wait_until="networkidle")
+        timed_goto(page, ASHBY_URL, 45000, wait_until="networkidle")
         page.wait_for_timeout(1200)
         s = BeautifulSoup(page.content(), "lxml")
         import re
@@ -0,0 +1,62 @@
+# special_extractors_deep/posting.py — v1.0
+# Typed posting record + iterator contract for extractors.
+#
+# Extractors may return a list OR be generators; items may be JobPosting
+# records or legacy 2/3/5-tuples. iter_postings() adapts whatever comes back
+# into JobPosting objects lazily, so scrape() can enrich and emit each posting
+# as soon as the extractor produces it.
+
+
+class JobPosting:
+    __slots__ = ("link", "title", "description", "location", "posting_date")
+
+    def __init__(self, link, title="", description="", location="", posting_date=""):
+        self.link         = link or ""
+        self.title        = title or ""
+        self.description  = description or ""
+        self.location     = location or ""
+        self.posting_date = posting_date or ""
+
+    @classmethod
+    def from_item(cls, item):
+        """Adapt a legacy tuple (2, 3 or 5 fields) or dict; None if unusable."""
+        if isinstance(item, cls):
+            return item
+        if isinstance(item, dict):
+            return cls(item.get("link"), item.get("title"), item.get("description"),
+                       item.get("location"), item.get("posting_date"))
+        if not item:
+            return None
+        if len(item) == 5:
+            return cls(*item)
+        # 3-tuples carry a DOM element third — not a description
+        return cls(item[0], item[1] if len(item) > 1 else "")
+
+    def as_tuple(self):
+        return (self.link, self.title, self.description, self.location, self.posting_date)
+
+    def __repr__(self):
+        return f"JobPosting({self.title!r}, {self.link!r})"
+
+
+def iter_postings(raw_items, label="", on_error=None):
+    """
+    Lazily yield JobPosting records from an extractor's result.
+    An exception raised mid-iteration ends the stream (postings already
+    yielded are kept) instead of propagating into the scrape loop;
+    `on_error(exc)` is called so the caller knows the stream is incomplete.
+    """
+    it = iter(raw_items or [])
+    while True:
+        try:
+            item = next(it)
+        except StopIteration:
+            return
+        except Exception as e:
+            print(f"[SPECIAL ERROR] {label} -> {e}")
+            if on_error is not None:
+                on_error(e)
+            return
+        posting = JobPosting.from_item(item)
+        if posting is not None:
+            yield posting
@@ -4,6 +4,7 @@
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import time
+from scrape_health import timed_goto
 
 def extract_precisely(soup, page, base_url):
     results = []
@@ -13,7 +14,7 @@ def extract_precisely(soup, page, base_url):
     # 1. FULL JS LOAD + SCROLL
     # ==============================
     try:
-        page.goto(base_url, wait_until="networkidle", timeout=60000)
+        timed_goto(page, base_url, 60000, wait_until="networkidle")
 
         # Precisely loads jobs after scrolling
         last_height = -1
@@ -1,105 +1,52 @@
 # special_extractors_deep/qdrant.py — v1.0
 # Qdrant hosts careers on their own site (no standard ATS detected)
 # Playwright render required
+# Cards are read in-page (page.evaluate) — no full-DOM serialisation
 
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
-import re
+from gazetteer import LOCATION_PATTERN
+from scrape_health import timed_goto
+from ._cards import extract_cards
 
 CAREERS_URL = "https://qdrant.tech/careers/"
 
-def extract_qdrant(soup, page, main_url):
-    out = []
-    seen = set()
-
-    try:
-        page.goto(CAREERS_URL, timeout=45000, wait_until="networkidle")
-        page.wait_for_timeout(1500)
-        html = page.content()
-    except Exception as e:
-        print(f"[Qdrant] render error: {e}")
-        html = ""
-
-    s = BeautifulSoup(html or "", "lxml") if html else soup
-
-    # Qdrant careers page — look for job listing links
-    selectors = [
+# Qdrant careers page — look for job listing links
+CARD_SPEC = {
+    "anchors": [
         "a[href*='/careers/']",
         "a[href*='/jobs/']",
         ".job-listing a[href]",
         ".vacancy a[href]",
         "article a[href]",
         "li a[href*='qdrant']",
-    ]
-
-    for sel in selectors:
-        for a in s.select(sel):
-            href = a.get("href", "").strip()
-            if not href:
-                continue
-
-            # Skip nav/footer links back to /careers/ root
-            if href.rstrip("/") in ("/careers", "https://qdrant.tech/careers"):
-                continue
+    ],
+    "first_match_only": True,
+    # Must look like a specific job page, not a category or the /careers/ root
+    "href_pattern": r"/careers/[^/]+/[^/]+|/jobs/[a-zA-Z0-9\-]{5,}",
+    "card":          ["li, article, div"],
+    "heading":       "h2, h3, h4",
+    "heading_first": True,
+    "min_title_len": 4,
+    "location":      [".location", "[class*='location']", "span"],
+    "location_pattern": LOCATION_PATTERN,
+}
+
+# If no structured job pages found, look for any anchor with job-like text
+FALLBACK_SPEC = {
+    "anchors": ["a[href]"],
+    "href_pattern": r"[Qq]drant",
+    "text_pattern": r"\b(engineer|developer|manager|analyst|scientist|designer|lead|intern)\b",
+}
 
-            link = href if href.startswith("http") else urljoin("https://qdrant.tech", href)
-
-            # Must look like a specific job page, not a category
-            if not re.search(r"/careers/[^/]+/[^/]+|/jobs/[a-zA-Z0-9\-]{5,}", link):
-                continue
-
-            if link in seen:
-                continue
-            seen.add(link)
-
-            # Title
-            title = ""
-            parent = a.find_parent(["li", "article", "div"])
-            if parent:
-                h = parent.find(["h2", "h3", "h4"])
-                if h:
-                    title = h.get_text(" ", strip=True)
-            if not title:
-                title = a.get_text(" ", strip=True)
-            if not title or len(title) < 4:
-                continue
-
-            # Location
-            loc = ""
-            if parent:
-                for loc_sel in [".location", "[class*='location']", "span"]:
-                    els = parent.select(loc_sel)
-                    for el in els:
-                        t = el.get_text(" ", strip=True)
-                        if t and re.search(
-                            r"\b(remote|germany|berlin|usa|uk|europe|hybrid)\b", t, re.I
-                        ):
-                            loc = t
-                            break
-                    if loc:
-                        break
-
-            out.append((link, title, "", loc, ""))
-        if out:
-            break
+def extract_qdrant(soup, page, main_url):
+    try:
+        timed_goto(page, CAREERS_URL, 45000, wait_until="networkidle")
+        page.wait_for_timeout(1500)
+    except Exception as e:
+        print(f"[Qdrant] render error: {e}")
 
-    # If no structured job pages found, look for any anchor with job-like text
-    if not out:
-        for a in s.find_all("a", href=True):
-            href = a.get("href", "").strip()
-            text = a.get_text(" ", strip=True)
-            if not href or not text:
-                continue
-            if not re.search(
-                r"\b(engineer|developer|manager|analyst|scientist|designer|lead|intern)\b",
-                text, re.I
-            ):
-                continue
-            link = href if href.startswith("http") else urljoin("https://qdrant.tech", href)
-            if link in seen or "qdrant" not in link.lower():
-                continue
-            seen.add(link)
-            out.append((link, text, "", "", ""))
+    cards = (extract_cards(page, CARD_SPEC, soup, CAREERS_URL)
+             or extract_cards(page, FALLBACK_SPEC, soup, CAREERS_URL))
+    out = [(c["href"], c["title"], "", c["location"], "") for c in cards]
 
     print(f"[Qdrant] Extracted {len(out)} jobs")
     return out
@@ -1,12 +1,84 @@
 # sap.py
 # Deep extractor for SAP (SuccessFactors ATS)
 #
-# This is *not* generic — custom-tailored to SAP's SuccessFactors HTML.
+# Primary path: SuccessFactors adapter — a few narrow keyword searches walked
+# page by page over plain HTTP (newest first, page-capped), location/date from
+# the result rows. Rows are deduped and capped at MAX_JOBS before descriptions
+# are fetched, so a run costs at most
+#   len(SEARCH_TERMS) × SEARCH_MAX_PAGES result pages + MAX_JOBS job pages.
+# Returns complete 5-tuples (no Playwright detail fetch needed).
+# Fallback: the listing page rendered with Playwright — only when the search
+# returns nothing, so a normal run never launches Chromium for SAP.
 
-from bs4 import BeautifulSoup
+import re
 from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+from gazetteer import has_location
+from scrape_health import timed_goto
+from ._http import fetch_concurrently
+from ._successfactors import successfactors_search, successfactors_description
+
+SAP_BASE = "https://jobs.sap.com"
+
+# Server-side searches — union of results is filtered with RELEVANT. Kept to
+# data-platform terms; "engineer" / "developer" match most of SAP's board.
+SEARCH_TERMS     = ["data", "hana", "integration", "analytics"]
+SEARCH_MAX_PAGES = 10       # × 25 rows per search
+MAX_JOBS         = 300      # = PER_COMPANY_ROW_CAP; bounds description fetches
+
+RELEVANT = re.compile(
+    r"\b(data|etl|integration|pipeline|engineer|analyst|architect|"
+    r"cloud|platform|bi|analytics|database|sql|developer|sre|hana|btp)\b",
+    re.I
+)
+
 
 def extract_sap(soup, page, base_url):
+    seen = set()
+    jobs = []
+    searches = fetch_concurrently(
+        lambda term: successfactors_search(SAP_BASE, term, label="SAP",
+                                           max_pages=SEARCH_MAX_PAGES),
+        SEARCH_TERMS,
+    )
+    for rows in searches:
+        for row in rows:
+            if row["link"] in seen or not row["title"]:
+                continue
+            seen.add(row["link"])
+            if RELEVANT.search(row["title"]):
+                jobs.append(row)
+
+    if not jobs:
+        out = _listing_fallback(soup or _render_listing(page, base_url), base_url)
+        print(f"[SAP] SuccessFactors search returned nothing — listing fallback: {len(out)} jobs")
+        return out
+
+    if len(jobs) > MAX_JOBS:
+        print(f"[SAP] {len(jobs)} relevant jobs — keeping the newest {MAX_JOBS}")
+        jobs.sort(key=lambda j: j["date"], reverse=True)
+        jobs = jobs[:MAX_JOBS]
+
+    descriptions = fetch_concurrently(successfactors_description,
+                                      [j["link"] for j in jobs])
+    out = [(j["link"], j["title"], desc, j["location"], j["date"])
+           for j, desc in zip(jobs, descriptions)]
+    print(f"[SAP] Extracted {len(out)} jobs")
+    return out
+
+
+def _render_listing(page, base_url):
+    try:
+        timed_goto(page, base_url, 45000, wait_until="networkidle")
+        return BeautifulSoup(page.content(), "lxml")
+    except Exception as e:
+        print(f"[SAP] listing render error: {e}")
+        return None
+
+
+def _listing_fallback(soup, base_url):
+    if soup is None:
+        return []
     results = []
     seen = set()
 
@@ -59,29 +131,10 @@ def extract_sap(soup, page, base_url):
         if not loc and tile:
             for sib in tile.find_all(["div", "span"], recursive=True):
                 txt = sib.get_text(" ", strip=True)
-                if txt and any(
-                    k in txt.lower()
-                    for k in [
-                        "remote",
-                        "hybrid",
-                        "germany",
-                        "india",
-                        "usa",
-                        "canada",
-                        "france",
-                        "australia",
-                        "united",
-                        "singapore",
-                        "japan",
-                        "brazil",
-                    ]
-                ):
+                if txt and has_location(txt):
                     loc = txt
                     break
 
-        # Combine title + location as label
-        label = f"{title} ({loc})" if loc else title
-
-        results.append((link, label))
+        results.append((link, title, "", loc, ""))
 
     return results
@@ -4,6 +4,7 @@
 
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+from scrape_health import timed_goto
 
 WTTJ_BASE = "https://www.welcometothejungle.com"
 SIFFLET_URL = "https://www.welcometothejungle.com/en/companies/sifflet/jobs"
@@ -13,7 +14,7 @@ def extract_sifflet(soup, page, main_url):
     seen = set()
 
     try:
-        page.goto(SIFFLET_URL, timeout=45000, wait_until="networkidle")
+        timed_goto(page, SIFFLET_URL, 45000, wait_until="networkidle")
         page.wait_for_timeout(1500)
         html = page.content()
     except Exception as e:
@@ -1,13 +1,14 @@
 # special_extractors_deep/teradata.py — v2.0
 # Workday-based. Returns 5-tuples.
-# Removed redundant per-job detail fetch (detail enrichment handled centrally)
+# One Workday walk narrowed by job-family facets, pages fetched pooled;
+# descriptions and start dates from the per-job cxs endpoint (no browser)
 
-import json
 import re
 import time
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+from scrape_health import timed_goto
+from ._workday import workday_details, workday_relevant_postings
 
 DOMAIN  = "https://careers.teradata.com"
 TENANT  = "teradata"
@@ -19,59 +20,42 @@ RELEVANT = re.compile(
     re.I
 )
 
+# Job families walked server-side; titles are still filtered with RELEVANT
+FAMILY_RELEVANT = re.compile(
+    r"engineer|develop|data|analytic|cloud|architect|consult|technolog|product|"
+    r"research|\bit\b|software|support",
+    re.I
+)
+
 def extract_teradata(soup, page, base_url):
     out = []
     seen = set()
 
-    # Try Workday cxs API first
-    api_root = f"{DOMAIN}/wday/cxs/{TENANT}/{SITE}/jobs"
-    offset, limit = 0, 20
-
-    while True:
-        api_url = f"{api_root}?offset={offset}&limit={limit}"
-        try:
-            r = requests.get(api_url, timeout=20,
-                             headers={"Accept": "application/json",
-                                      "User-Agent": "Mozilla/5.0"})
-            r.raise_for_status()
-            data = r.json()
-        except Exception:
-            try:
-                page.goto(api_url, timeout=30000, wait_until="networkidle")
-                raw = page.inner_text("pre") or page.content()
-                data = json.loads(raw)
-            except Exception as e:
-                print(f"[Teradata] API failed at offset {offset}: {e}")
-                break
-
-        postings = data.get("jobPostings", [])
-        if not postings:
-            break
-
-        for job in postings:
-            title = (job.get("title") or "").strip()
-            path  = job.get("externalPath") or job.get("externalUrl") or ""
-            if not title or not path:
-                continue
-
-            # Relevance pre-filter
-            if not RELEVANT.search(title):
-                continue
-
-            link = path if path.startswith("http") else urljoin(base_url, path)
-            if link in seen:
-                continue
-            seen.add(link)
-
-            loc          = (job.get("locationsText") or job.get("location") or "")
-            posting_date = (job.get("postedOn") or "").split("T")[0]
-
-            out.append((link, title, "", str(loc), posting_date))
-
-        total = data.get("total", 0)
-        offset += limit
-        if total and offset >= total:
-            break
+    postings = workday_relevant_postings(DOMAIN, TENANT, SITE, FAMILY_RELEVANT,
+                                         label="Teradata")
+    for job in postings:
+        title = (job.get("title") or "").strip()
+        path  = job.get("externalPath") or job.get("externalUrl") or ""
+        if not title or not path:
+            continue
+
+        # Relevance filter — job families are broader than the titles we want
+        if not RELEVANT.search(title):
+            continue
+
+        link = path if path.startswith("http") else urljoin(base_url, path)
+        if link in seen:
+            continue
+        seen.add(link)
+
+        loc          = (job.get("locationsText") or job.get("location") or "")
+        posting_date = (job.get("postedOn") or "").split("T")[0]
+
+        out.append((link, title, str(loc), posting_date, path))
+
+    details = workday_details(DOMAIN, TENANT, SITE, [p for *_, p in out], label="Teradata")
+    out = [(link, title, desc, loc, start or posted)
+           for (link, title, loc, posted, _), (desc, start) in zip(out, details)]
 
     # DOM fallback if API returned nothing
     if not out:
@@ -85,13 +69,15 @@ def _dom_fallback(soup, page, base_url):
     out = []
     seen = set()
     try:
-        page.goto(base_url, wait_until="networkidle", timeout=45000)
+        timed_goto(page, base_url, 45000, wait_until="networkidle")
         for _ in range(3):
             page.mouse.wheel(0, 1400)
             time.sleep(0.7)
         soup = BeautifulSoup(page.content(), "lxml")
     except Exception:
         pass
+    if soup is None:
+        return out
 
     for a in soup.select("a[href*='/job/'], a[href*='/jobs/']"):
         href = a.get("href", "")
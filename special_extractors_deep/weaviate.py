@@ -1,23 +1,52 @@
-# special_extractors_deep/weaviate.py — v1.0
+# special_extractors_deep/weaviate.py — v1.1
 # Weaviate uses Welcome to the Jungle (WTTJ)
+# WTTJ loads its job list from Algolia — captured off the wire first,
+# rendered cards parsed as the fallback
 
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+from scrape_health import timed_goto
+from ._xhr import JsonCapture, map_jobs
 
 WTTJ_BASE   = "https://www.welcometothejungle.com"
 WEAVIATE_URL = "https://www.welcometothejungle.com/en/companies/weaviate/jobs"
 
+XHR_SPEC = {
+    "url_pattern": r"algolia\.net/1/indexes/",
+    "jobs_path":   ["hits", "results.*.hits"],
+    "link": lambda j: (f"{WTTJ_BASE}/en/companies/"
+                       f"{(j.get('organization') or {}).get('slug', 'weaviate')}"
+                       f"/jobs/{j['slug']}" if j.get("slug") else ""),
+    "title":       "name",
+    "location": lambda j: ", ".join(
+        dict.fromkeys(o.get("city") or o.get("country") or ""
+                      for o in (j.get("offices") or []) if isinstance(o, dict))),
+    "date":        ["published_at", "created_at"],
+    "description": ["summary", "profile"],
+}
+
 def extract_weaviate(soup, page, main_url):
     out = []
     seen = set()
 
-    try:
-        page.goto(WEAVIATE_URL, timeout=45000, wait_until="networkidle")
-        page.wait_for_timeout(1500)
-        html = page.content()
-    except Exception as e:
-        print(f"[Weaviate] render error: {e}")
-        html = ""
+    html = ""
+    with JsonCapture(page, XHR_SPEC["url_pattern"]) as capture:
+        try:
+            timed_goto(page, WEAVIATE_URL, 45000, wait_until="networkidle")
+            page.wait_for_timeout(1500)
+        except Exception as e:
+            print(f"[Weaviate] render error: {e}")
+
+        captured = map_jobs(capture.payloads(), XHR_SPEC)
+        if not captured:
+            try:
+                html = page.content()
+            except Exception as e:
+                print(f"[Weaviate] render error: {e}")
+
+    if captured:
+        print(f"[Weaviate WTTJ] Extracted {len(captured)} jobs (JSON capture)")
+        return captured
 
     s = BeautifulSoup(html or "", "lxml") if html else soup
 
@@ -5,6 +5,7 @@
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
+from ._greenhouse import iter_board_jobs, greenhouse_posting
 
 def extract_zilliz(soup, page, main_url):
     out = []
@@ -72,44 +73,12 @@ def _lever(out):
 
 
 def _greenhouse():
-    API_URL = "https://boards-api.greenhouse.io/v1/boards/zilliz/jobs?content=true"
-    headers = {"User-Agent": "Mozilla/5.0"}
     results = []
-
     try:
-        r = requests.get(API_URL, headers=headers, timeout=20)
-        r.raise_for_status()
-        data = r.json()
+        for job in iter_board_jobs("zilliz"):
+            posting = greenhouse_posting(job)
+            if posting:
+                results.append(posting.as_tuple())
     except Exception as e:
         print(f"[Zilliz Greenhouse API error] {e}")
-        return results
-
-    for job in data.get("jobs", []):
-        title = (job.get("title") or "").strip()
-        link  = (job.get("absolute_url") or "").strip()
-        if not title or not link:
-            continue
-
-        loc = ""
-        loc_data = job.get("location")
-        if isinstance(loc_data, dict):
-            loc = loc_data.get("name", "")
-
-        posting_date = ""
-        for df in ("first_published_at", "updated_at"):
-            raw = job.get(df, "")
-            if raw:
-                posting_date = raw.split("T")[0]
-                break
-
-        desc_text = ""
-        desc_html = job.get("content", "")
-        if desc_html:
-            try:
-                desc_text = BeautifulSoup(desc_html, "lxml").get_text(" ", strip=True)[:4000]
-            except Exception:
-                pass
-
-        results.append((link, title, desc_text, loc, posting_date))
-
     return results
@@ -6,8 +6,9 @@
 #   4. Missing enrichment columns → HARD FAIL
 #   5. first_seen / last_seen column checks added
 #   6. Summary report printed before pass/fail
+#   7. Pure-python checks (no pandas) — validate_rows() accepts in-memory rows
 
-import pandas as pd
+import csv
 import re
 import sys
 import os
@@ -79,35 +80,63 @@ def pct(n, total):
     return round(n / total * 100, 1) if total else 0.0
 
 
+def check_company_rows(company, rows):
+    """
+    Cheap per-company checks run as each company finishes in pipelined mode.
+    Returns a list of warning strings; the full validator still runs at the end.
+    """
+    issues = []
+    total = len(rows)
+    cap = COMPANY_CAP_OVERRIDES.get(company, MAX_ROWS_PER_COMPANY)
+    if total > cap:
+        issues.append(f"{company}: {total} rows exceeds cap {cap}")
+
+    garbage = [r.get("Job Title", "") for r in rows
+               if GARBAGE_RE.search((r.get("Job Title") or "").lower())]
+    if pct(len(garbage), total) > MAX_GARBAGE_RATE_PCT:
+        issues.append(f"{company}: {len(garbage)}/{total} garbage titles "
+                      f"(e.g. {garbage[0]!r})")
+
+    missing_loc = sum(1 for r in rows if not r.get("Location"))
+    if total and pct(missing_loc, total) > MAX_MISSING_LOC_PCT:
+        issues.append(f"{company}: {pct(missing_loc, total)}% missing location")
+    return issues
+
+
 # ─────────────────────────────────────────────────────────────────────────────
-# MAIN
+# VALIDATION
 # ─────────────────────────────────────────────────────────────────────────────
-def main():
-    repo_root = os.path.dirname(os.path.abspath(__file__))
-    csv_path  = os.path.join(repo_root, "jobs_cleaned_final_enriched.csv")
-
+def _to_float(v):
     try:
-        df = pd.read_csv(csv_path, dtype=str).fillna("")
-    except Exception as e:
-        fail(f"Could not read output CSV: {e}")
+        return float(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def validate_rows(rows, columns=None):
+    """
+    Run every check on in-memory row dicts (CSV rows or run.py's enriched rows).
+    `columns` defaults to the keys of the first row. Exits 1 on a hard failure.
+    """
+    columns = list(columns) if columns is not None else list(rows[0].keys() if rows else [])
+    total   = len(rows)
+    counts  = Counter(r.get("Company", "") for r in rows)
 
-    total = len(df)
     print("=" * 52)
     print("         ENTERPRISE VALIDATOR v5.0")
     print("=" * 52)
     print(f"  Total rows : {total}")
-    print(f"  Companies  : {df['Company'].nunique() if 'Company' in df.columns else '?'}")
+    print(f"  Companies  : {len(counts) if 'Company' in columns else '?'}")
     print("=" * 52)
 
     errors   = []
-    warnings = []
 
     # ── 1. Required columns ──────────────────────────────────────────────────
     for col in REQUIRED_COLUMNS:
-        if col not in df.columns:
+        if col not in columns:
             errors.append(f"Missing required column: {col}")
     for col in ENRICHMENT_COLUMNS:
-        if col not in df.columns:
+        if col not in columns:
             errors.append(f"Missing enrichment column: {col}")
 
     if errors:
@@ -117,7 +146,7 @@ def main():
     ok("All required and enrichment columns present")
 
     # ── 2. Duplicate job links ────────────────────────────────────────────────
-    dupe_count = df["Job Link"].duplicated().sum()
+    dupe_count = total - len({r.get("Job Link", "") for r in rows})
     dupe_rate  = pct(dupe_count, total)
     print(f"  Duplicate links : {dupe_count} ({dupe_rate}%)")
     if dupe_rate > MAX_DUPLICATE_RATE_PCT:
@@ -129,24 +158,23 @@ def main():
         ok("No duplicate job links")
 
     # ── 3. Garbage titles ────────────────────────────────────────────────────
-    garbage_mask  = df["Job Title"].str.lower().str.contains(GARBAGE_RE, na=False)
-    garbage_count = garbage_mask.sum()
+    garbage       = [r for r in rows if GARBAGE_RE.search((r.get("Job Title") or "").lower())]
+    garbage_count = len(garbage)
     garbage_rate  = pct(garbage_count, total)
     print(f"  Garbage titles  : {garbage_count} ({garbage_rate}%)")
     if garbage_rate > MAX_GARBAGE_RATE_PCT:
         fail(f"Garbage title rate {garbage_rate}% exceeds threshold {MAX_GARBAGE_RATE_PCT}%.")
     elif garbage_count > 0:
         warn(f"{garbage_count} potential garbage titles")
-        print(df[garbage_mask][["Company","Job Title"]].head(5).to_string(index=False))
+        for r in garbage[:5]:
+            print(f"    {r.get('Company', '')} | {r.get('Job Title', '')}")
     else:
         ok("No garbage titles")
 
     # ── 4. Per-company row spike ──────────────────────────────────────────────
-    counts   = df["Company"].value_counts()
-    spikes   = counts[counts.index.map(
-        lambda co: counts[co] > COMPANY_CAP_OVERRIDES.get(co, MAX_ROWS_PER_COMPANY)
-    )]
-    if not spikes.empty:
+    spikes = {co: n for co, n in counts.items()
+              if n > COMPANY_CAP_OVERRIDES.get(co, MAX_ROWS_PER_COMPANY)}
+    if spikes:
         spike_lines = ", ".join(f"{co}={n}" for co, n in spikes.items())
         warn(f"Company row spike detected: {spike_lines}. "
              f"Investigate if unexpected — may be legitimate for large companies.")
@@ -154,7 +182,7 @@ def main():
         ok(f"No per-company spikes")
 
     # ── 5. Location coverage ─────────────────────────────────────────────────
-    missing_loc  = (df["Location"] == "").sum()
+    missing_loc  = sum(1 for r in rows if not r.get("Location"))
     missing_loc_pct = pct(missing_loc, total)
     print(f"  Missing location: {missing_loc} ({missing_loc_pct}%)")
     if missing_loc_pct > MAX_MISSING_LOC_PCT:
@@ -163,7 +191,7 @@ def main():
         ok("Location coverage acceptable")
 
     # ── 6. Posting date coverage ──────────────────────────────────────────────
-    missing_date     = (df["Posting Date"] == "").sum()
+    missing_date     = sum(1 for r in rows if not r.get("Posting Date"))
     missing_date_pct = pct(missing_date, total)
     print(f"  Missing date    : {missing_date} ({missing_date_pct}%)")
     if missing_date_pct > MAX_MISSING_DATE_PCT:
@@ -172,7 +200,7 @@ def main():
         ok("Posting date coverage acceptable")
 
     # ── 7. Seniority coverage ─────────────────────────────────────────────────
-    unknown_sen     = (df["Seniority"].str.lower() == "unknown").sum()
+    unknown_sen     = sum(1 for r in rows if (r.get("Seniority") or "").lower() == "unknown")
     unknown_sen_pct = pct(unknown_sen, total)
     print(f"  Unknown seniority: {unknown_sen} ({unknown_sen_pct}%)")
     if unknown_sen_pct > MAX_UNKNOWN_SENIORITY_PCT:
@@ -181,8 +209,8 @@ def main():
         ok("Seniority coverage acceptable")
 
     # ── 8. First_Seen / Last_Seen ─────────────────────────────────────────────
-    if "First_Seen" in df.columns and "Last_Seen" in df.columns:
-        missing_fs = (df["First_Seen"] == "").sum()
+    if "First_Seen" in columns and "Last_Seen" in columns:
+        missing_fs = sum(1 for r in rows if not r.get("First_Seen"))
         if missing_fs > 0:
             warn(f"{missing_fs} rows missing First_Seen date")
         else:
@@ -191,20 +219,17 @@ def main():
         warn("Lifecycle columns (First_Seen/Last_Seen) not found")
 
     # ── 9. Relevancy distribution ─────────────────────────────────────────────
-    if "Relevancy_to_Actian" in df.columns:
-        try:
-            rel = pd.to_numeric(df["Relevancy_to_Actian"], errors="coerce")
-            high_rel = (rel >= 8.5).sum()
-            print(f"  High-relevancy roles (≥8.5): {high_rel}")
-            ok("Relevancy scoring present")
-        except Exception:
-            warn("Could not parse Relevancy_to_Actian column")
+    if "Relevancy_to_Actian" in columns:
+        rel = [_to_float(r.get("Relevancy_to_Actian")) for r in rows]
+        high_rel = sum(1 for v in rel if v is not None and v >= 8.5)
+        print(f"  High-relevancy roles (≥8.5): {high_rel}")
+        ok("Relevancy scoring present")
 
     # ── 10. ATS spam check ────────────────────────────────────────────────────
     spam_count = 0
-    for _, row in df.iterrows():
-        link  = (row["Job Link"] or "").lower()
-        title = row["Job Title"] or ""
+    for row in rows:
+        link  = (row.get("Job Link") or "").lower()
+        title = row.get("Job Title") or ""
         if any(w in link for w in ATS_SPAM_WORDS):
             if not re.search(r'(engineer|manager|analyst|data|product|sales)', title, re.I):
                 spam_count += 1
@@ -215,7 +240,7 @@ def main():
 
     # ── Company distribution summary ──────────────────────────────────────────
     print("\n  Top 10 companies by job count:")
-    for co, n in counts.head(10).items():
+    for co, n in counts.most_common(10):
         flag = " ⚠️ " if n > MAX_ROWS_PER_COMPANY * 0.8 else ""
         print(f"    {co:<30} {n:>4}{flag}")
 
@@ -225,5 +250,23 @@ def main():
     print("=" * 52)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# MAIN
+# ─────────────────────────────────────────────────────────────────────────────
+def main():
+    repo_root = os.path.dirname(os.path.abspath(__file__))
+    csv_path  = os.path.join(repo_root, "jobs_cleaned_final_enriched.csv")
+
+    try:
+        with open(csv_path, encoding="utf-8") as f:
+            reader  = csv.DictReader(f)
+            rows    = [{k: v or "" for k, v in r.items()} for r in reader]
+            columns = reader.fieldnames or []
+    except Exception as e:
+        fail(f"Could not read output CSV: {e}")
+
+    validate_rows(rows, columns)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,369 @@
+# work_queue.py — v1.0
+# SQLite-backed work queue for multi-worker scraping (no external broker).
+#
+# Two task kinds:
+#   company : payload {"company"}                  -> result {"rows": [...]}
+#   detail  : payload {"link", "location", "posting_date"}
+#                                                  -> result {"location", "posting_date", "description"}
+#
+# Workers lease a task for LEASE_SECS and heartbeat from a side thread while
+# they work. A lease that expires (worker died, Chromium crashed) is put back
+# to pending on the next lease() call, until the task has used MAX_ATTEMPTS.
+# Company workers run with deferred detail fetches, so special-extractor rows
+# that need a detail page become detail tasks any worker can pick up.
+# `seed` starts a new run: the previous run's tasks (and results) are
+# dropped first, so tasks finished yesterday are never collected again.
+#
+# Usage:
+#   python work_queue.py seed [--companies "A,B"]
+#   python work_queue.py worker [--id NAME] [--kinds company,detail]
+#   python work_queue.py status
+#   python work_queue.py collect [--force]     # -> jobs_final_hard.csv
+
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+from scrape_health import STATE_DIR
+
+QUEUE_FILE   = os.path.join(STATE_DIR, "work_queue.sqlite3")
+LEASE_SECS   = 300
+MAX_ATTEMPTS = 3
+IDLE_POLL_SECS = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id            INTEGER PRIMARY KEY,
+    kind          TEXT    NOT NULL,
+    key           TEXT    NOT NULL,
+    payload       TEXT    NOT NULL,
+    status        TEXT    NOT NULL DEFAULT 'pending',   -- pending|leased|done|failed
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    max_attempts  INTEGER NOT NULL DEFAULT 3,
+    lease_owner   TEXT,
+    lease_expires REAL,
+    result        TEXT,
+    error         TEXT,
+    updated       REAL    NOT NULL,
+    UNIQUE (kind, key)
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, kind, id);
+"""
+
+
+class Task:
+    __slots__ = ("id", "kind", "key", "payload", "attempts")
+
+    def __init__(self, id, kind, key, payload, attempts):
+        self.id       = id
+        self.kind     = kind
+        self.key      = key
+        self.payload  = json.loads(payload)
+        self.attempts = attempts
+
+    def __repr__(self):
+        return f"Task({self.id}, {self.kind!r}, {self.key!r}, attempt {self.attempts})"
+
+
+class WorkQueue:
+    """One connection per instance; open one per thread."""
+
+    def __init__(self, path=QUEUE_FILE):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    # ── producers ────────────────────────────────────────────────────────────
+    def enqueue(self, kind, key, payload, max_attempts=MAX_ATTEMPTS):
+        """Add a task unless (kind, key) already exists. Returns True if added."""
+        cur = self.conn.execute(
+            "INSERT OR IGNORE INTO tasks (kind, key, payload, max_attempts, updated) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (kind, key, json.dumps(payload), max_attempts, time.time()))
+        return cur.rowcount == 1
+
+    def reset(self):
+        """Drop every task. Returns how many were still pending or leased."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            unfinished = self.conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE status IN ('pending', 'leased')").fetchone()[0]
+            self.conn.execute("DELETE FROM tasks")
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return unfinished
+
+    # ── workers ──────────────────────────────────────────────────────────────
+    def requeue_expired(self, now=None):
+        """Expired leases go back to pending, or to failed once out of attempts."""
+        now = now or time.time()
+        self.conn.execute(
+            "UPDATE tasks SET status = CASE WHEN attempts >= max_attempts "
+            "THEN 'failed' ELSE 'pending' END, "
+            "error = 'lease expired (owner ' || COALESCE(lease_owner, '?') || ')', "
+            "lease_owner = NULL, lease_expires = NULL, updated = ? "
+            "WHERE status = 'leased' AND lease_expires < ?", (now, now))
+
+    def lease(self, worker, kinds=None, lease_secs=LEASE_SECS):
+        """Atomically claim the oldest pending task (optionally of given kinds)."""
+        now = time.time()
+        kinds = list(kinds or ("company", "detail"))
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.requeue_expired(now)
+            row = self.conn.execute(
+                f"SELECT id, kind, key, payload, attempts FROM tasks "
+                f"WHERE status = 'pending' AND kind IN ({','.join('?' * len(kinds))}) "
+                f"ORDER BY id LIMIT 1", kinds).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            self.conn.execute(
+                "UPDATE tasks SET status = 'leased', attempts = attempts + 1, "
+                "lease_owner = ?, lease_expires = ?, updated = ? WHERE id = ?",
+                (worker, now + lease_secs, now, row[0]))
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return Task(row[0], row[1], row[2], row[3], row[4] + 1)
+
+    def heartbeat(self, task_id, worker, lease_secs=LEASE_SECS):
+        """Extend a lease we still own. False means the lease was lost."""
+        cur = self.conn.execute(
+            "UPDATE tasks SET lease_expires = ?, updated = ? "
+            "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+            (time.time() + lease_secs, time.time(), task_id, worker))
+        return cur.rowcount == 1
+
+    def complete(self, task_id, worker, result):
+        cur = self.conn.execute(
+            "UPDATE tasks SET status = 'done', result = ?, error = NULL, "
+            "lease_owner = NULL, lease_expires = NULL, updated = ? "
+            "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+            (json.dumps(result), time.time(), task_id, worker))
+        return cur.rowcount == 1
+
+    def fail(self, task_id, worker, error):
+        cur = self.conn.execute(
+            "UPDATE tasks SET status = CASE WHEN attempts >= max_attempts "
+            "THEN 'failed' ELSE 'pending' END, error = ?, "
+            "lease_owner = NULL, lease_expires = NULL, updated = ? "
+            "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+            (str(error)[:2000], time.time(), task_id, worker))
+        return cur.rowcount == 1
+
+    # ── reporting ────────────────────────────────────────────────────────────
+    def counts(self):
+        """{(kind, status): n}"""
+        return {(k, s): n for k, s, n in self.conn.execute(
+            "SELECT kind, status, COUNT(*) FROM tasks GROUP BY kind, status")}
+
+    def outstanding(self):
+        self.requeue_expired()
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM tasks WHERE status IN ('pending', 'leased')").fetchone()[0]
+
+    def results(self, kind):
+        """(key, result) for finished tasks of a kind, in enqueue order."""
+        for key, result in self.conn.execute(
+                "SELECT key, result FROM tasks WHERE kind = ? AND status = 'done' ORDER BY id",
+                (kind,)):
+            yield key, json.loads(result)
+
+    def failures(self):
+        return self.conn.execute(
+            "SELECT kind, key, attempts, error FROM tasks WHERE status = 'failed' "
+            "ORDER BY id").fetchall()
+
+
+class _Heartbeat(threading.Thread):
+    """Keeps a lease alive while the worker's main thread is busy scraping."""
+
+    def __init__(self, path, task_id, worker, lease_secs=LEASE_SECS):
+        super().__init__(daemon=True)
+        self.path, self.task_id, self.worker = path, task_id, worker
+        self.lease_secs = lease_secs
+        self.stopped = threading.Event()
+        self.lost = False
+
+    def run(self):
+        queue = WorkQueue(self.path)
+        try:
+            while not self.stopped.wait(self.lease_secs / 3):
+                if not queue.heartbeat(self.task_id, self.worker, self.lease_secs):
+                    self.lost = True
+                    print(f"[QUEUE] lease lost for task {self.task_id}")
+                    return
+        finally:
+            queue.close()
+
+    def stop(self):
+        self.stopped.set()
+        self.join(timeout=5)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TASK HANDLERS
+# ─────────────────────────────────────────────────────────────────────────────
+def _run_company(task, page, budget, queue):
+    import jobs_smart_cplus as scraper
+    company = task.payload["company"]
+    scraper.INCOMPLETE_COMPANIES.pop(company, None)
+    rows = list(scraper.iter_company(page, company, scraper.COMPANIES[company], budget))
+    for r in rows:
+        if r.pop("_needs_detail", False):
+            queue.enqueue("detail", scraper.normalise_url(r["Job Link"]), {
+                "link":         r["Job Link"],
+                "location":     r.get("Location", ""),
+                "posting_date": r.get("Posting Date", ""),
+            })
+    return {"rows": rows, "incomplete": scraper.INCOMPLETE_COMPANIES.pop(company, "")}
+
+
+def _run_detail(task, page, budget, queue):
+    import jobs_smart_cplus as scraper
+    p = task.payload
+    location, posting_date, description, budget["detail_count"] = scraper.enrich_detail(
+        page, p["link"], budget["detail_count"], p.get("location", ""), p.get("posting_date", ""))
+    return {"location": location, "posting_date": posting_date, "description": description}
+
+
+def run_worker(worker=None, kinds=None, path=QUEUE_FILE, idle_exit=True):
+    """Lease and run tasks until the queue is drained (or forever if not idle_exit)."""
+    import jobs_smart_cplus as scraper
+
+    worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+    queue  = WorkQueue(path)
+    budget = {"detail_count": 0, "defer_details": True}
+    done   = 0
+
+    with scraper.lazy_page() as page:
+        while True:
+            task = queue.lease(worker, kinds)
+            if task is None:
+                if idle_exit and not queue.outstanding():
+                    break
+                time.sleep(IDLE_POLL_SECS)
+                continue
+
+            print(f"[QUEUE] {worker} leased {task}")
+            beat = _Heartbeat(path, task.id, worker)
+            beat.start()
+            try:
+                handler = _run_company if task.kind == "company" else _run_detail
+                result = handler(task, page, budget, queue)
+            except Exception as e:
+                beat.stop()
+                print(f"[QUEUE ERROR] {task} -> {e}")
+                queue.fail(task.id, worker, e)
+                continue
+            beat.stop()
+
+            if queue.complete(task.id, worker, result):
+                done += 1
+            else:
+                print(f"[QUEUE] {task} finished after its lease was lost — result discarded")
+
+    scraper.FETCH_GUARD.save()
+    scraper.LATENCY.save()
+    scraper.COMPANY_COSTS.save()
+    queue.close()
+    print(f"[QUEUE] {worker} exiting after {done} tasks")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# SEED / COLLECT
+# ─────────────────────────────────────────────────────────────────────────────
+def seed(companies=None, path=QUEUE_FILE):
+    """Start a new run: drop the previous run's tasks, enqueue one per company."""
+    import jobs_smart_cplus as scraper
+    queue = WorkQueue(path)
+    unfinished = queue.reset()
+    if unfinished:
+        print(f"[QUEUE] previous run left {unfinished} unfinished tasks — discarded")
+    added = sum(queue.enqueue("company", c, {"company": c})
+                for c in scraper.select_companies(companies))
+    print(f"[QUEUE] seeded {added} company tasks -> {path}")
+    queue.close()
+
+
+def collect(outfile=None, force=False, path=QUEUE_FILE):
+    """Apply detail results to company rows and write jobs_final_hard.csv."""
+    import jobs_smart_cplus as scraper
+    queue = WorkQueue(path)
+    pending = queue.outstanding()
+    if pending and not force:
+        print(f"[QUEUE] {pending} tasks still outstanding — run more workers or use --force")
+        queue.close()
+        return None
+
+    details = dict(queue.results("detail"))
+    rows, incomplete = [], {}
+    for company, result in queue.results("company"):
+        if result.get("incomplete"):
+            incomplete[company] = result["incomplete"]
+        for r in result["rows"]:
+            d = details.get(scraper.normalise_url(r.get("Job Link", "")))
+            if d:
+                r["Location"]     = r.get("Location") or d["location"]
+                r["Posting Date"] = r.get("Posting Date") or d["posting_date"]
+                r["Description"]  = r.get("Description") or d["description"]
+            rows.append(scraper.prepare_row(r))
+
+    for kind, key, attempts, error in queue.failures():
+        print(f"[QUEUE FAILED] {kind} {key} after {attempts} attempts -> {error}")
+    queue.close()
+
+    outfile = outfile or scraper.default_outfile()
+    out = scraper.finalise_and_persist(rows, incomplete)
+    scraper.write_hard_csv(out, outfile)
+    return out
+
+
+def status(path=QUEUE_FILE):
+    queue = WorkQueue(path)
+    queue.requeue_expired()
+    for (kind, state), n in sorted(queue.counts().items()):
+        print(f"  {kind:<8} {state:<8} {n:>5}")
+    queue.close()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="SQLite work queue for scrape workers.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    p_seed = sub.add_parser("seed", help="start a new run: one task per company")
+    p_seed.add_argument("--companies", default="")
+
+    p_work = sub.add_parser("worker", help="lease and run tasks until drained")
+    p_work.add_argument("--id", default=None)
+    p_work.add_argument("--kinds", default="company,detail")
+    p_work.add_argument("--forever", action="store_true", help="keep polling when idle")
+
+    sub.add_parser("status", help="task counts by kind and status")
+
+    p_col = sub.add_parser("collect", help="write jobs_final_hard.csv from finished tasks")
+    p_col.add_argument("--force", action="store_true", help="collect even if tasks are outstanding")
+
+    args = ap.parse_args()
+    if args.cmd == "seed":
+        seed([c for c in args.companies.split(",") if c.strip()])
+    elif args.cmd == "worker":
+        run_worker(args.id, [k for k in args.kinds.split(",") if k], idle_exit=not args.forever)
+    elif args.cmd == "status":
+        status()
+    elif args.cmd == "collect":
+        collect(force=args.force)